@@ -0,0 +1,68 @@
+"""Measure hard-AI throughput of get_best_moves against a get_best_move loop.
+
+Run from the repository root:
+
+    python benchmarks/bench_batch.py [games] [workers]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tictactoe.ai import AIPlayer  # noqa: E402
+from tictactoe.board import Board  # noqa: E402
+
+
+def random_positions(count, seed=0):
+    """Positions with O to move, as reached by random play from the start."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board()
+        for _ in range(rng.choice([1, 3, 5, 7])):
+            board.make_move(*rng.choice(board.get_empty_positions()))
+            if board.is_game_over():
+                break
+        if not board.is_game_over() and board.current_player == "O":
+            positions.append(board)
+    return positions
+
+
+def _throughput(label, count, run):
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{count / elapsed:>14,.0f} moves/s")
+
+
+def main():
+    """Print moves per second for each way of serving a batch of games."""
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    boards = random_positions(games)
+    print(f"{games} games, {len(set(str(b.grid) for b in boards))} distinct")
+
+    _throughput(
+        "loop, fresh player per game",
+        games,
+        lambda: [AIPlayer("hard").get_best_move(board) for board in boards],
+    )
+    ai = AIPlayer("hard")
+    _throughput(
+        "loop, shared player", games, lambda: [ai.get_best_move(b) for b in boards]
+    )
+    _throughput(
+        "get_best_moves", games, lambda: AIPlayer("hard").get_best_moves(boards)
+    )
+    _throughput(
+        f"get_best_moves, {workers} workers",
+        games,
+        lambda: AIPlayer("hard").get_best_moves(boards, workers=workers),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare Board and BitBoard on the hot paths used by the hard AI.
+
+Run from the repository root:
+
+    python benchmarks/bench_bitboard.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tictactoe.ai import AIPlayer  # noqa: E402
+from tictactoe.bitboard import BitBoard  # noqa: E402
+from tictactoe.board import Board  # noqa: E402
+
+OPENING = [(0, 0, "X"), (1, 1, "O")]
+
+
+def _setup(board_class):
+    board = board_class()
+    for row, col, player in OPENING:
+        board.make_move(row, col, player)
+    return board
+
+
+def _best_of(statement, number, repeat=5):
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def main():
+    """Print per-call timings and the speedup of BitBoard over Board."""
+    results = {}
+    for board_class in (Board, BitBoard):
+        board = _setup(board_class)
+        ai = AIPlayer("hard", tt_size=0)
+        results[board_class.__name__] = {
+            "check_winner": _best_of(board.check_winner, 100_000),
+            "copy": _best_of(board.copy, 100_000),
+            "get_empty_positions": _best_of(board.get_empty_positions, 100_000),
+            "canonical_key": _best_of(lambda: board.canonical_key("X"), 10_000),
+            # A fresh player per move, so the table starts cold each time.
+            "hard_move": _best_of(
+                lambda: AIPlayer("hard").get_best_move(board), 1, repeat=3
+            ),
+            "hard_move_no_table": _best_of(
+                lambda: ai.get_best_move(board), 1, repeat=3
+            ),
+        }
+
+    print(f"{'operation':<22}{'Board':>14}{'BitBoard':>14}{'speedup':>10}")
+    for operation, baseline in results["Board"].items():
+        candidate = results["BitBoard"][operation]
+        print(
+            f"{operation:<22}{baseline * 1e6:>12.2f}us{candidate * 1e6:>12.2f}us"
+            f"{baseline / candidate:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
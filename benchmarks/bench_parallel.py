@@ -0,0 +1,86 @@
+"""Measure the speedup of the 'parallel' root-split search over alpha-beta.
+
+Solves a few 4x4 positions with the serial alpha-beta search and with the
+parallel search at 1, 2, 4, ... workers up to the number of CPUs, and
+prints the time, nodes and speedup of each. Every position gets fresh
+players; worker pools are started before timing, so process start-up is
+not counted.
+
+Run from the repository root:
+
+    python benchmarks/bench_parallel.py [max_workers]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tictactoe.ai import AIPlayer  # noqa: E402
+from tictactoe.board import Board  # noqa: E402
+
+# Openings on a 4x4, four-in-a-row board, each solved to the end.
+OPENINGS = (
+    [(1, 1), (2, 2), (0, 0), (3, 3)],
+    [(0, 1), (1, 2), (2, 1), (3, 0)],
+    [(1, 2), (2, 1), (0, 3), (3, 0), (0, 0)],
+)
+
+
+def positions():
+    """The benchmark boards."""
+    boards = []
+    for moves in OPENINGS:
+        board = Board(4, 4)
+        for move in moves:
+            board.make_move(*move)
+        boards.append(board)
+    return boards
+
+
+def _timed_move(ai, board):
+    """Search one board; return (seconds, nodes)."""
+    ai.set_symbols(board.current_player, "O" if board.current_player == "X" else "X")
+    start = time.perf_counter()
+    ai.get_best_move(board)
+    return time.perf_counter() - start, ai.nodes_searched
+
+
+def _run(make_player, boards):
+    """Total (seconds, nodes) over the boards, with fresh players and tables."""
+    elapsed = nodes = 0
+    for board in boards:
+        ai = make_player()
+        # Starts a parallel player's pool before timing; tiny and unrelated,
+        # so it leaves nothing useful in the tables.
+        ai.get_best_move(Board(2, 2))
+        seconds, board_nodes = _timed_move(ai, board)
+        ai.close()
+        elapsed += seconds
+        nodes += board_nodes
+    return elapsed, nodes
+
+
+def main():
+    """Print time, nodes and speedup for each worker count."""
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    boards = positions()
+    serial_time, serial_nodes = _run(
+        lambda: AIPlayer("hard", search="alphabeta"), boards
+    )
+    print(f"{'search':<22}{'time':>10}{'nodes':>12}{'speedup':>9}")
+    print(f"{'alphabeta':<22}{serial_time:>9.2f}s{serial_nodes:>12,}{1:>8.2f}x")
+
+    workers = 1
+    while workers <= max_workers:
+        elapsed, nodes = _run(
+            lambda: AIPlayer("hard", search="parallel", search_workers=workers), boards
+        )
+        label = f"parallel, {workers} worker{'s' if workers > 1 else ''}"
+        print(f"{label:<22}{elapsed:>9.2f}s{nodes:>12,}{serial_time / elapsed:>8.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compare the hard-mode search algorithms by nodes visited and time.
+
+Run from the repository root:
+
+    python benchmarks/bench_search.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tictactoe.ai import SEARCH_MODES, AIPlayer  # noqa: E402
+from tictactoe.board import Board  # noqa: E402
+
+POSITIONS = {
+    "empty": [],
+    "corner": [(0, 0, "X")],
+    "midgame": [(0, 0, "X"), (1, 1, "O"), (2, 2, "X")],
+}
+
+
+def main():
+    """Print nodes searched and time for each search mode and position."""
+    print(f"{'position':<10}{'search':<11}{'tt':<5}{'nodes':>10}{'time':>12}")
+    for name, moves in POSITIONS.items():
+        board = Board()
+        for row, col, player in moves:
+            board.make_move(row, col, player)
+        for tt_size in (0, 100_000):
+            for search in SEARCH_MODES:
+                ai = AIPlayer("hard", tt_size=tt_size, search=search)
+                start = time.perf_counter()
+                ai.get_best_move(board)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{name:<10}{search:<11}{'on' if tt_size else 'off':<5}"
+                    f"{ai.nodes_searched:>10}{elapsed * 1e3:>10.2f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
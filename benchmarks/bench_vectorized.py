@@ -0,0 +1,78 @@
+"""Compare vectorized batch checks with a per-board check_winner/is_full loop.
+
+Needs NumPy. Run from the repository root:
+
+    python benchmarks/bench_vectorized.py [boards]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tictactoe.board import Board, winning_lines  # noqa: E402
+from tictactoe.vectorized import BoardBatch  # noqa: E402
+
+
+def random_boards(count, seed=0):
+    """Boards from random games stopped after a random number of moves."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = Board()
+        for _ in range(rng.randrange(10)):
+            if board.is_game_over():
+                break
+            board.make_move(*rng.choice(board.get_empty_positions()))
+        boards.append(board)
+    return boards
+
+
+def scan_winner(cells, lines):
+    """Winner of a flat list of cells, scanning every line."""
+    for line in lines:
+        first = cells[line[0]]
+        if first is not None and all(cells[i] == first for i in line):
+            return first
+    return None
+
+
+def main():
+    """Print boards per second for both approaches."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    boards = random_boards(count)
+    batch = BoardBatch.from_boards(boards)
+
+    start = time.perf_counter()
+    for board in boards:
+        board.check_winner()
+        board.is_full()
+    loop = time.perf_counter() - start
+
+    # Logged positions arrive as raw cells, without the winner that Board
+    # tracks while moves are played, so each one has to be scanned.
+    lines = winning_lines(3, 3)
+    grids = [[cell for row in board.grid for cell in row] for board in boards]
+    start = time.perf_counter()
+    for cells in grids:
+        winner = scan_winner(cells, lines)
+        full = None not in cells
+    scan = time.perf_counter() - start
+    del winner, full
+
+    start = time.perf_counter()
+    batch.winners()
+    batch.full_mask()
+    vectorized = time.perf_counter() - start
+
+    print(f"{count} boards")
+    print(f"{'Board methods':<16}{count / loop:>16,.0f} boards/s")
+    print(f"{'grid scan':<16}{count / scan:>16,.0f} boards/s")
+    print(f"{'BoardBatch':<16}{count / vectorized:>16,.0f} boards/s")
+    print(f"speedup over grid scan {scan / vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Benchmark suite for the Board and AIPlayer hot paths.
+
+Times ``check_winner``, ``copy``, ``get_empty_positions`` and ``_minimax``
+at several board sizes, and complete games at each difficulty, then writes
+the per-call times as JSON. Given a baseline file, every benchmark is
+compared against it and the run fails when one is slower than the baseline
+by more than the threshold. Both runs also time a fixed pure-Python loop,
+and comparisons are scaled by it so that a baseline recorded on a faster or
+slower machine stays usable.
+
+Run from the repository root:
+
+    # Measure and compare against the stored baseline
+    python benchmarks/run_benchmarks.py
+
+    # Refresh the stored baseline after an intended change
+    python benchmarks/run_benchmarks.py --save-baseline
+
+    # Only the benchmarks whose name contains "minimax"
+    python benchmarks/run_benchmarks.py --filter minimax
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from tictactoe.ai import AIPlayer  # noqa: E402
+from tictactoe.board import Board  # noqa: E402
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(HERE, "results.json")
+# Best-of timings of the same tree still differ by up to about 30% between
+# runs on a loaded machine, so only larger slowdowns fail the run.
+DEFAULT_THRESHOLD = 0.4
+DEFAULT_REPEAT = 5
+DEFAULT_ROUNDS = 5
+
+# (size, win_length) of the boards the micro-benchmarks run on.
+BOARD_SIZES = ((3, 3), (4, 3), (5, 4), (7, 5))
+
+
+class Benchmark(NamedTuple):
+    """A named callable; ``setup`` builds it so setup cost is not timed."""
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+
+
+def _midgame(size: int, win_length: int) -> Board:
+    """A board with a third of its cells filled and no winner."""
+    board = Board(size, win_length)
+    # Stride through the cells so stones are spread out rather than lined up.
+    for i in range(size * size // 3):
+        row, col = divmod((i * 7) % (size * size), size)
+        board.push(row, col, board.current_player)
+        if board.check_winner() is not None:
+            board.pop()
+            continue
+        board.switch_player()
+    return board
+
+
+def _minimax_setup(tt_size: int) -> Callable[[], object]:
+    """Search a fixed 3x3 opening with ``_minimax`` directly."""
+    board = Board()
+    board.make_move(0, 0)
+    board.make_move(1, 1)
+    ai = AIPlayer("hard", tt_size=tt_size)
+
+    def run():
+        if ai.transposition_table is not None:
+            ai.transposition_table.clear()
+        return ai._minimax(board, 0, True)
+
+    return run
+
+
+def _game_setup(
+    difficulty: str, size: int = 3, win_length: Optional[int] = None, **options
+) -> Callable[[], object]:
+    """Play a whole game between two fresh, seeded players."""
+
+    def run():
+        player_x = AIPlayer(difficulty, seed=1, **options)
+        player_o = AIPlayer(difficulty, seed=2, **options)
+        player_x.set_symbols("X", "O")
+        player_o.set_symbols("O", "X")
+        board = Board(size, win_length)
+        while not board.is_game_over():
+            player = player_x if board.current_player == "X" else player_o
+            board.make_move(*player.get_best_move(board))
+        return board.check_winner()
+
+    return run
+
+
+def _board_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for size, win_length in BOARD_SIZES:
+        suffix = f"{size}x{size}k{win_length}"
+        for method in ("check_winner", "copy", "get_empty_positions"):
+            benchmarks.append(
+                Benchmark(
+                    f"board.{method}[{suffix}]",
+                    lambda s=size, k=win_length, m=method: getattr(_midgame(s, k), m),
+                )
+            )
+    return benchmarks
+
+
+BENCHMARKS: List[Benchmark] = _board_benchmarks() + [
+    Benchmark("ai._minimax[3x3,tt=off]", lambda: _minimax_setup(0)),
+    Benchmark("ai._minimax[3x3,tt=on]", lambda: _minimax_setup(100_000)),
+    Benchmark("game[easy,3x3]", lambda: _game_setup("easy")),
+    Benchmark("game[medium,3x3]", lambda: _game_setup("medium")),
+    Benchmark("game[hard,3x3]", lambda: _game_setup("hard")),
+    Benchmark(
+        "game[hard-alphabeta,3x3]", lambda: _game_setup("hard", search="alphabeta")
+    ),
+    Benchmark(
+        "game[hard-iterative,4x4k3]",
+        lambda: _game_setup("hard", 4, 3, search="iterative", node_limit=5_000),
+    ),
+    Benchmark("game[medium,7x7k5]", lambda: _game_setup("medium", 7, 5)),
+]
+
+
+def measure(func: Callable[[], object], min_time: float, repeat: int) -> float:
+    """
+    Time one call of ``func``.
+
+    The number of calls per sample is grown until a sample takes at least
+    ``min_time`` seconds; the fastest of ``repeat`` samples is reported, as
+    slower ones mostly measure interference from other processes.
+
+    Returns:
+        Seconds per call
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    samples = [elapsed] + timer.repeat(repeat=repeat - 1, number=number)
+    return min(samples) / number
+
+
+def _calibration():
+    """Fixed pure-Python workload used to scale for machine speed."""
+    total = 0
+    for i in range(1000):
+        total += i * i % 7
+    return total
+
+
+def run(
+    name_filter: str = "",
+    min_time: float = 0.05,
+    repeat: int = DEFAULT_REPEAT,
+    rounds: int = DEFAULT_ROUNDS,
+) -> Dict:
+    """
+    Run every benchmark whose name contains ``name_filter``.
+
+    The suite is run ``rounds`` times over and each benchmark keeps its best
+    time, so a burst of load on the machine skews at most one round.
+
+    Returns:
+        JSON-serialisable results with per-call seconds under "results"
+    """
+    selected = {"calibration": _calibration}
+    for benchmark in BENCHMARKS:
+        if name_filter in benchmark.name:
+            selected[benchmark.name] = benchmark.setup()
+    best: Dict[str, float] = {}
+    for _ in range(rounds):
+        for name, func in selected.items():
+            seconds = measure(func, min_time, repeat)
+            best[name] = min(seconds, best.get(name, seconds))
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "calibration": best.pop("calibration"),
+        "results": best,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        current: Output of :func:`run`
+        baseline: Earlier output of :func:`run`
+        threshold: Allowed slowdown as a fraction (0.4 allows 40% slower)
+
+    Returns:
+        One line per benchmark that regressed past ``threshold``
+    """
+    regressions = []
+    for name, change in _changes(current, baseline).items():
+        if change > threshold:
+            regressions.append(
+                f"{name}: {_format_time(current['results'][name])} vs baseline "
+                f"{_format_time(baseline['results'][name])} ({change:+.0%})"
+            )
+    return regressions
+
+
+def _changes(current: Dict, baseline: Dict) -> Dict[str, float]:
+    """Relative slowdown of each benchmark in both runs, scaled for speed."""
+    scale = 1.0
+    if current.get("calibration") and baseline.get("calibration"):
+        scale = baseline["calibration"] / current["calibration"]
+    return {
+        name: seconds * scale / baseline["results"][name] - 1
+        for name, seconds in current["results"].items()
+        if baseline["results"].get(name)
+    }
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f}{unit}"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def _print_table(current: Dict, baseline: Optional[Dict]):
+    changes = _changes(current, baseline) if baseline else {}
+    print(f"{'benchmark':<36}{'time':>12}{'baseline':>12}{'change':>9}")
+    for name, seconds in current["results"].items():
+        if name in changes:
+            change = f"{changes[name]:+.0%}"
+            reference_text = _format_time(baseline["results"][name])
+        else:
+            change = reference_text = "-"
+        print(f"{name:<36}{_format_time(seconds):>12}{reference_text:>12}{change:>9}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite; return 1 if any benchmark regressed, else 0."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON results file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown before failing (default: %(default)s = 40%%)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write the results to the baseline file instead of comparing",
+    )
+    parser.add_argument("--filter", default="", help="Only run matching benchmarks")
+    parser.add_argument(
+        "--min-time", type=float, default=0.05, help="Seconds per timing sample"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="Samples per round"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=DEFAULT_ROUNDS, help="Passes over the suite"
+    )
+    args = parser.parse_args(argv)
+
+    current = run(args.filter, args.min_time, args.repeat, args.rounds)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(current, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        _print_table(current, None)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print_table(current, baseline)
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline")
+        return 0
+
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) past {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\nNo regressions past {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,10 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
 from .ai import AIPlayer
+from .bitboard import BitBoard
 from .board import Board
+from .mcts import MCTSPlayer
+from .position import Position
+from .stats import SearchStats
 
-__all__ = ["Board", "AIPlayer"]
+__all__ = ["Board", "BitBoard", "Position", "AIPlayer", "MCTSPlayer", "SearchStats"]
@@ -1,46 +1,638 @@
 """Simple AI player for Tic-Tac-Toe using minimax algorithm."""
 
+import asyncio
+import multiprocessing
+import os
+import pickle
 import random
-from typing import Optional, Tuple
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as ResultTimeout
+from concurrent.futures import wait
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
-from .board import Board
+from . import solutions
+from .board import Board, winning_lines
+from .cache import PositionCache
+from .stats import SearchStats
+from .transposition import (
+    DEFAULT_MAX_SIZE,
+    DIMENSION_BITS,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    SharedTranspositionTable,
+    TranspositionTable,
+    variant_key,
+)
+
+SEARCH_MODES = ("minimax", "alphabeta", "iterative", "parallel")
+
+# How often (in seconds) a budgeted search looks at the clock and its stop
+# event. The number of nodes between looks adapts to the cost of a node, up
+# to CLOCK_CHECK_INTERVAL nodes, so that large boards do not overrun.
+CLOCK_CHECK_SECONDS = 0.001
+CLOCK_CHECK_INTERVAL = 256
+
+# How often (in seconds) a 'parallel' search passes a stop request on to its
+# worker processes.
+STOP_POLL_INTERVAL = 0.01
+
+# Up to this board size, transposition keys merge the 8 rotations and
+# reflections of a position, which saves more nodes than the key costs.
+# Larger boards use the board's incremental Zobrist hash instead.
+SYMMETRY_MAX_SIZE = 4
+
+
+@lru_cache(maxsize=None)
+def move_priorities(
+    size: int, win_length: int
+) -> Dict[Tuple[int, int], Tuple[int, int]]:
+    """
+    Static move-ordering key for every cell of a board.
+
+    Cells that lie on more potential winning lines come first, ties broken by
+    distance from the center; on 3x3 this is center, then corners, then edges.
+
+    Args:
+        size: Board size
+        win_length: Stones in a row needed to win
+
+    Returns:
+        Mapping of (row, col) to a sort key, smallest first
+    """
+    line_counts = [0] * (size * size)
+    for line in winning_lines(size, win_length):
+        for cell in line:
+            line_counts[cell] += 1
+    return {
+        (row, col): (
+            -line_counts[row * size + col],
+            abs(2 * row - size + 1) + abs(2 * col - size + 1),
+        )
+        for row in range(size)
+        for col in range(size)
+    }
+
+
+@dataclass
+class GameContext:
+    """
+    Search state an :class:`AIPlayer` carries from one move of a game to the
+    next.
+
+    The searched subtree itself carries over in the transposition table.
+
+    Attributes:
+        game_id: ``Board.game_id`` of the game
+        player: Symbol the player searched for
+        stones: Stones on the board at the last search
+        killers: Killer moves by depth below the root of the last search
+        history: History heuristic scores of moves
+        pv: Expected move by :func:`position_key` along the last principal
+            variation
+    """
+
+    game_id: int
+    player: str
+    stones: int
+    killers: Dict[int, List[Tuple[int, int]]] = field(default_factory=dict)
+    history: Dict[Tuple[int, int], int] = field(default_factory=dict)
+    pv: Dict[Hashable, Tuple[int, int]] = field(default_factory=dict)
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its time or node budget runs out."""
+
+
+class SearchCancelled(Exception):
+    """Raised by a search stopped through its stop event."""
+
+
+# Per-process player of the get_best_moves workers, set by the initializer.
+_batch_player: Optional["AIPlayer"] = None
+
+
+def _init_batch_worker(player: bytes):
+    """Process-pool initializer for :meth:`AIPlayer.get_best_moves`."""
+    global _batch_player
+    _batch_player = pickle.loads(player)
+
+
+def _best_moves_worker(boards: List[Board]) -> List[Tuple[int, int]]:
+    """Process-pool entry point for :meth:`AIPlayer.get_best_moves`."""
+    return [_batch_player.get_best_move(board) for board in boards]
+
+
+# Per-process state of the 'parallel' search workers, set by the initializer.
+_root_player: Optional["AIPlayer"] = None
+_root_best = None
+_root_stop = None
+
+
+def _init_root_worker(player: bytes, best, stop):
+    """
+    Process-pool initializer for the 'parallel' search.
+
+    The player arrives pickled, so that a forked worker does not keep the
+    parent's live search state.
+    """
+    global _root_player, _root_best, _root_stop
+    _root_player, _root_best, _root_stop = pickle.loads(player), best, stop
+
+
+def _root_move_worker(args: tuple) -> Tuple[float, int, int, int]:
+    """Process-pool entry point for :meth:`AIPlayer._search_root_move`."""
+    board, move, index, settings, search_id = args
+    ai_symbol, opponent_symbol, stoppable, collect_stats = settings
+    player = _root_player
+    player.set_symbols(ai_symbol, opponent_symbol)
+    player._stop = _root_stop if stoppable else None
+    player._budgeted = stoppable
+    player._stats = SearchStats() if collect_stats else None
+    return player._search_root_move(board, move, index, _root_best, search_id)
+
+
+def position_key(board: Board) -> Hashable:
+    """Key identifying a board's exact contents and dimensions."""
+    return board.size, board.win_length, board.zobrist_hash
 
 
 class AIPlayer:
     """AI player that uses minimax algorithm to play Tic-Tac-Toe."""
 
-    def __init__(self, difficulty: str = "hard"):
+    def __init__(
+        self,
+        difficulty: str = "hard",
+        tt_size: int = DEFAULT_MAX_SIZE,
+        search: str = "minimax",
+        use_solution_table: bool = False,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        seed: Optional[int] = None,
+        collect_stats: bool = False,
+        stats_callback: Optional[Callable[[SearchStats], None]] = None,
+        search_workers: Optional[int] = None,
+        transposition_table: Optional[SharedTranspositionTable] = None,
+        cache: Optional[PositionCache] = None,
+    ):
         """
         Initialize AI player.
 
         Args:
             difficulty: AI difficulty level ('easy', 'medium', 'hard')
+            tt_size: Maximum transposition table entries (0 disables the table)
+            search: Hard-mode search algorithm ('minimax', 'alphabeta',
+                'iterative' or 'parallel')
+            use_solution_table: Answer hard-mode moves from the precomputed
+                perfect-play table when the position is in it
+            time_limit: Seconds an 'iterative' search may take per move
+            node_limit: Nodes an 'iterative' search may visit per move
+            seed: Seed for this player's random choices, for reproducible games
+            collect_stats: Record a :class:`SearchStats` for every move in
+                ``last_stats``
+            stats_callback: Called with the :class:`SearchStats` of every
+                move; setting it also turns on ``collect_stats``
+            search_workers: Processes a 'parallel' search splits the root
+                moves across. Defaults to the number of CPUs
+            transposition_table: Shared table to use instead of a private
+                one of ``tt_size`` entries, e.g. to share search results
+                with other processes
+            cache: Persistent cache consulted before every hard-mode search
+                and filled with the results of those that run
         """
         self.difficulty = difficulty
         self.player_symbol = "O"
         self.opponent_symbol = "X"
+        self.rng = random.Random(seed)
+        self.transposition_table: Optional[
+            Union[TranspositionTable, SharedTranspositionTable]
+        ] = transposition_table
+        if transposition_table is None and tt_size:
+            self.transposition_table = TranspositionTable(tt_size)
+        self.search = "minimax"
+        self.set_search(search)
+        self.use_solution_table = use_solution_table
+        self.cache = cache
+        self.time_limit: Optional[float] = None
+        self.node_limit: Optional[int] = None
+        self.set_limits(time_limit, node_limit)
+        self.nodes_searched = 0
+        self.search_depth = 0
+        self.last_score: Optional[float] = None
+        self.collect_stats = collect_stats
+        self.stats_callback = stats_callback
+        self.last_stats: Optional[SearchStats] = None
+        self._stats: Optional[SearchStats] = None
+        self._max_depth: Optional[int] = None
+        self._deadline: Optional[float] = None
+        self._budgeted = False
+        self._clock_interval = 1
+        self._clock_countdown = 1
+        self._last_clock = 0.0
+        self._stop: Optional[threading.Event] = None
+        self._reached_horizon = False
+        self._proven = False
+        self._win_score = 10
+        self._priorities = move_priorities(3, 3)
+        self._symmetric_keys = True
+        self._killers: Dict[int, List[Tuple[int, int]]] = {}
+        self._history: Dict[Tuple[int, int], int] = {}
+        self.game_context: Optional[GameContext] = None
+        if search_workers is not None and search_workers < 1:
+            raise ValueError("Search workers must be at least 1")
+        self.search_workers = search_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shared_best = None
+        self._shared_stop = None
+        self._search_id = 0
 
-    def get_best_move(self, board: Board) -> Tuple[int, int]:
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Callbacks are often lambdas or bound to objects that cannot be
+        # pickled, so worker processes run without one.
+        state["stats_callback"] = None
+        state["_stop"] = None
+        state["_budgeted"] = False
+        state["_stats"] = None
+        state["_pool"] = None
+        state["_shared_best"] = None
+        state["_shared_stop"] = None
+        # Only the parent consults the cache, and connections cannot be
+        # pickled.
+        state["cache"] = None
+        return state
+
+    def close(self):
+        """Shut down the worker processes of the 'parallel' search, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._shared_best = None
+            self._shared_stop = None
+
+    def get_best_move(
+        self, board: Board, stop: Optional[threading.Event] = None
+    ) -> Tuple[int, int]:
         """
         Get the best move for the AI player.
 
+        When statistics are enabled, they are stored in ``last_stats`` and
+        passed to ``stats_callback``. In hard mode the score of the move is
+        stored in ``last_score``.
+
         Args:
             board: Current game board
+            stop: Event that ends the search early once set, checked about
+                every ``CLOCK_CHECK_SECONDS``. An 'iterative' search then
+                returns its best move so far; other searches raise
+                :class:`SearchCancelled` and leave ``board`` unchanged
 
         Returns:
             Tuple of (row, col) representing the best move
         """
+        if stop is not None:
+            return self._get_stoppable_move(board, stop)
+        if not self.collect_stats and self.stats_callback is None:
+            return self._choose_move(board)
+
+        table = self.transposition_table
+        hits, misses = (table.hits, table.misses) if table is not None else (0, 0)
+        stats = SearchStats(method=self.search)
+        if self.difficulty != "hard":
+            stats.method = "random" if self.difficulty == "easy" else "medium"
+        self._stats = stats
+        start = time.perf_counter()
+        try:
+            move = self._choose_move(board)
+        finally:
+            self._stats = None
+        stats.wall_time = time.perf_counter() - start
+        if self.difficulty == "hard" and self.nodes_searched:
+            stats.nodes = self.nodes_searched
+            stats.max_depth = max(stats.max_depth, 1)
+        if table is not None:
+            stats.tt_hits = table.hits - hits
+            stats.tt_misses = table.misses - misses
+
+        self.last_stats = stats
+        if self.stats_callback is not None:
+            self.stats_callback(stats)
+        return move
+
+    def _choose_move(self, board: Board) -> Tuple[int, int]:
+        """Pick a move for the current difficulty and search settings."""
         if self.difficulty == "easy":
             return self._get_random_move(board)
         if self.difficulty == "medium":
             return self._get_medium_move(board)
         # hard
-        return self._get_minimax_move(board)
+        self.nodes_searched = 0
+        self._reset_clock_checks()
+        self.last_score = None
+        # Win scores must outweigh the deepest possible game.
+        self._win_score = board.size * board.size + 1
+        self._priorities = move_priorities(board.size, board.win_length)
+        self._symmetric_keys = board.size <= SYMMETRY_MAX_SIZE
+        if self.use_solution_table:
+            solution = solutions.load_table().lookup(board, self.player_symbol)
+            if solution is not None:
+                if self._stats is not None:
+                    self._stats.method = "table"
+                self.last_score = solution[1]
+                return solution[0]
+        if self.cache is None:
+            return self._search_move(board)
+
+        depth = len(board.get_empty_positions())
+        # A budgeted search settles for whatever depth was cached; any other
+        # search needs a solved position to match what it would compute.
+        budgeted = self.search == "iterative" and (
+            self.time_limit is not None or self.node_limit is not None
+        )
+        entry = self.cache.get(board, self.player_symbol)
+        if entry is not None and (budgeted or entry.depth >= depth):
+            if self._stats is not None:
+                self._stats.method = "cache"
+            self.last_score = entry.score
+            self.search_depth = entry.depth
+            return entry.move
+        move = self._search_move(board)
+        if self.search == "iterative" and not self._proven:
+            depth = self.search_depth
+        if self.last_score is not None and depth > 0:
+            self.cache.put(board, self.player_symbol, move, self.last_score, depth)
+        return move
+
+    def _search_move(self, board: Board) -> Tuple[int, int]:
+        """Search for a hard-mode move with the configured algorithm."""
+        if self.search == "minimax":
+            return self._get_minimax_move(board)
+        context = self._resume_game(board)
+        if self.search == "alphabeta":
+            move = self._get_alphabeta_move(board)
+        elif self.search == "iterative":
+            move = self._get_iterative_move(board)
+        else:
+            move = self._get_parallel_move(board)
+        context.pv = self._line_by_position(board, move)
+        return move
+
+    def _resume_game(self, board: Board) -> GameContext:
+        """
+        Carry move-ordering state over from this player's last search.
+
+        The killer and history tables continue from the previous move of
+        the same game, shifted to the new root, and history scores are
+        halved every move so that recent cutoffs count most. A new game,
+        an undone move or a change of side starts a fresh context.
+        """
+        stones = board.size * board.size - len(board.get_empty_positions())
+        context = self.game_context
+        if (
+            context is None
+            or context.game_id != board.game_id
+            or context.player != self.player_symbol
+            or stones < context.stones
+        ):
+            context = self.game_context = GameContext(
+                board.game_id, self.player_symbol, stones
+            )
+        elif stones > context.stones:
+            shift = stones - context.stones
+            context.killers = {
+                depth - shift: moves
+                for depth, moves in context.killers.items()
+                if depth >= shift
+            }
+            context.history = {
+                move: score >> 1 for move, score in context.history.items() if score > 1
+            }
+            context.stones = stones
+        self._killers = context.killers
+        self._history = context.history
+        return context
+
+    def _line_by_position(
+        self, board: Board, move: Tuple[int, int]
+    ) -> Dict[Hashable, Tuple[int, int]]:
+        """Map each position along the principal variation to its move."""
+        line = self.principal_variation(board, move)
+        symbols = (self.player_symbol, self.opponent_symbol)
+        pv = {}
+        for ply, (row, col) in enumerate(line):
+            pv[position_key(board)] = (row, col)
+            board.push(row, col, symbols[ply % 2])
+        for _ in line:
+            board.pop()
+        return pv
+
+    def _order_root(self, board: Board) -> List[Tuple[int, int]]:
+        """Root moves in search order, the expected move from the game first."""
+        ordered = self._order_moves(board.get_empty_positions(), 0)
+        context = self.game_context
+        expected = context.pv.get(position_key(board)) if context else None
+        if expected in ordered:
+            ordered.remove(expected)
+            ordered.insert(0, expected)
+        return ordered
+
+    async def get_best_move_async(
+        self,
+        board: Board,
+        timeout: Optional[float] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> Tuple[int, int]:
+        """
+        Get the best move without blocking the event loop.
+
+        The search runs on a copy of ``board`` in a worker thread. When the
+        awaiting task is cancelled or ``timeout`` expires, the search notices
+        within about ``CLOCK_CHECK_SECONDS`` and stops, freeing the thread.
+        Only one search may run on a player at a time.
+
+        Args:
+            board: Current game board; it is not modified
+            timeout: Seconds to wait for the move, or None to wait forever
+            executor: Thread pool to search in; defaults to the event loop's
+                default executor
+
+        Returns:
+            Tuple of (row, col) representing the best move
+
+        Raises:
+            asyncio.TimeoutError: If ``timeout`` expired first
+        """
+        stop = threading.Event()
+        search = asyncio.get_running_loop().run_in_executor(
+            executor, self.get_best_move, board.copy(), stop
+        )
+        try:
+            return await asyncio.wait_for(search, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            stop.set()
+            raise
+
+    def _get_stoppable_move(self, board: Board, stop: threading.Event):
+        """Run :meth:`get_best_move` with ``stop`` checked by the search."""
+        undo_count = board.undo_count
+        self._stop = stop
+        self._budgeted = True
+        try:
+            return self.get_best_move(board)
+        except SearchCancelled:
+            while board.undo_count > undo_count:
+                board.pop()
+            raise
+        finally:
+            self._stop = None
+            self._budgeted = False
+
+    def get_best_moves(
+        self, boards: Sequence[Board], workers: int = 1
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the best move for each of many boards.
+
+        In hard mode, identical positions are searched once and share the
+        answer. With one worker all searches share this player's
+        transposition table. With ``workers > 1`` the distinct positions are
+        split across a process pool; each worker gets a copy of this player
+        once, with an empty table of the same size, or attached to the same
+        table if it is a :class:`SharedTranspositionTable`. Worker tables
+        are discarded afterwards.
+
+        Args:
+            boards: Boards to move on; they are not modified
+            workers: Number of processes to search with
+
+        Returns:
+            One (row, col) move per board, in input order
+        """
+        if workers < 1:
+            raise ValueError("Workers must be at least 1")
+        if self.difficulty != "hard":
+            return [self.get_best_move(board) for board in boards]
+
+        unique: Dict[Hashable, Board] = {}
+        keys = []
+        for board in boards:
+            key = position_key(board)
+            unique.setdefault(key, board)
+            keys.append(key)
+
+        distinct = list(unique.values())
+        if workers == 1 or len(distinct) < 2:
+            moves = [self.get_best_move(board) for board in distinct]
+        else:
+            chunk_size = -(-len(distinct) // (workers * 4))
+            chunks = [
+                distinct[start : start + chunk_size]
+                for start in range(0, len(distinct), chunk_size)
+            ]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(self._pickle_for_workers(),),
+            ) as pool:
+                moves = [
+                    move
+                    for chunk_moves in pool.map(_best_moves_worker, chunks)
+                    for move in chunk_moves
+                ]
+
+        move_by_key = dict(zip(unique, moves))
+        return [move_by_key[key] for key in keys]
+
+    def principal_variation(
+        self,
+        board: Board,
+        first_move: Tuple[int, int],
+        max_length: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Expected line of play after a hard-mode search of ``board``.
+
+        The line starts with ``first_move`` (the AI's move) and continues
+        with the best reply at each turn as recorded in the transposition
+        table (or the solution table, if enabled); no new search is run. It
+        ends when the game does or when no reply is known.
+
+        Args:
+            board: Board that was searched; it is left unchanged
+            first_move: Move returned by :meth:`get_best_move`
+            max_length: Most moves to return, or None for no limit
+
+        Returns:
+            List of (row, col) moves, alternating AI and opponent
+        """
+        self._win_score = board.size * board.size + 1
+        self._symmetric_keys = board.size <= SYMMETRY_MAX_SIZE
+        table = solutions.load_table() if self.use_solution_table else None
+        line = [first_move]
+        board.push(first_move[0], first_move[1], self.player_symbol)
+        is_maximizing = False
+        try:
+            while not board.is_game_over() and (
+                max_length is None or len(line) < max_length
+            ):
+                symbol = self.player_symbol if is_maximizing else self.opponent_symbol
+                solution = table.lookup(board, symbol) if table is not None else None
+                if solution is not None:
+                    move = solution[0]
+                else:
+                    move = self._best_known_reply(board, len(line), is_maximizing)
+                    if move is None:
+                        break
+                board.push(move[0], move[1], symbol)
+                line.append(move)
+                is_maximizing = not is_maximizing
+        finally:
+            for _ in line:
+                board.pop()
+        return line
+
+    def _best_known_reply(
+        self, board: Board, depth: int, is_maximizing: bool
+    ) -> Optional[Tuple[int, int]]:
+        """Best move by the exact scores the transposition table holds for children."""
+        table = self.transposition_table
+        symbol = self.player_symbol if is_maximizing else self.opponent_symbol
+        best_move, best_score = None, None
+        for row, col in board.get_empty_positions():
+            board.push(row, col, symbol)
+            winner = board.check_winner()
+            if winner == self.player_symbol:
+                score = self._win_score - depth
+            elif winner == self.opponent_symbol:
+                score = depth - self._win_score
+            elif board.is_full():
+                score = 0
+            else:
+                entry = None
+                if table is not None:
+                    entry = table.peek(self._table_key(board, not is_maximizing))
+                # Bounds from alpha-beta cutoffs would misorder the replies.
+                score = (
+                    None
+                    if entry is None or entry.flag != EXACT
+                    else self._from_table_score(entry.score, depth)
+                )
+            board.pop()
+            if score is not None and (
+                best_score is None
+                or (score > best_score if is_maximizing else score < best_score)
+            ):
+                best_move, best_score = (row, col), score
+        return best_move
 
     def _get_random_move(self, board: Board) -> Tuple[int, int]:
         """Get a random valid move."""
         empty_positions = board.get_empty_positions()
-        return random.choice(empty_positions) #NOSONAR
+        return self.rng.choice(empty_positions)  # NOSONAR
 
     def _get_medium_move(self, board: Board) -> Tuple[int, int]:
         """
@@ -66,17 +658,20 @@ class AIPlayer:
 
         for row, col in board.get_empty_positions():
             # Make temporary move
-            board_copy = board.copy()
-            board_copy.make_move(row, col, self.player_symbol)
+            board.push(row, col, self.player_symbol)
 
             # Calculate score using minimax
-            score = self._minimax(board_copy, 0, False)
+            score = self._minimax(board, 0, False)
+            board.pop()
 
             if score > best_score:
                 best_score = score
                 best_move = (row, col)
 
-        return best_move if best_move else self._get_random_move(board)
+        if best_move is None:
+            return self._get_random_move(board)
+        self.last_score = best_score
+        return best_move
 
     def _minimax(self, board: Board, depth: int, is_maximizing: bool) -> int:
         """
@@ -90,33 +685,553 @@ class AIPlayer:
         Returns:
             Score of the current board state
         """
+        self.nodes_searched += 1
+        if self._budgeted:
+            self._check_budget()
         winner = board.check_winner()
 
         # Terminal states
         if winner == self.player_symbol:
-            return 10 - depth
+            return self._win_score - depth
         if winner == self.opponent_symbol:
-            return depth - 10
+            return depth - self._win_score
         if board.is_full():
             return 0
 
+        table = self.transposition_table
+        empty_positions = board.get_empty_positions()
+        if table is not None:
+            key = self._table_key(board, is_maximizing)
+            entry = table.get(key)
+            if (
+                entry is not None
+                and entry.flag == EXACT
+                and entry.depth >= len(empty_positions)
+            ):
+                return self._from_table_score(entry.score, depth)
+
+        if self._stats is not None:
+            self._stats_expand(depth)
+
         if is_maximizing:
             best_score = float("-inf")
-            for row, col in board.get_empty_positions():
-                board_copy = board.copy()
-                board_copy.make_move(row, col, self.player_symbol)
-                score = self._minimax(board_copy, depth + 1, False)
+            for row, col in empty_positions:
+                board.push(row, col, self.player_symbol)
+                score = self._minimax(board, depth + 1, False)
+                board.pop()
                 best_score = max(score, best_score)
-            return best_score
+        else:
+            best_score = float("inf")
+            for row, col in empty_positions:
+                board.push(row, col, self.opponent_symbol)
+                score = self._minimax(board, depth + 1, True)
+                board.pop()
+                best_score = min(score, best_score)
 
-        best_score = float("inf")
-        for row, col in board.get_empty_positions():
-            board_copy = board.copy()
-            board_copy.make_move(row, col, self.opponent_symbol)
-            score = self._minimax(board_copy, depth + 1, True)
-            best_score = min(score, best_score)
+        if table is not None:
+            table.store(
+                key,
+                self._to_table_score(best_score, depth),
+                EXACT,
+                len(empty_positions),
+            )
         return best_score
 
+    def _get_alphabeta_move(self, board: Board) -> Tuple[int, int]:
+        """
+        Get the best move using a single alpha-beta search from the root.
+
+        Ties are broken exactly like :meth:`_get_minimax_move` (first move in
+        row-major order): a candidate ordered ahead of the current best is
+        searched with a window one point lower so that an equal score is
+        still resolved exactly.
+        """
+        empty_positions = board.get_empty_positions()
+        index = {move: i for i, move in enumerate(empty_positions)}
+        best_score = float("-inf")
+        best_move = None
+
+        for row, col in self._order_root(board):
+            alpha = best_score
+            if best_move is not None and index[(row, col)] < index[best_move]:
+                alpha = best_score - 1
+
+            board.push(row, col, self.player_symbol)
+            score = self._alphabeta(board, 0, alpha, float("inf"), False)
+            board.pop()
+
+            if score > best_score or (
+                score == best_score and index[(row, col)] < index[best_move]
+            ):
+                best_score = score
+                best_move = (row, col)
+
+        if best_move is None:
+            return self._get_random_move(board)
+        self.last_score = best_score
+        return best_move
+
+    def _get_parallel_move(self, board: Board) -> Tuple[int, int]:
+        """
+        Get the best move with alpha-beta, searching root moves in parallel.
+
+        Each root move is one task for a pool of ``search_workers``
+        processes, which stay up between moves and keep their own
+        transposition tables (or all use the player's table, if it is a
+        :class:`SharedTranspositionTable`). Workers share the best root
+        score found so far, and the move it belongs to, through shared
+        memory and use it as their alpha bound, so moves searched after a
+        good one are pruned as in a serial search. Ties are broken as in
+        :meth:`_get_alphabeta_move`, so the chosen move does not depend on
+        which worker finishes first.
+        """
+        empty_positions = board.get_empty_positions()
+        if not empty_positions:
+            return self._get_random_move(board)
+        if self._pool is None:
+            self._shared_best = multiprocessing.Array("d", 2)
+            self._shared_stop = multiprocessing.Event()
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.search_workers,
+                initializer=_init_root_worker,
+                initargs=(
+                    self._pickle_for_workers(),
+                    self._shared_best,
+                    self._shared_stop,
+                ),
+            )
+        with self._shared_best.get_lock():
+            self._shared_best[:] = [float("-inf"), float("inf")]
+        self._shared_stop.clear()
+        self._search_id += 1
+
+        index = {move: i for i, move in enumerate(empty_positions)}
+        ordered = self._order_root(board)
+        # Workers outlive this search, so everything that may differ between
+        # searches travels with each task.
+        settings = (
+            self.player_symbol,
+            self.opponent_symbol,
+            self._stop is not None,
+            self._stats is not None,
+        )
+
+        def submit(move):
+            return self._pool.submit(
+                _root_move_worker,
+                (board, move, index[move], settings, self._search_id),
+            )
+
+        futures = []
+        best_score = float("-inf")
+        best_move = None
+        try:
+            # The first move is searched alone, so that the others start
+            # with its score as their bound instead of all starting unbounded.
+            futures.append(submit(ordered[0]))
+            self._root_result(futures[0])
+            futures += [submit(move) for move in ordered[1:]]
+            for move, future in zip(ordered, futures):
+                score, nodes, expanded, max_depth = self._root_result(future)
+                self.nodes_searched += nodes
+                if self._stats is not None:
+                    self._stats.expanded += expanded
+                    self._stats.max_depth = max(self._stats.max_depth, max_depth)
+                if score > best_score or (
+                    score == best_score and index[move] < index[best_move]
+                ):
+                    best_score, best_move = score, move
+        except SearchCancelled:
+            # Let the workers drop this search before the next one reuses
+            # the shared best score.
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+        self.last_score = best_score
+        return best_move
+
+    def _root_result(self, future) -> Tuple[float, int, int, int]:
+        """Wait for a root move's result, passing a stop on to the workers."""
+        if self._stop is None:
+            return future.result()
+        while True:
+            try:
+                return future.result(STOP_POLL_INTERVAL)
+            except ResultTimeout:
+                if self._stop.is_set():
+                    self._shared_stop.set()
+
+    def _pickle_for_workers(self) -> bytes:
+        """
+        Pickle this player for worker processes.
+
+        A private transposition table is sent empty, as worker tables are
+        never merged back; a shared one is attached to by name.
+        """
+        table = self.transposition_table
+        if isinstance(table, TranspositionTable):
+            self.transposition_table = TranspositionTable(table.max_size)
+        try:
+            return pickle.dumps(self)
+        finally:
+            self.transposition_table = table
+
+    def _search_root_move(
+        self, board: Board, move: Tuple[int, int], index: int, best, search_id: int
+    ) -> Tuple[float, int, int, int]:
+        """
+        Search one root move for :meth:`_get_parallel_move` in a worker.
+
+        Args:
+            board: Position before the move
+            move: Root move to search
+            index: The move's row-major index among the empty cells
+            best: Shared (score, index) of the best root move so far
+            search_id: Identifies the parent's move; killer and history
+                tables carry over between root moves of the same one
+
+        Returns:
+            Tuple of (score, nodes searched, positions expanded, deepest
+            ply reached); the last two are 0 unless statistics are being
+            collected. The score is exact unless the move is worse than the
+            best root move, then an upper bound
+        """
+        self.nodes_searched = 0
+        self._reset_clock_checks()
+        self._win_score = board.size * board.size + 1
+        self._priorities = move_priorities(board.size, board.win_length)
+        self._symmetric_keys = board.size <= SYMMETRY_MAX_SIZE
+        if search_id != self._search_id:
+            self._search_id = search_id
+            self._killers = {}
+            self._history = {}
+
+        best_score, best_index = best[:]
+        # As in _get_alphabeta_move, a move ahead of the best in row-major
+        # order wins a tie, so it is searched with a window one point lower.
+        bound = best_score - (index < best_index)
+        board.push(move[0], move[1], self.player_symbol)
+        score = self._alphabeta(board, 0, bound, float("inf"), False)
+        board.pop()
+
+        with best.get_lock():
+            best_score, best_index = best[:]
+            if score > best_score or (score == best_score and index < best_index):
+                best[:] = [score, index]
+        stats = self._stats
+        if stats is None:
+            return score, self.nodes_searched, 0, 0
+        return score, self.nodes_searched, stats.expanded, stats.max_depth
+
+    def _alphabeta(
+        self, board: Board, depth: int, alpha: float, beta: float, is_maximizing: bool
+    ) -> int:
+        """
+        Fail-soft alpha-beta search with transposition table and move ordering.
+
+        Args:
+            board: Current board state
+            depth: Current depth in the game tree
+            alpha: Score the maximizing player is already assured of
+            beta: Score the minimizing player is already assured of
+            is_maximizing: True if maximizing player's turn, False otherwise
+
+        Returns:
+            Score of the current board state, exact when it lies inside the
+            (alpha, beta) window and a bound on the true score otherwise
+        """
+        self.nodes_searched += 1
+        if self._budgeted:
+            self._check_budget()
+        winner = board.check_winner()
+
+        if winner == self.player_symbol:
+            return self._win_score - depth
+        if winner == self.opponent_symbol:
+            return depth - self._win_score
+        if board.is_full():
+            return 0
+
+        if self._max_depth is not None and depth + 1 >= self._max_depth:
+            return self._evaluate(board)
+
+        table = self.transposition_table
+        empty_positions = board.get_empty_positions()
+        remaining = len(empty_positions)
+        shallow_entry = False
+        if self._max_depth is not None:
+            remaining = min(remaining, self._max_depth - depth - 1)
+        if table is not None:
+            key = self._table_key(board, is_maximizing)
+            entry = table.get(key)
+            if entry is not None and entry.depth >= remaining:
+                if entry.depth < len(empty_positions):
+                    # The entry was cut off at a horizon, so this iteration
+                    # has not proven its result either.
+                    self._reached_horizon = shallow_entry = True
+                score = self._from_table_score(entry.score, depth)
+                if entry.flag == EXACT:
+                    return score
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+                if alpha >= beta:
+                    return score
+
+        if self._stats is not None:
+            self._stats_expand(depth)
+
+        original_alpha, original_beta = alpha, beta
+        symbol = self.player_symbol if is_maximizing else self.opponent_symbol
+        best_score = float("-inf") if is_maximizing else float("inf")
+        outer_horizon, self._reached_horizon = self._reached_horizon, False
+
+        for row, col in self._order_moves(empty_positions, depth + 1):
+            board.push(row, col, symbol)
+            score = self._alphabeta(board, depth + 1, alpha, beta, not is_maximizing)
+            board.pop()
+
+            if is_maximizing:
+                best_score = max(score, best_score)
+                alpha = max(alpha, best_score)
+            else:
+                best_score = min(score, best_score)
+                beta = min(beta, best_score)
+
+            if alpha >= beta:
+                self._record_cutoff((row, col), depth + 1, len(empty_positions))
+                break
+
+        if table is not None:
+            if best_score <= original_alpha:
+                flag = UPPER_BOUND
+            elif best_score >= original_beta:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            # A subtree that never reached the horizon was searched to the
+            # end, so its score holds for any remaining depth.
+            if not (self._reached_horizon or shallow_entry):
+                remaining = len(empty_positions)
+            table.store(key, self._to_table_score(best_score, depth), flag, remaining)
+        self._reached_horizon = outer_horizon or self._reached_horizon
+        return best_score
+
+    def _get_iterative_move(self, board: Board) -> Tuple[int, int]:
+        """
+        Get the best move with iterative deepening under a time/node budget.
+
+        Searches to depth 1, 2, 3, ... with alpha-beta, scoring positions at
+        the depth limit with :meth:`_evaluate`. Each iteration searches the
+        previous best move first, so when the budget runs out the best move
+        found so far is returned.
+        """
+        self._deadline = (
+            time.perf_counter() + self.time_limit
+            if self.time_limit is not None
+            else None
+        )
+        self._budgeted = (
+            self._deadline is not None
+            or self.node_limit is not None
+            or self._stop is not None
+        )
+        undo_count = board.undo_count
+        ordered = self._order_root(board)
+        best_move = ordered[0] if ordered else None
+        self.search_depth = 0
+        self._proven = False
+
+        try:
+            for max_depth in range(1, len(ordered) + 1):
+                self._max_depth = max_depth
+                self._reached_horizon = False
+                best_score = float("-inf")
+                for row, col in ordered:
+                    board.push(row, col, self.player_symbol)
+                    score = self._alphabeta(board, 0, best_score, float("inf"), False)
+                    board.pop()
+                    if score > best_score:
+                        best_score = score
+                        # The previous best is searched first, so even a
+                        # partial iteration only ever improves on it.
+                        best_move = (row, col)
+                        self.last_score = score
+
+                self.search_depth = max_depth
+                ordered.remove(best_move)
+                ordered.insert(0, best_move)
+                # Stop once the result is proven: no position was cut off at
+                # the horizon, a forced loss was found, or a forced win that
+                # lies within the horizon (a cached win may be a slower one).
+                if (
+                    not self._reached_horizon
+                    or best_score <= -1
+                    or best_score > self._win_score - max_depth
+                ):
+                    break
+            self._proven = True
+        except (SearchTimeout, SearchCancelled):
+            while board.undo_count > undo_count:
+                board.pop()
+        finally:
+            self._max_depth = None
+            self._deadline = None
+            self._budgeted = self._stop is not None
+
+        return best_move if best_move else self._get_random_move(board)
+
+    def _stats_expand(self, depth: int):
+        """Record that a node at ``depth`` is about to search its children."""
+        stats = self._stats
+        stats.expanded += 1
+        # Children of a node at depth d sit d + 2 plies below the root.
+        if depth + 2 > stats.max_depth:
+            stats.max_depth = depth + 2
+
+    def _check_budget(self):
+        """
+        Raise SearchCancelled once cancelled, or SearchTimeout once the node
+        or time budget of an iterative deepening search is exhausted.
+        """
+        self._clock_countdown -= 1
+        if self._clock_countdown <= 0:
+            now = self._pace_clock_checks()
+            if self._stop is not None and self._stop.is_set():
+                raise SearchCancelled
+            if (
+                self._max_depth is not None
+                and self._deadline is not None
+                and now >= self._deadline
+            ):
+                raise SearchTimeout
+        if (
+            self._max_depth is not None
+            and self.node_limit is not None
+            and self.nodes_searched > self.node_limit
+        ):
+            raise SearchTimeout
+
+    def _reset_clock_checks(self):
+        """Look at the clock after the first node of a new search."""
+        self._clock_interval = self._clock_countdown = 1
+        self._last_clock = time.perf_counter()
+
+    def _pace_clock_checks(self) -> float:
+        """
+        Read the clock and schedule the next look at it.
+
+        The interval doubles while looks come more often than every
+        ``CLOCK_CHECK_SECONDS`` and halves when they come later.
+
+        Returns:
+            The current time
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last_clock
+        self._last_clock = now
+        if elapsed > CLOCK_CHECK_SECONDS:
+            self._clock_interval = max(1, self._clock_interval // 2)
+        elif elapsed < CLOCK_CHECK_SECONDS / 2:
+            self._clock_interval = min(CLOCK_CHECK_INTERVAL, self._clock_interval * 2)
+        self._clock_countdown = self._clock_interval
+        return now
+
+    def _evaluate(self, board: Board) -> float:
+        """
+        Heuristic score of a non-terminal position at the search horizon.
+
+        Every line that could still be completed by one player counts the
+        square of that player's stones on it. The total is scaled into
+        (-1, 1) so it never outweighs a proven win or loss, which always
+        scores at least 2 in magnitude.
+        """
+        self._reached_horizon = True
+        cells = [cell for row in board.grid for cell in row]
+        lines = winning_lines(board.size, board.win_length)
+        player, opponent = self.player_symbol, self.opponent_symbol
+        total = 0
+        for line in lines:
+            mine = theirs = 0
+            for index in line:
+                cell = cells[index]
+                if cell == player:
+                    mine += 1
+                elif cell == opponent:
+                    theirs += 1
+            if not theirs:
+                total += mine * mine
+            elif not mine:
+                total -= theirs * theirs
+        return total / (len(lines) * board.win_length**2 + 1)
+
+    def _order_moves(
+        self, moves: List[Tuple[int, int]], depth: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Order moves for alpha-beta: killer moves, then history, then static.
+
+        Args:
+            moves: Candidate moves
+            depth: Depth the moves are played at
+
+        Returns:
+            The moves, most promising first
+        """
+        killers = self._killers.get(depth, ())
+        history = self._history
+        priorities = self._priorities
+        return sorted(
+            moves,
+            key=lambda move: (
+                move not in killers,
+                -history.get(move, 0),
+                priorities[move],
+            ),
+        )
+
+    def _record_cutoff(self, move: Tuple[int, int], depth: int, remaining: int):
+        """Remember a move that caused a beta cutoff for later move ordering."""
+        killers = self._killers.setdefault(depth, [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        self._history[move] = self._history.get(move, 0) + remaining * remaining
+
+    def _table_key(self, board: Board, is_maximizing: bool) -> int:
+        """Transposition table key for a position and side to move."""
+        if self._symmetric_keys:
+            return board.canonical_key(self.player_symbol) * 2 + is_maximizing
+        key = board.zobrist_hash << 2 | (self.player_symbol == "X") << 1 | is_maximizing
+        return key << 2 * DIMENSION_BITS | variant_key(board.size, board.win_length)
+
+    @staticmethod
+    def _to_table_score(score: int, depth: int) -> int:
+        """
+        Convert a search score into one relative to the node it belongs to.
+
+        Win and loss scores encode the depth of the final move, so they are
+        shifted by the node's depth before caching; the same position can
+        then be reused from any depth and across calls. Heuristic scores
+        (always below 1 in magnitude) are depth-independent and kept as is.
+        """
+        if score >= 1:
+            return score + depth
+        if score <= -1:
+            return score - depth
+        return score
+
+    @staticmethod
+    def _from_table_score(score: int, depth: int) -> int:
+        """Convert a cached node-relative score back to the search's scale."""
+        if score >= 1:
+            return score - depth
+        if score <= -1:
+            return score + depth
+        return score
+
     def _find_winning_move(
         self, board: Board, player: str
     ) -> Optional[Tuple[int, int]]:
@@ -131,9 +1246,10 @@ class AIPlayer:
             Tuple of (row, col) if winning move exists, None otherwise
         """
         for row, col in board.get_empty_positions():
-            board_copy = board.copy()
-            board_copy.make_move(row, col, player)
-            if board_copy.check_winner() == player:
+            board.push(row, col, player)
+            winner = board.check_winner()
+            board.pop()
+            if winner == player:
                 return (row, col)
         return None
 
@@ -149,6 +1265,38 @@ class AIPlayer:
         else:
             raise ValueError("Difficulty must be 'easy', 'medium', or 'hard'")
 
+    def set_search(self, search: str):
+        """
+        Set the search algorithm used in hard mode.
+
+        Args:
+            search: New search algorithm ('minimax', 'alphabeta', 'iterative'
+                or 'parallel')
+        """
+        if search in SEARCH_MODES:
+            self.search = search
+        else:
+            raise ValueError(
+                "Search must be 'minimax', 'alphabeta', 'iterative' or 'parallel'"
+            )
+
+    def set_limits(
+        self, time_limit: Optional[float] = None, node_limit: Optional[int] = None
+    ):
+        """
+        Set the per-move budget of the 'iterative' search.
+
+        Args:
+            time_limit: Seconds per move, or None for no time limit
+            node_limit: Nodes per move, or None for no node limit
+        """
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Time limit must be positive")
+        if node_limit is not None and node_limit < 1:
+            raise ValueError("Node limit must be at least 1")
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+
     def set_symbols(self, ai_symbol: str, opponent_symbol: str):
         """
         Set the symbols for AI and opponent.
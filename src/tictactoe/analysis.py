@@ -0,0 +1,159 @@
+"""Streaming analysis of many positions, one per line.
+
+Each input line holds a position in the notation of
+:mod:`tictactoe.position` (blank lines and lines starting with '#' are
+skipped). Each result is one tab-separated line::
+
+    <position>  <best move>  <score>  <principal variation>
+
+for example ``X.O/.X./...<TAB>c3<TAB>cp 0<TAB>c3 c2 a2 a3 b1 b3``. The
+score is from the side to move, as in :func:`tictactoe.engine.score_text`.
+Finished positions get
+``-`` as their move and ``result X``, ``result O`` or ``result draw``
+as their score.
+
+Lines are read and answered in chunks, with a bounded number of chunks in
+flight, so arbitrarily long inputs are analysed in constant memory.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .ai import AIPlayer
+from .engine import score_text
+from .position import Position, cell_name
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_NODE_LIMIT = 100_000
+
+# Chunks submitted per worker before waiting for the oldest one.
+CHUNKS_PER_WORKER = 2
+
+
+class AnalysisResult(NamedTuple):
+    """Outcome for one input line: ``output`` on success, else ``error``."""
+
+    line_number: int
+    output: Optional[str]
+    error: Optional[str]
+
+
+def analysis_player(node_limit: Optional[int] = DEFAULT_NODE_LIMIT) -> AIPlayer:
+    """The hard, iterative-deepening player used for analysis."""
+    return AIPlayer("hard", search="iterative", node_limit=node_limit)
+
+
+def analyze_position(ai: AIPlayer, text: str) -> str:
+    """
+    Analyse one position.
+
+    Args:
+        ai: Player from :func:`analysis_player`; its caches are reused
+        text: Position in text notation
+
+    Returns:
+        The tab-separated result line
+    """
+    position = Position.from_notation(text)
+    x_count = bin(position.x_mask).count("1")
+    o_count = bin(position.o_mask).count("1")
+    if not o_count <= x_count <= o_count + 1:
+        raise ValueError(f"Impossible stone counts in position {text.strip()!r}")
+    board = position.to_board()
+    if board.is_game_over():
+        winner = board.check_winner() or "draw"
+        return f"{position.notation}\t-\tresult {winner}\t"
+
+    side = board.current_player
+    ai.set_symbols(side, "O" if side == "X" else "X")
+    move = ai.get_best_move(board)
+    line = ai.principal_variation(board, move)
+    score = score_text(ai.last_score, board) or "-"
+    pv = " ".join(cell_name(*cell) for cell in line)
+    return f"{position.notation}\t{cell_name(*move)}\t{score}\t{pv}"
+
+
+def _analyze_chunk(ai: AIPlayer, chunk: List[Tuple[int, str]]) -> List[AnalysisResult]:
+    results = []
+    for line_number, text in chunk:
+        try:
+            results.append(
+                AnalysisResult(line_number, analyze_position(ai, text), None)
+            )
+        except ValueError as error:
+            results.append(AnalysisResult(line_number, None, str(error)))
+    return results
+
+
+_worker_ai: Optional[AIPlayer] = None
+
+
+def _init_worker(node_limit: Optional[int]):
+    """Give each worker process one player, kept warm across its chunks."""
+    global _worker_ai
+    _worker_ai = analysis_player(node_limit)
+
+
+def _worker_chunk(chunk: List[Tuple[int, str]]) -> List[AnalysisResult]:
+    """Process-pool entry point for :func:`analyze_lines`."""
+    return _analyze_chunk(_worker_ai, chunk)
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Numbered position lines in lists of ``size``."""
+    numbered = (
+        (number, line.strip())
+        for number, line in enumerate(lines, 1)
+        if line.strip() and not line.lstrip().startswith("#")
+    )
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def analyze_lines(
+    lines: Iterable[str],
+    node_limit: Optional[int] = DEFAULT_NODE_LIMIT,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[AnalysisResult]:
+    """
+    Analyse a stream of positions, yielding results in input order.
+
+    Args:
+        lines: Input lines, read lazily
+        node_limit: Search nodes per position, or None to search each
+            position to the end
+        workers: Number of worker processes
+        chunk_size: Lines handed to a worker at a time
+
+    Returns:
+        Iterator of one :class:`AnalysisResult` per position line
+    """
+    if workers < 1:
+        raise ValueError("Workers must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    if node_limit is not None and node_limit < 1:
+        raise ValueError("Node limit must be at least 1")
+
+    if workers == 1:
+        ai = analysis_player(node_limit)
+        for chunk in _chunks(lines, chunk_size):
+            yield from _analyze_chunk(ai, chunk)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(node_limit,)
+    ) as pool:
+        pending = deque()
+        for chunk in _chunks(lines, chunk_size):
+            pending.append(pool.submit(_worker_chunk, chunk))
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,258 @@
+"""Bitboard-backed Tic-Tac-Toe board implementation."""
+
+from typing import Dict, List, Optional, Tuple
+
+from .board import new_game_id, zobrist_keys
+from .transposition import DIMENSION_BITS, symmetry_getters, variant_key
+
+SIZE = 3
+FULL_MASK = (1 << (SIZE * SIZE)) - 1
+
+
+def _build_line_masks() -> Tuple[int, ...]:
+    """Build the bitmask of every winning line (rows, columns, diagonals)."""
+    masks = []
+    for row in range(SIZE):
+        masks.append(sum(1 << (row * SIZE + col) for col in range(SIZE)))
+    for col in range(SIZE):
+        masks.append(sum(1 << (row * SIZE + col) for row in range(SIZE)))
+    masks.append(sum(1 << (i * SIZE + i) for i in range(SIZE)))
+    masks.append(sum(1 << (i * SIZE + SIZE - 1 - i) for i in range(SIZE)))
+    return tuple(masks)
+
+
+LINE_MASKS = _build_line_masks()
+
+# WINNING_MASKS[m] is True when the stones in bitmask m complete a line, so a
+# win check is a single table lookup instead of a scan over LINE_MASKS.
+WINNING_MASKS: Tuple[bool, ...] = tuple(
+    any(mask & line == line for line in LINE_MASKS) for mask in range(FULL_MASK + 1)
+)
+
+# EMPTY_POSITIONS[m] lists the free (row, col) cells when m is the occupied mask.
+EMPTY_POSITIONS: Tuple[Tuple[Tuple[int, int], ...], ...] = tuple(
+    tuple(
+        (bit // SIZE, bit % SIZE)
+        for bit in range(SIZE * SIZE)
+        if not occupied >> bit & 1
+    )
+    for occupied in range(FULL_MASK + 1)
+)
+
+
+def _build_symmetry_values() -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build, per board symmetry, the base-3 value of every stone mask.
+
+    Under a symmetry whose table is ``values``, a position encodes as
+    ``values[own] + 2 * values[other]``, the same number that
+    :func:`canonical_key` reads from the transformed grid.
+    """
+    tables = []
+    for getter in symmetry_getters(SIZE):
+        order = getter(range(SIZE * SIZE))
+        place = [0] * (SIZE * SIZE)
+        for position, cell in enumerate(order):
+            place[cell] = 3 ** (SIZE * SIZE - 1 - position)
+        tables.append(
+            tuple(
+                sum(place[bit] for bit in range(SIZE * SIZE) if mask >> bit & 1)
+                for mask in range(FULL_MASK + 1)
+            )
+        )
+    return tuple(tables)
+
+
+SYMMETRY_VALUES = _build_symmetry_values()
+_VARIANT = variant_key(SIZE, SIZE)
+
+
+class BitBoard:
+    """
+    Tic-Tac-Toe board that keeps one integer bitmask per player.
+
+    Cell (row, col) maps to bit ``row * 3 + col``. The public API mirrors
+    :class:`Board`, so a ``BitBoard`` can be used wherever a 3x3 ``Board`` is.
+    """
+
+    size = SIZE
+    win_length = SIZE
+
+    def __init__(self):
+        """Initialize an empty 3x3 board."""
+        self.masks: Dict[str, int] = {}
+        self.occupied = 0
+        self.current_player = "X"
+        self._undo_stack: List[Tuple[str, int]] = []
+        # As for Board: copies share it, reset() starts a new game.
+        self.game_id = new_game_id()
+
+    @property
+    def undo_count(self) -> int:
+        """Number of pushed moves that can still be undone with :meth:`pop`."""
+        return len(self._undo_stack)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        64-bit Zobrist hash of the stones on the board.
+
+        Equal to the hash of the same position on a :class:`Board`. It is
+        computed from the masks on each access rather than kept up to date
+        by every move, as searches on a 3x3 board key positions otherwise.
+        """
+        keys = zobrist_keys(SIZE)
+        value = 0
+        for player, mask in self.masks.items():
+            player_keys = keys[player]
+            while mask:
+                bit = mask & -mask
+                value ^= player_keys[bit.bit_length() - 1]
+                mask ^= bit
+        return value
+
+    def canonical_key(self, player: str) -> int:
+        """
+        Transposition key shared by every rotation and reflection.
+
+        Equal to :meth:`Board.canonical_key` for the same position, but
+        read from the masks through lookup tables instead of the grid.
+        """
+        own = self.masks.get(player, 0)
+        other = self.occupied ^ own
+        encoding = min(values[own] + 2 * values[other] for values in SYMMETRY_VALUES)
+        return encoding << 2 * DIMENSION_BITS | _VARIANT
+
+    @property
+    def grid(self) -> List[List[Optional[str]]]:
+        """Return a list-of-lists view of the board, matching ``Board.grid``."""
+        grid: List[List[Optional[str]]] = [[None] * SIZE for _ in range(SIZE)]
+        for player, mask in self.masks.items():
+            for bit in range(SIZE * SIZE):
+                if mask >> bit & 1:
+                    grid[bit // SIZE][bit % SIZE] = player
+        return grid
+
+    def __str__(self) -> str:
+        """Return string representation of the board."""
+        lines = []
+        for i, row in enumerate(self.grid):
+            row_str = " | ".join(cell if cell is not None else " " for cell in row)
+            lines.append(f" {row_str} ")
+            if i < 2:
+                lines.append("-----------")
+        return "\n".join(lines)
+
+    def make_move(self, row: int, col: int, player: Optional[str] = None) -> bool:
+        """
+        Make a move on the board.
+
+        Args:
+            row: Row index (0-2)
+            col: Column index (0-2)
+            player: Player symbol ('X' or 'O'). If None, uses current_player
+
+        Returns:
+            True if move was successful, False if position is occupied
+        """
+        if not self.is_valid_position(row, col):
+            return False
+
+        bit = 1 << (row * SIZE + col)
+        if self.occupied & bit:
+            return False
+
+        player_symbol = player if player is not None else self.current_player
+        self.masks[player_symbol] = self.masks.get(player_symbol, 0) | bit
+        self.occupied |= bit
+
+        if player is None:
+            self.switch_player()
+
+        return True
+
+    def push(self, row: int, col: int, player: str):
+        """
+        Place a stone and record it on the undo stack.
+
+        Unlike :meth:`make_move` this does no validation and never switches
+        ``current_player``; see :meth:`Board.push`.
+
+        Args:
+            row: Row index of an empty cell
+            col: Column index of an empty cell
+            player: Player symbol to place
+        """
+        bit = 1 << (row * SIZE + col)
+        self.masks[player] = self.masks.get(player, 0) | bit
+        self.occupied |= bit
+        self._undo_stack.append((player, bit))
+
+    def pop(self) -> Tuple[int, int]:
+        """
+        Undo the most recent :meth:`push`.
+
+        Returns:
+            Tuple of (row, col) of the cell that was cleared
+        """
+        player, bit = self._undo_stack.pop()
+        self.masks[player] ^= bit
+        self.occupied ^= bit
+        index = bit.bit_length() - 1
+        return index // SIZE, index % SIZE
+
+    def is_valid_position(self, row: int, col: int) -> bool:
+        """Check if the given position is valid."""
+        return 0 <= row < SIZE and 0 <= col < SIZE
+
+    def is_position_empty(self, row: int, col: int) -> bool:
+        """Check if the given position is empty."""
+        if not self.is_valid_position(row, col):
+            return False
+        return not self.occupied >> (row * SIZE + col) & 1
+
+    def switch_player(self):
+        """Switch to the next player."""
+        self.current_player = "O" if self.current_player == "X" else "X"
+
+    def check_winner(self) -> Optional[str]:
+        """
+        Check if there's a winner.
+
+        Returns:
+            'X' or 'O' if there's a winner, None otherwise
+        """
+        for player, mask in self.masks.items():
+            if WINNING_MASKS[mask]:
+                return player
+        return None
+
+    def is_full(self) -> bool:
+        """Check if the board is full."""
+        return self.occupied == FULL_MASK
+
+    def is_game_over(self) -> bool:
+        """Check if the game is over (either someone won or board is full)."""
+        return self.check_winner() is not None or self.is_full()
+
+    def get_empty_positions(self) -> List[Tuple[int, int]]:
+        """Get all empty positions on the board."""
+        return list(EMPTY_POSITIONS[self.occupied])
+
+    def reset(self):
+        """Reset the board to initial state, starting a new game."""
+        self.masks = {}
+        self.occupied = 0
+        self.current_player = "X"
+        self._undo_stack = []
+        self.game_id = new_game_id()
+
+    def copy(self) -> "BitBoard":
+        """Create a copy of the current board."""
+        new_board = BitBoard()
+        new_board.masks = dict(self.masks)
+        new_board.occupied = self.occupied
+        new_board.current_player = self.current_player
+        new_board._undo_stack = self._undo_stack[:]
+        new_board.game_id = self.game_id
+        return new_board
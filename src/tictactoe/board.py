@@ -1,17 +1,178 @@
 """Tic-Tac-Toe game board implementation."""
 
-from typing import List, Optional, Tuple
+import itertools
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .transposition import canonical_key
+
+# Row/column steps of the four line directions: horizontal, vertical and the
+# two diagonals.
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# Fixed so that hashes agree between processes and runs.
+ZOBRIST_SEED = 0x7A0B215
+
+# Serial numbers identifying games; see Board.game_id.
+_game_ids = itertools.count(1)
+
+
+class _ZobristKeys(dict):
+    """Per-symbol key tables that are created on first use."""
+
+    def __init__(self, size: int):
+        super().__init__()
+        self.size = size
+
+    def __missing__(self, symbol: str) -> Tuple[int, ...]:
+        # String seeds hash deterministically, unlike most other objects.
+        rng = random.Random(f"{ZOBRIST_SEED}:{self.size}:{symbol}")
+        keys = self[symbol] = tuple(
+            rng.getrandbits(64) for _ in range(self.size * self.size)
+        )
+        return keys
+
+
+def new_game_id() -> int:
+    """Return a serial number for a new game; see :attr:`Board.game_id`."""
+    return next(_game_ids)
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(size: int) -> Dict[str, Tuple[int, ...]]:
+    """
+    Random 64-bit keys for Zobrist hashing on a ``size`` x ``size`` board.
+
+    Returns:
+        For each player symbol, one key per flat, row-major cell index
+    """
+    return _ZobristKeys(size)
+
+
+@lru_cache(maxsize=None)
+def winning_lines(size: int, win_length: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    List every run of ``win_length`` cells on a ``size`` x ``size`` board.
+
+    Returns:
+        One tuple of flat, row-major cell indices (row * size + col) per line
+    """
+    lines = []
+    for row in range(size):
+        for col in range(size):
+            for d_row, d_col in DIRECTIONS:
+                end_row = row + (win_length - 1) * d_row
+                end_col = col + (win_length - 1) * d_col
+                if 0 <= end_row < size and 0 <= end_col < size:
+                    lines.append(
+                        tuple(
+                            (row + i * d_row) * size + col + i * d_col
+                            for i in range(win_length)
+                        )
+                    )
+    return tuple(lines)
 
 
 class Board:
-    """Represents a Tic-Tac-Toe game board."""
+    """Represents an N x N Tic-Tac-Toe board with a K-in-a-row win rule."""
+
+    def __init__(self, size: int = 3, win_length: Optional[int] = None):
+        """
+        Initialize an empty board.
 
-    def __init__(self):
-        """Initialize an empty 3x3 board."""
+        Args:
+            size: Number of rows and columns (3 for classic Tic-Tac-Toe)
+            win_length: Stones in a row needed to win. Defaults to ``size``
+        """
+        if win_length is None:
+            win_length = size
+        if size < 1:
+            raise ValueError("Board size must be at least 1")
+        if not 1 <= win_length <= size:
+            raise ValueError("Win length must be between 1 and the board size")
+
+        self.size = size
+        self.win_length = win_length
         self.grid: List[List[Optional[str]]] = [
-            [None for _ in range(3)] for _ in range(3)
+            [None for _ in range(size)] for _ in range(size)
         ]
         self.current_player = "X"
+        self._winner: Optional[str] = None
+        self._filled = 0
+        self._undo_stack: List[Tuple[int, int, Optional[str]]] = []
+        self._zobrist_keys = zobrist_keys(size)
+        self._hash = 0
+        # Identifies the game being played on this board, so that players
+        # can tell a later move of the same game from a new game. Copies
+        # share it; reset() starts a new game.
+        self.game_id = new_game_id()
+
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        64-bit Zobrist hash of the stones on the board.
+
+        Kept up to date by every move, undo and reset, so reading it is
+        free. Equal positions on boards of the same size have equal hashes;
+        the side to move is not included.
+        """
+        return self._hash
+
+    @classmethod
+    def from_grid(
+        cls,
+        grid: List[List[Optional[str]]],
+        win_length: Optional[int] = None,
+        current_player: str = "X",
+    ) -> "Board":
+        """
+        Build a board holding the stones of ``grid`` without replaying moves.
+
+        The winner, stone count and hash are computed from the cells, so
+        the board is in the state the same stones played one by one would
+        leave it in, except that it has nothing to undo.
+
+        Args:
+            grid: Square list of rows of player symbols or None
+            win_length: Stones in a row needed to win. Defaults to the size
+            current_player: Symbol of the player to move
+
+        Returns:
+            The new board
+        """
+        board = cls(len(grid), win_length)
+        if any(len(row) != board.size for row in grid):
+            raise ValueError("Grid must be square")
+        board.grid = [list(row) for row in grid]
+        board.current_player = current_player
+        cells = [cell for row in board.grid for cell in row]
+        for index, cell in enumerate(cells):
+            if cell is not None:
+                board._filled += 1
+                board._hash ^= board._zobrist_keys[cell][index]
+        for line in winning_lines(board.size, board.win_length):
+            first = cells[line[0]]
+            if first is not None and all(cells[index] == first for index in line):
+                board._winner = first
+                break
+        return board
+
+    def canonical_key(self, player: str) -> int:
+        """
+        Transposition key shared by every rotation and reflection.
+
+        See :func:`tictactoe.transposition.canonical_key`.
+
+        Args:
+            player: Symbol whose stones are encoded as 1
+        """
+        return canonical_key(self.grid, player, self.win_length)
+
+    @property
+    def undo_count(self) -> int:
+        """Number of pushed moves that can still be undone with :meth:`pop`."""
+        return len(self._undo_stack)
 
     def __str__(self) -> str:
         """Return string representation of the board."""
@@ -19,8 +180,8 @@ class Board:
         for i, row in enumerate(self.grid):
             row_str = " | ".join(cell if cell is not None else " " for cell in row)
             lines.append(f" {row_str} ")
-            if i < 2:
-                lines.append("-----------")
+            if i < self.size - 1:
+                lines.append("-" * (4 * self.size - 1))
         return "\n".join(lines)
 
     def make_move(self, row: int, col: int, player: Optional[str] = None) -> bool:
@@ -28,8 +189,8 @@ class Board:
         Make a move on the board.
 
         Args:
-            row: Row index (0-2)
-            col: Column index (0-2)
+            row: Row index (0 to size - 1)
+            col: Column index (0 to size - 1)
             player: Player symbol ('X' or 'O'). If None, uses current_player
 
         Returns:
@@ -42,16 +203,81 @@ class Board:
             return False
 
         player_symbol = player if player is not None else self.current_player
-        self.grid[row][col] = player_symbol
+        self._place(row, col, player_symbol)
 
         if player is None:
             self.switch_player()
 
         return True
 
+    def push(self, row: int, col: int, player: str):
+        """
+        Place a stone and record it on the undo stack.
+
+        Unlike :meth:`make_move` this does no validation and never switches
+        ``current_player``; it is meant for search loops that immediately
+        undo the move with :meth:`pop`.
+
+        Args:
+            row: Row index of an empty cell
+            col: Column index of an empty cell
+            player: Player symbol to place
+        """
+        self._undo_stack.append((row, col, self._winner))
+        self._place(row, col, player)
+
+    def pop(self) -> Tuple[int, int]:
+        """
+        Undo the most recent :meth:`push`.
+
+        Returns:
+            Tuple of (row, col) of the cell that was cleared
+        """
+        row, col, self._winner = self._undo_stack.pop()
+        self._hash ^= self._zobrist_keys[self.grid[row][col]][row * self.size + col]
+        self.grid[row][col] = None
+        self._filled -= 1
+        return row, col
+
+    def _place(self, row: int, col: int, player: str):
+        """Place a stone and update the winner from the lines through it."""
+        self.grid[row][col] = player
+        self._filled += 1
+        self._hash ^= self._zobrist_keys[player][row * self.size + col]
+        if self._winner is None and self._completes_line(row, col, player):
+            self._winner = player
+
+    def _completes_line(self, row: int, col: int, player: str) -> bool:
+        """
+        Check whether the stone at (row, col) is part of a winning line.
+
+        Only the four lines through the cell are walked, and each walk stops
+        after ``win_length`` stones, so the check is O(win_length).
+        """
+        grid = self.grid
+        size = self.size
+        needed = self.win_length
+        for d_row, d_col in DIRECTIONS:
+            count = 1
+            r, c = row + d_row, col + d_col
+            while count < needed and 0 <= r < size and 0 <= c < size:
+                if grid[r][c] != player:
+                    break
+                count += 1
+                r, c = r + d_row, c + d_col
+            r, c = row - d_row, col - d_col
+            while count < needed and 0 <= r < size and 0 <= c < size:
+                if grid[r][c] != player:
+                    break
+                count += 1
+                r, c = r - d_row, c - d_col
+            if count >= needed:
+                return True
+        return False
+
     def is_valid_position(self, row: int, col: int) -> bool:
         """Check if the given position is valid."""
-        return 0 <= row < 3 and 0 <= col < 3
+        return 0 <= row < self.size and 0 <= col < self.size
 
     def is_position_empty(self, row: int, col: int) -> bool:
         """Check if the given position is empty."""
@@ -67,40 +293,17 @@ class Board:
         """
         Check if there's a winner.
 
+        The winner is tracked incrementally as stones are placed, so this is
+        a constant-time lookup.
+
         Returns:
             'X' or 'O' if there's a winner, None otherwise
         """
-        # Check rows
-        for row in self.grid:
-            if row[0] == row[1] == row[2] and row[0] is not None:
-                return row[0]
-
-        # Check columns
-        for col in range(3):
-            if (
-                self.grid[0][col] == self.grid[1][col] == self.grid[2][col]
-                and self.grid[0][col] is not None
-            ):
-                return self.grid[0][col]
-
-        # Check diagonals
-        if (
-            self.grid[0][0] == self.grid[1][1] == self.grid[2][2]
-            and self.grid[0][0] is not None
-        ):
-            return self.grid[0][0]
-
-        if (
-            self.grid[0][2] == self.grid[1][1] == self.grid[2][0]
-            and self.grid[0][2] is not None
-        ):
-            return self.grid[0][2]
-
-        return None
+        return self._winner
 
     def is_full(self) -> bool:
         """Check if the board is full."""
-        return all(cell is not None for row in self.grid for cell in row)
+        return self._filled == self.size * self.size
 
     def is_game_over(self) -> bool:
         """Check if the game is over (either someone won or board is full)."""
@@ -108,21 +311,31 @@ class Board:
 
     def get_empty_positions(self) -> List[Tuple[int, int]]:
         """Get all empty positions on the board."""
-        empty_positions = []
-        for row in range(3):
-            for col in range(3):
-                if self.grid[row][col] is None:
-                    empty_positions.append((row, col))
-        return empty_positions
+        return [
+            (row, col)
+            for row, cells in enumerate(self.grid)
+            for col, cell in enumerate(cells)
+            if cell is None
+        ]
 
     def reset(self):
-        """Reset the board to initial state."""
-        self.grid = [[None for _ in range(3)] for _ in range(3)]
+        """Reset the board to initial state, starting a new game."""
+        self.grid = [[None for _ in range(self.size)] for _ in range(self.size)]
         self.current_player = "X"
+        self._winner = None
+        self._filled = 0
+        self._undo_stack = []
+        self._hash = 0
+        self.game_id = new_game_id()
 
     def copy(self) -> "Board":
         """Create a copy of the current board."""
-        new_board = Board()
+        new_board = Board(self.size, self.win_length)
         new_board.grid = [row[:] for row in self.grid]
         new_board.current_player = self.current_player
+        new_board._winner = self._winner
+        new_board._filled = self._filled
+        new_board._undo_stack = self._undo_stack[:]
+        new_board._hash = self._hash
+        new_board.game_id = self.game_id
         return new_board
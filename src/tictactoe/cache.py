@@ -0,0 +1,185 @@
+"""Persistent cache of searched positions, kept in an SQLite file.
+
+:class:`AIPlayer` looks positions up here before searching and stores the
+result of every search it does run, so search work survives restarts. Each
+entry maps a position and the searching player's symbol to the best move,
+its score and the depth it was searched to; the least recently used
+entries are evicted once the file holds ``max_entries``.
+
+Several processes may share one cache file; SQLite serializes their
+writes. Within a process, one cache may be used from any thread.
+"""
+
+import sqlite3
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+from .board import Board
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    key TEXT PRIMARY KEY,
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    score REAL NOT NULL,
+    depth INTEGER NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS positions_used ON positions (used);
+CREATE TABLE IF NOT EXISTS stats (entries INTEGER NOT NULL);
+INSERT INTO stats SELECT 0 WHERE NOT EXISTS (SELECT * FROM stats);
+CREATE TRIGGER IF NOT EXISTS positions_insert AFTER INSERT ON positions
+    BEGIN UPDATE stats SET entries = entries + 1; END;
+CREATE TRIGGER IF NOT EXISTS positions_delete AFTER DELETE ON positions
+    BEGIN UPDATE stats SET entries = entries - 1; END;
+"""
+
+# Entries are stamped with an increasing use counter, shared by every
+# process using the file; the lowest stamps are evicted first.
+_NEXT_USE = "SELECT COALESCE(MAX(used), 0) + 1 FROM positions"
+
+
+class CacheEntry(NamedTuple):
+    """A cached search result, scored for the player who searched."""
+
+    move: Tuple[int, int]
+    score: float
+    depth: int
+
+
+def cache_key(board: Board, player: str) -> str:
+    """Key of a position searched by ``player``, e.g. ``'3 3 O X...O...'``."""
+    cells = "".join(cell or "." for row in board.grid for cell in row)
+    return f"{board.size} {board.win_length} {player} {cells}"
+
+
+class PositionCache:
+    """
+    Size-bounded, persistent map of positions to search results.
+
+    Entries are evicted in least-recently-used order once ``max_entries``
+    is reached. Every lookup updates the ``hits`` / ``misses`` counters.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Open ``path``, creating the cache file if needed.
+
+        Args:
+            path: Cache file
+            max_entries: Maximum number of entries kept before evicting
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # The connection is shared by every thread using the cache, one at
+        # a time.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+        except sqlite3.DatabaseError as error:
+            self._conn.close()
+            raise ValueError(f"{path!r} is not a position cache: {error}") from None
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        with self._lock:
+            return self._entries()
+
+    def _entries(self) -> int:
+        """Entry count; the caller holds the lock."""
+        return self._conn.execute("SELECT entries FROM stats").fetchone()[0]
+
+    def get(self, board: Board, player: str) -> Optional[CacheEntry]:
+        """
+        Look up a position, marking it as recently used.
+
+        Args:
+            board: Position to look up
+            player: Symbol of the player to move
+
+        Returns:
+            The cached entry, or None if the position is not cached
+        """
+        key = cache_key(board, player)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT row, col, score, depth FROM positions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                f"UPDATE positions SET used = ({_NEXT_USE}) WHERE key = ?", (key,)
+            )
+            self.hits += 1
+        score = row[2]
+        if score.is_integer():
+            score = int(score)
+        return CacheEntry((row[0], row[1]), score, row[3])
+
+    def put(
+        self,
+        board: Board,
+        player: str,
+        move: Tuple[int, int],
+        score: float,
+        depth: int,
+    ):
+        """
+        Cache a search result, evicting least recently used entries if full.
+
+        A result replaces a cached one only if it was searched at least as
+        deep.
+
+        Args:
+            board: Position that was searched
+            player: Symbol of the player to move
+            move: Best move found
+            score: Its score for ``player``
+            depth: Plies the search looked ahead
+        """
+        key = cache_key(board, player)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO positions VALUES (?, ?, ?, ?, ?, ({_NEXT_USE})) "
+                "ON CONFLICT (key) DO UPDATE SET row = excluded.row, "
+                "col = excluded.col, score = excluded.score, "
+                "depth = excluded.depth, used = excluded.used "
+                "WHERE excluded.depth >= positions.depth",
+                (key, move[0], move[1], score, depth),
+            )
+            excess = self._entries() - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM positions WHERE key IN "
+                    "(SELECT key FROM positions ORDER BY used LIMIT ?)",
+                    (excess,),
+                )
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM positions")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        """Close the cache file."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "PositionCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
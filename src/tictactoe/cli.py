@@ -2,19 +2,49 @@
 
 import argparse
 import sys
-from typing import Tuple
+from typing import Optional, Tuple
 
 from .ai import AIPlayer
+from .analysis import DEFAULT_CHUNK_SIZE, DEFAULT_NODE_LIMIT, analyze_lines
 from .board import Board
+from .cache import PositionCache
+from .engine import Engine
+from .mcts import MCTSPlayer
+from .ponder import Ponderer
+from .records import GameRecord, RecordWriter
+from .server import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_SESSION_TTL, serve
+from .tournament import ENGINES, run_tournament
 
 
 class CLI:
     """Command-line interface for the Tic-Tac-Toe game."""
 
-    def __init__(self):
-        """Initialize the CLI."""
+    def __init__(
+        self,
+        ai_player=None,
+        recorder: Optional[RecordWriter] = None,
+        ponder: bool = False,
+    ):
+        """
+        Initialize the CLI.
+
+        Args:
+            ai_player: Opponent for Human vs AI games; any object with
+                ``get_best_move(board)`` such as ``AIPlayer`` or
+                ``MCTSPlayer``. Defaults to a hard ``AIPlayer``
+            recorder: Writer that every finished game is appended to
+            ponder: Let an ``AIPlayer`` search its replies while the human
+                thinks
+        """
         self.board = Board()
-        self.ai_player = AIPlayer()
+        self.ai_player = ai_player if ai_player is not None else AIPlayer()
+        self.recorder = recorder
+        self.moves = []
+        self.ponderer: Optional[Ponderer] = (
+            Ponderer(self.ai_player)
+            if ponder and isinstance(self.ai_player, AIPlayer)
+            else None
+        )
 
     def display_board(self):
         """Display the current board state."""
@@ -78,9 +108,11 @@ class CLI:
             self.display_board()
             row, col = self.get_user_move()
             self.board.make_move(row, col)
+            self.moves.append((row, col))
 
         self.display_board()
         self.show_game_result()
+        self.record_game("human", "human")
 
     def play_human_vs_ai(self):
         """Play a human vs AI game."""
@@ -88,22 +120,41 @@ class CLI:
         print("You are X, AI is O")
         print("Enter moves as 'row,col' where both row and col are between 0-2")
 
+        expected = None
         while not self.board.is_game_over():
             self.display_board()
 
             if self.board.current_player == "X":
                 # Human turn
-                row, col = self.get_user_move()
+                if self.ponderer is not None:
+                    self.ponderer.start(self.board, expected)
+                try:
+                    row, col = self.get_user_move()
+                finally:
+                    if self.ponderer is not None:
+                        self.ponderer.stop()
                 self.board.make_move(row, col)
+                self.moves.append((row, col))
             else:
                 # AI turn
                 print("AI is thinking...")
-                row, col = self.ai_player.get_best_move(self.board)
+                move = None
+                if self.ponderer is not None:
+                    move = self.ponderer.take(self.board)
+                if move is None:
+                    move = self.ai_player.get_best_move(self.board)
+                row, col = move
+                if self.ponderer is not None:
+                    line = self.ai_player.principal_variation(self.board, move, 2)
+                    expected = line[1] if len(line) > 1 else None
                 print(f"AI plays: {row},{col}")
                 self.board.make_move(row, col)
+                self.moves.append((row, col))
 
         self.display_board()
         self.show_game_result()
+        ai_name = getattr(self.ai_player, "difficulty", type(self.ai_player).__name__)
+        self.record_game("human", f"ai-{ai_name}")
 
     def show_game_result(self):
         """Display the final game result."""
@@ -113,6 +164,21 @@ class CLI:
         else:
             print("🤝 It's a tie!")
 
+    def record_game(self, player_x: str, player_o: str):
+        """Append the finished game to the recorder, if there is one."""
+        if self.recorder is not None:
+            self.recorder.write(
+                GameRecord(
+                    self.board.size,
+                    self.board.win_length,
+                    tuple(self.moves),
+                    self.board.check_winner(),
+                    player_x,
+                    player_o,
+                )
+            )
+            self.recorder.flush()
+
     def show_menu(self):
         """Display the main menu and get user choice."""
         print("\n=== Tic-Tac-Toe Game ===")
@@ -141,9 +207,11 @@ class CLI:
 
             if choice == 1:
                 self.board.reset()
+                self.moves = []
                 self.play_human_vs_human()
             elif choice == 2:
                 self.board.reset()
+                self.moves = []
                 self.play_human_vs_ai()
             elif choice == 3:
                 print("Thanks for playing! Goodbye!")
@@ -164,6 +232,28 @@ class CLI:
                 break
 
 
+def analyze(path: str, node_limit: Optional[int], workers: int, chunk_size: int) -> int:
+    """
+    Stream the analysis of the positions in ``path`` ('-' for stdin).
+
+    Returns:
+        Exit status: 1 if any line could not be analysed, else 0
+    """
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    errors = 0
+    try:
+        for result in analyze_lines(stream, node_limit, workers, chunk_size):
+            if result.error is None:
+                print(result.output)
+            else:
+                errors += 1
+                print(f"line {result.line_number}: {result.error}", file=sys.stderr)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return 1 if errors else 0
+
+
 def main():
     """Main entry point for the CLI application."""
     parser = argparse.ArgumentParser(
@@ -172,7 +262,15 @@ def main():
         epilog="""
 Examples:
   tictactoe            # Start interactive game
+  tictactoe --record games.rec   # Append finished games to a record file
+  tictactoe --cache ai.cache     # Keep AI search results across runs
+  tictactoe --ponder             # AI thinks on your time
+  tictactoe --ai mcts --mcts-iterations 5000   # Monte Carlo opponent
   tictactoe --help     # Show this help message
+  tictactoe tournament hard medium --games 10000 --workers 4
+  tictactoe serve --port 8000   # JSON API on http://127.0.0.1:8000
+  tictactoe engine              # UCI-style protocol on stdin/stdout
+  tictactoe analyze positions.txt --workers 4 > analysis.tsv
 
 Game Modes:
   1. Human vs Human - Two players take turns
@@ -190,15 +288,155 @@ AI Difficulty Levels:
         action="version",
         version="tic-tac-toe 0.1.0"
     )
+    parser.add_argument(
+        "--record", metavar="FILE", help="Append finished games to a record file"
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        help="Keep AI search results in a persistent cache file",
+    )
+    parser.add_argument(
+        "--ponder",
+        action="store_true",
+        help="Let the AI think about its replies while you think",
+    )
+    parser.add_argument(
+        "--ai",
+        choices=("minimax", "mcts"),
+        default="minimax",
+        help="Search used by the AI opponent (default: minimax)",
+    )
+    parser.add_argument(
+        "--mcts-iterations",
+        type=int,
+        default=1000,
+        metavar="N",
+        help="Playouts per move for the mcts opponent (default: 1000)",
+    )
 
-    parser.parse_args()
+    subparsers = parser.add_subparsers(dest="command")
+    tournament_parser = subparsers.add_parser(
+        "tournament",
+        help="Play AI-vs-AI games and report results",
+        description="Play AI-vs-AI games between two engines, alternating "
+        "who moves first, and report win/draw/loss rates, games per second "
+        "and per-move latency percentiles.",
+    )
+    tournament_parser.add_argument("engine_a", choices=ENGINES)
+    tournament_parser.add_argument("engine_b", choices=ENGINES)
+    tournament_parser.add_argument("--games", type=int, default=1000)
+    tournament_parser.add_argument("--workers", type=int, default=1)
+    tournament_parser.add_argument("--seed", type=int, default=0)
+    tournament_parser.add_argument("--size", type=int, default=3)
+    tournament_parser.add_argument("--win-length", type=int, default=None)
+    tournament_parser.add_argument(
+        "--record", metavar="FILE", help="Append every game to a record file"
+    )
 
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Host games over an HTTP JSON API",
+        description="Host many concurrent games in memory behind an HTTP "
+        "JSON API. AI moves are computed in worker processes.",
+    )
+    serve_parser.add_argument("--host", default=DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument("--workers", type=int, default=None)
+    serve_parser.add_argument("--session-ttl", type=float, default=DEFAULT_SESSION_TTL)
+    serve_parser.add_argument("--ai-time-limit", type=float, default=1.0)
+    serve_parser.add_argument(
+        "--shared-tt-size",
+        type=int,
+        default=0,
+        help="Entries in a transposition table shared by all AI workers "
+        "(default: 0, one table per worker)",
+    )
+    serve_parser.add_argument(
+        "--cache", metavar="FILE", help="Persistent position cache for the AI"
+    )
+
+    subparsers.add_parser(
+        "engine",
+        help="Speak a UCI-style engine protocol on stdin/stdout",
+        description="Read engine commands (uci, position, go, stop, ...) "
+        "from stdin and answer on stdout, keeping the AI warm between games.",
+    )
+
+    analyze_parser = subparsers.add_parser(
+        "analyze",
+        help="Analyse positions read one per line",
+        description="Read positions in text notation (e.g. X.O/.X./...), one "
+        "per line, and write the best move, score and principal variation "
+        "of each as tab-separated lines, in input order.",
+    )
+    analyze_parser.add_argument(
+        "input", nargs="?", default="-", help="Input file (default: stdin)"
+    )
+    analyze_parser.add_argument("--workers", type=int, default=1)
+    analyze_parser.add_argument(
+        "--nodes",
+        type=int,
+        default=DEFAULT_NODE_LIMIT,
+        help="Search nodes per position; 0 searches to the end",
+    )
+    analyze_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    args = parser.parse_args()
+
+    if args.command == "tournament":
+        result = run_tournament(
+            args.engine_a,
+            args.engine_b,
+            args.games,
+            workers=args.workers,
+            seed=args.seed,
+            size=args.size,
+            win_length=args.win_length,
+            record=args.record,
+        )
+        print(result.format())
+        return
+    if args.command == "serve":
+        serve(
+            args.host,
+            args.port,
+            workers=args.workers,
+            session_ttl=args.session_ttl,
+            ai_time_limit=args.ai_time_limit,
+            shared_tt_size=args.shared_tt_size,
+            cache_path=args.cache,
+        )
+        return
+    if args.command == "engine":
+        Engine().run()
+        return
+    if args.command == "analyze":
+        sys.exit(analyze(args.input, args.nodes or None, args.workers, args.chunk_size))
+
+    if args.ai == "mcts":
+        if args.cache or args.ponder:
+            parser.error("--cache and --ponder only apply to the minimax AI")
+        if args.mcts_iterations < 1:
+            parser.error("--mcts-iterations must be at least 1")
+
+    recorder = RecordWriter(args.record) if args.record else None
+    cache = PositionCache(args.cache) if args.cache else None
+    if args.ai == "mcts":
+        ai_player = MCTSPlayer(iterations=args.mcts_iterations)
+    else:
+        ai_player = AIPlayer(cache=cache)
     try:
-        cli = CLI()
+        cli = CLI(ai_player=ai_player, recorder=recorder, ponder=args.ponder)
         cli.run()
     except KeyboardInterrupt:
         print("\nGame interrupted. Goodbye!")
         sys.exit(0)
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
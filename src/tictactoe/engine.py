@@ -0,0 +1,293 @@
+"""Line-oriented, UCI-style engine protocol over stdin/stdout.
+
+One process serves any number of games, so the AI's transposition table
+stays warm between them. Commands, one per line::
+
+    uci                              -> id ..., option ..., uciok
+    isready                          -> readyok
+    setoption name <name> value <v>  Difficulty (easy|medium|hard),
+                                     Hash (table entries), MoveTime (ms)
+    ucinewgame                       Start a new game (caches are kept)
+    position startpos [size N] [k K] [moves a1 b2 ...]
+    position board <notation> [moves a1 b2 ...]
+    go [movetime MS] [nodes N] [infinite] [ponder]
+        -> info depth D nodes N time MS score (cp C | mate P) pv a1 b2 ...
+        -> bestmove b2 [ponder a1]
+    stop                             End the search and report its best move
+    ponderhit                        The pondered move was played: keep
+                                     searching as a normal search
+    quit
+
+Positions use the notation of :mod:`tictactoe.position`, e.g.
+``X.O/.X./...``, and cells are named like ``b2``. Search runs in a
+background thread, so ``stop``, ``ponderhit`` and ``isready`` are answered
+while the engine is thinking. ``go`` without limits searches for at most
+``MoveTime`` milliseconds. Scores are from the side to move: ``mate P``
+means a forced win (or loss, if negative) within P plies, ``cp C`` a
+heuristic estimate in hundredths.
+"""
+
+import sys
+import threading
+import time
+from typing import List, Optional, TextIO
+
+from . import __author__, __version__
+from .ai import AIPlayer
+from .board import Board
+from .position import Position, cell_name, parse_cell
+from .transposition import DEFAULT_MAX_SIZE
+
+DEFAULT_MOVE_TIME_MS = 1000
+
+
+def score_text(score: Optional[float], board: Board) -> Optional[str]:
+    """
+    Format a hard-mode search score for the protocol.
+
+    Args:
+        score: ``AIPlayer.last_score`` after searching ``board``
+        board: Board that was searched
+
+    Returns:
+        ``mate P`` for a forced result within P plies, ``cp C`` otherwise,
+        or None when there is no score
+    """
+    if score is None:
+        return None
+    win_score = board.size * board.size + 1
+    if score >= 1:
+        return f"mate {int(win_score - score + 1)}"
+    if score <= -1:
+        return f"mate -{int(win_score + score + 1)}"
+    return f"cp {round(score * 100)}"
+
+
+class Engine:
+    """Protocol state machine driving one long-lived :class:`AIPlayer`."""
+
+    def __init__(self, output: Optional[TextIO] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            output: Stream that replies are written to. Defaults to stdout
+        """
+        self.output = sys.stdout if output is None else output
+        self.ai = AIPlayer("hard", search="iterative")
+        self.board = Board()
+        self.move_time = DEFAULT_MOVE_TIME_MS / 1000
+        self._output_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._release = threading.Event()
+        self._timer: Optional[threading.Timer] = None
+        self._ponder_time: Optional[float] = None
+
+    def run(self, stream: Optional[TextIO] = None):
+        """Answer commands from ``stream`` (stdin) until ``quit`` or end of input."""
+        for line in sys.stdin if stream is None else stream:
+            if not self.handle(line):
+                return
+        # At end of input let a timed search run out; stop an open-ended one.
+        if self._release.is_set():
+            self.wait()
+        self._finish_search()
+
+    def handle(self, line: str) -> bool:
+        """
+        Execute one command line.
+
+        Returns:
+            False after ``quit``, True otherwise
+        """
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, args = tokens[0], tokens[1:]
+
+        if command == "quit":
+            self._finish_search()
+            return False
+        if command == "isready":
+            self.send("readyok")
+        elif command == "stop":
+            self._finish_search()
+        elif command == "ponderhit":
+            self._ponderhit()
+        elif command == "uci":
+            self.send(f"id name tictactoe {__version__}")
+            self.send(f"id author {__author__}")
+            self.send("option name Difficulty type combo default hard")
+            self.send(f"option name Hash type spin default {DEFAULT_MAX_SIZE}")
+            self.send(f"option name MoveTime type spin default {DEFAULT_MOVE_TIME_MS}")
+            self.send("uciok")
+        else:
+            handler = {
+                "setoption": self._setoption,
+                "ucinewgame": self._new_game,
+                "position": self._position,
+                "go": self._go,
+            }.get(command)
+            if handler is None:
+                self.send(f"info string unknown command {command}")
+                return True
+            self._finish_search()
+            try:
+                handler(args)
+            except ValueError as error:
+                self.send(f"info string error {error}")
+        return True
+
+    def send(self, line: str):
+        """Write one reply line."""
+        with self._output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def wait(self):
+        """Block until a running search, if any, has reported its move."""
+        if self._thread is not None:
+            self._thread.join()
+
+    def _setoption(self, args: List[str]):
+        text = " ".join(args)
+        if not text.startswith("name ") or " value " not in text:
+            raise ValueError("expected: setoption name <name> value <value>")
+        name, value = text[len("name ") :].split(" value ", 1)
+        name = name.strip().lower()
+        if name == "difficulty":
+            self.ai.set_difficulty(value.strip())
+        elif name == "hash":
+            size = int(value)
+            self.ai = AIPlayer(self.ai.difficulty, tt_size=size, search="iterative")
+        elif name == "movetime":
+            self.move_time = int(value) / 1000
+        else:
+            raise ValueError(f"unknown option {name}")
+
+    def _new_game(self, _args: List[str]):
+        self.board = Board()
+
+    def _position(self, args: List[str]):
+        if not args:
+            raise ValueError("expected: position startpos|board ...")
+        moves: List[str] = []
+        if "moves" in args:
+            index = args.index("moves")
+            args, moves = args[:index], args[index + 1 :]
+        if args[0] == "startpos":
+            options = dict(zip(args[1::2], args[2::2]))
+            size = int(options.get("size", 3))
+            win_length = int(options["k"]) if "k" in options else None
+            board = Board(size, win_length)
+        elif args[0] == "board" and len(args) == 2:
+            board = Position.from_notation(args[1]).to_board()
+        else:
+            raise ValueError("expected: position startpos|board ...")
+        for name in moves:
+            row, col = parse_cell(name, board.size)
+            if board.is_game_over() or not board.make_move(row, col):
+                raise ValueError(f"illegal move {name}")
+        # Positions sent between two ucinewgame commands belong to one game,
+        # so the player keeps its search context from move to move.
+        if (board.size, board.win_length) == (self.board.size, self.board.win_length):
+            board.game_id = self.board.game_id
+        self.board = board
+
+    def _go(self, args: List[str]):
+        if self.board.is_game_over():
+            raise ValueError("game is over")
+        options = {}
+        flags = set()
+        tokens = iter(args)
+        for token in tokens:
+            if token in ("infinite", "ponder"):
+                flags.add(token)
+            elif token in ("movetime", "nodes"):
+                options[token] = int(next(tokens, ""))
+            else:
+                raise ValueError(f"unknown go parameter {token}")
+
+        self.ai.set_limits(node_limit=options.get("nodes"))
+        move_time = self.move_time
+        if "movetime" in options:
+            move_time = options["movetime"] / 1000
+        elif "nodes" in options:
+            move_time = None
+
+        self._stop = threading.Event()
+        self._release = threading.Event()
+        self._ponder_time = None
+        if "ponder" in flags:
+            # The clock starts when the predicted move is actually played.
+            self._ponder_time = move_time
+        elif "infinite" not in flags:
+            self._release.set()
+            self._start_timer(move_time)
+
+        board = self.board.copy()
+        self._thread = threading.Thread(
+            target=self._search, args=(board, self._stop, self._release), daemon=True
+        )
+        self._thread.start()
+
+    def _start_timer(self, seconds: Optional[float]):
+        if seconds is not None:
+            self._timer = threading.Timer(seconds, self._stop.set)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _ponderhit(self):
+        if self._thread is None or self._release.is_set():
+            return
+        self._start_timer(self._ponder_time)
+        self._release.set()
+
+    def _finish_search(self):
+        """Stop a running search and wait for its ``bestmove``."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._release.set()
+        self._thread.join()
+        self._thread = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _search(self, board: Board, stop: threading.Event, release: threading.Event):
+        """Search thread: find a move, wait until it may be reported, report it."""
+        ai = self.ai
+        ai.set_symbols(
+            board.current_player, "O" if board.current_player == "X" else "X"
+        )
+        start = time.perf_counter()
+        move = ai.get_best_move(board, stop=stop)
+        elapsed = time.perf_counter() - start
+        # Infinite and ponder searches report only once told to.
+        release.wait()
+
+        line = [move]
+        if ai.difficulty == "hard":
+            line = ai.principal_variation(board, move)
+        info = [
+            f"info depth {max(ai.search_depth, 1)}",
+            f"nodes {ai.nodes_searched}",
+            f"time {round(elapsed * 1000)}",
+        ]
+        score = score_text(ai.last_score, board) if ai.difficulty == "hard" else None
+        if score is not None:
+            info.append(f"score {score}")
+        info.append("pv " + " ".join(cell_name(*cell) for cell in line))
+        self.send(" ".join(info))
+
+        reply = f"bestmove {cell_name(*move)}"
+        if len(line) > 1:
+            reply += f" ponder {cell_name(*line[1])}"
+        self.send(reply)
+
+
+def main():
+    """Run the engine on stdin/stdout."""
+    Engine().run()
@@ -0,0 +1,255 @@
+"""Monte Carlo Tree Search player for Tic-Tac-Toe on boards of any size."""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .board import Board
+
+Move = Tuple[int, int]
+# Per-move (visits, wins) at the root of one search tree.
+RootStats = Dict[Move, Tuple[int, float]]
+
+
+class Node:
+    """A node of the search tree, reached by ``move`` played by ``player``."""
+
+    __slots__ = ("move", "player", "parent", "children", "untried", "visits", "wins")
+
+    def __init__(
+        self,
+        move: Optional[Move],
+        player: Optional[str],
+        parent: Optional["Node"],
+        untried: List[Move],
+    ):
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children: List["Node"] = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+    def select_child(self, exploration: float) -> "Node":
+        """Pick the child with the highest UCT score."""
+        log_visits = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda child: child.wins / child.visits
+            + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+
+def search(
+    board: Board,
+    player: str,
+    opponent: str,
+    iterations: Optional[int],
+    time_limit: Optional[float],
+    exploration: float,
+    seed: Optional[int],
+) -> RootStats:
+    """
+    Grow one UCT search tree from ``board`` with ``player`` to move.
+
+    Each iteration selects a leaf by UCT, expands one untried move, plays a
+    uniformly random game to the end and backs the result up the path. The
+    board is modified in place and restored before returning.
+
+    Args:
+        board: Position to search
+        player: Symbol of the player to move
+        opponent: Symbol of the other player
+        iterations: Number of playouts, or None to run until ``time_limit``
+        time_limit: Seconds to search, or None to run ``iterations`` playouts
+        exploration: UCT exploration constant
+        seed: Seed for the playout RNG
+
+    Returns:
+        Visits and wins of every root move
+    """
+    rng = random.Random(seed)
+    next_player = {player: opponent, opponent: player}
+    root = Node(None, opponent, None, board.get_empty_positions())
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    done = 0
+
+    while (iterations is None or done < iterations) and (
+        deadline is None or time.perf_counter() < deadline
+    ):
+        done += 1
+        node = root
+        pushed = 0
+
+        # Selection
+        while not node.untried and node.children:
+            node = node.select_child(exploration)
+            board.push(node.move[0], node.move[1], node.player)
+            pushed += 1
+
+        # Expansion
+        if node.untried and board.check_winner() is None:
+            move = node.untried.pop(rng.randrange(len(node.untried)))
+            mover = next_player[node.player]
+            board.push(move[0], move[1], mover)
+            pushed += 1
+            child = Node(move, mover, node, board.get_empty_positions())
+            node.children.append(child)
+            node = child
+
+        # Playout
+        mover = node.player
+        empty = board.get_empty_positions()
+        rng.shuffle(empty)
+        for row, col in empty:
+            if board.check_winner() is not None:
+                break
+            mover = next_player[mover]
+            board.push(row, col, mover)
+            pushed += 1
+        winner = board.check_winner()
+        for _ in range(pushed):
+            board.pop()
+
+        # Backpropagation
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.player:
+                node.wins += 1.0
+            node = node.parent
+
+    return {child.move: (child.visits, child.wins) for child in root.children}
+
+
+def _search_worker(args: tuple) -> RootStats:
+    """Process-pool entry point for :func:`search`."""
+    return search(*args)
+
+
+class MCTSPlayer:
+    """
+    AI player that chooses moves by Monte Carlo Tree Search.
+
+    Unlike :class:`AIPlayer` it needs no evaluation function and its cost is
+    set by the playout budget rather than the game-tree depth, so it scales
+    to large boards. With ``workers > 1`` independent trees are grown in a
+    process pool and their root statistics are merged (root parallelism);
+    the pool is started on first use and kept until :meth:`close`.
+    """
+
+    def __init__(
+        self,
+        iterations: Optional[int] = 1000,
+        time_limit: Optional[float] = None,
+        workers: int = 1,
+        exploration: float = math.sqrt(2),
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize MCTS player.
+
+        Args:
+            iterations: Playouts per move, split across workers (None for
+                no limit; then ``time_limit`` is required)
+            time_limit: Seconds per move, or None for no time limit
+            workers: Number of processes growing search trees
+            exploration: UCT exploration constant
+            seed: Seed for reproducible playouts
+        """
+        if iterations is None and time_limit is None:
+            raise ValueError("Either iterations or time_limit must be set")
+        if iterations is not None and iterations < 1:
+            raise ValueError("Iterations must be at least 1")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Time limit must be positive")
+        if workers < 1:
+            raise ValueError("Workers must be at least 1")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.workers = workers
+        self.exploration = exploration
+        self.player_symbol = "O"
+        self.opponent_symbol = "X"
+        self._rng = random.Random(seed)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "MCTSPlayer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def get_best_move(self, board: Board) -> Tuple[int, int]:
+        """
+        Get the most visited move after searching.
+
+        Args:
+            board: Current game board
+
+        Returns:
+            Tuple of (row, col) representing the best move
+        """
+        empty_positions = board.get_empty_positions()
+        if len(empty_positions) == 1:
+            return empty_positions[0]
+
+        seeds = [self._rng.getrandbits(64) for _ in range(self.workers)]
+        if self.workers == 1:
+            stats = [search(*self._search_args(board, self.iterations, seeds[0]))]
+        else:
+            share = None
+            if self.iterations is not None:
+                share = max(1, -(-self.iterations // self.workers))
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            stats = list(
+                self._pool.map(
+                    _search_worker,
+                    [self._search_args(board, share, seed) for seed in seeds],
+                )
+            )
+
+        totals: Dict[Move, int] = {}
+        for root_stats in stats:
+            for move, (visits, _) in root_stats.items():
+                totals[move] = totals.get(move, 0) + visits
+        return max(empty_positions, key=lambda move: totals.get(move, 0))
+
+    def _search_args(self, board: Board, iterations: Optional[int], seed: int):
+        """Arguments for one call of :func:`search`."""
+        return (
+            board.copy(),
+            self.player_symbol,
+            self.opponent_symbol,
+            iterations,
+            self.time_limit,
+            self.exploration,
+            seed,
+        )
+
+    def set_symbols(self, ai_symbol: str, opponent_symbol: str):
+        """
+        Set the symbols for AI and opponent.
+
+        Args:
+            ai_symbol: Symbol for AI player
+            opponent_symbol: Symbol for opponent
+        """
+        self.player_symbol = ai_symbol
+        self.opponent_symbol = opponent_symbol
@@ -0,0 +1,134 @@
+"""Pondering: searching on the opponent's time.
+
+While the opponent thinks, a :class:`Ponderer` searches the AI's reply to
+each of the opponent's moves in a background thread, starting with the
+move the AI expects. When the opponent moves, a reply that was already
+searched is returned at once; otherwise the AI searches as usual, with a
+transposition table warmed by the pondering.
+"""
+
+import logging
+import threading
+from typing import Dict, Hashable, Optional, Tuple
+
+from .ai import AIPlayer, SearchCancelled, move_priorities, position_key
+from .board import Board
+
+logger = logging.getLogger(__name__)
+
+
+class Ponderer:
+    """
+    Background search of a player's replies to the opponent's moves.
+
+    The player must not be used by anyone else while pondering; every
+    method stops the background search before returning, so the caller may
+    use the player again afterwards. ``hits`` counts the replies served
+    from pondering.
+    """
+
+    def __init__(self, ai: AIPlayer):
+        """
+        Initialize the ponderer.
+
+        Args:
+            ai: Player whose replies are searched, with its own settings
+        """
+        self.ai = ai
+        self.hits = 0
+        self.results: Dict[Hashable, Tuple[Tuple[int, int], Optional[float], int]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, board: Board, expected: Optional[Tuple[int, int]] = None):
+        """
+        Start searching the replies to every move on ``board``.
+
+        Only hard players search, so others are not pondered.
+
+        Args:
+            board: Position with the opponent to move; it is not modified
+            expected: The opponent's most likely move, searched first
+        """
+        self.stop()
+        self.results = {}
+        if self.ai.difficulty != "hard" or board.is_game_over():
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._ponder, args=(board.copy(), expected, self._stop), daemon=True
+        )
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for every reply to be searched.
+
+        Returns:
+            True if pondering finished, False if ``timeout`` expired first
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                return False
+        return True
+
+    def stop(self):
+        """Stop pondering and wait for the search to notice."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def take(self, board: Board) -> Optional[Tuple[int, int]]:
+        """
+        Stop pondering and return the pondered reply for ``board``.
+
+        On a hit the player's ``last_score`` and ``search_depth`` are set as
+        if it had just searched ``board``.
+
+        Args:
+            board: Position after the opponent's actual move
+
+        Returns:
+            The reply, or None if its search did not finish in time
+        """
+        self.stop()
+        result = self.results.pop(position_key(board), None)
+        if result is None:
+            return None
+        self.hits += 1
+        move, self.ai.last_score, self.ai.search_depth = result
+        return move
+
+    def _ponder(self, board: Board, expected, stop: threading.Event):
+        """Thread body: search the reply to each opponent move until stopped."""
+        priorities = move_priorities(board.size, board.win_length)
+        moves = sorted(board.get_empty_positions(), key=priorities.__getitem__)
+        if expected in moves:
+            moves.remove(expected)
+            moves.insert(0, expected)
+        ai = self.ai
+        for move in moves:
+            position = board.copy()
+            position.make_move(*move)
+            if position.is_game_over():
+                continue
+            try:
+                reply = ai.get_best_move(position, stop)
+            except SearchCancelled:
+                return
+            except Exception:
+                # Pondering is only a head start; the reply is searched as
+                # usual once the opponent has moved.
+                logger.exception("Pondering stopped by an error")
+                return
+            # A budgeted search returns its best move so far when stopped,
+            # which is not the move it would have found.
+            if stop.is_set():
+                return
+            self.results[position_key(position)] = (
+                reply,
+                ai.last_score,
+                ai.search_depth,
+            )
@@ -0,0 +1,281 @@
+"""Compact, immutable Tic-Tac-Toe positions packed into one integer.
+
+Positions also have a one-token text notation: the rows from top to bottom
+joined by '/', with 'X', 'O' or '.' per cell, and the win length appended
+after ':' when it differs from the board size. For example ``X.O/.X./...``
+or ``..../.X../..O./....:3``. Cells are named like ``b3``: the column as a
+letter from 'a' and the row as a number from 1, counting from the top left.
+"""
+
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+from .board import Board, winning_lines
+
+# Bit layout of Position.packed, from the least significant bit:
+#   8 bits board size | 8 bits win length | size*size bits X | size*size bits O
+_DIMENSION_BITS = 8
+_HEADER_BITS = 2 * _DIMENSION_BITS
+_DIMENSION_MASK = (1 << _DIMENSION_BITS) - 1
+MAX_SIZE = _DIMENSION_MASK
+
+
+def cell_name(row: int, col: int) -> str:
+    """Name of the cell at (row, col), e.g. ``a1`` for (0, 0)."""
+    return f"{chr(ord('a') + col)}{row + 1}"
+
+
+def parse_cell(name: str, size: int) -> Tuple[int, int]:
+    """
+    Parse a cell name such as ``b3``.
+
+    Args:
+        name: Column letter followed by a 1-based row number
+        size: Board size the cell must lie on
+
+    Returns:
+        Tuple of (row, col)
+    """
+    name = name.strip().lower()
+    if len(name) < 2 or not "a" <= name[0] <= "z" or not name[1:].isdigit():
+        raise ValueError(f"Invalid cell {name!r}; expected e.g. 'b2'")
+    row, col = int(name[1:]) - 1, ord(name[0]) - ord("a")
+    if not (0 <= row < size and 0 <= col < size):
+        raise ValueError(f"Cell {name!r} is off the {size}x{size} board")
+    return row, col
+
+
+@lru_cache(maxsize=None)
+def line_masks(size: int, win_length: int) -> Tuple[int, ...]:
+    """Bitmask of every winning line on a ``size`` x ``size`` board."""
+    return tuple(
+        sum(1 << cell for cell in line) for line in winning_lines(size, win_length)
+    )
+
+
+class Position:
+    """
+    Immutable snapshot of the stones on a board.
+
+    The whole position (size, win length and one bitmask per player) lives in
+    a single integer, so a position costs a few dozen bytes and millions fit
+    comfortably in a set or as dict keys. Cell (row, col) maps to bit
+    ``row * size + col`` of each mask.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, packed: int):
+        """
+        Wrap a packed integer, as returned by :attr:`packed`.
+
+        Use :meth:`from_board` or :meth:`from_masks` to build positions.
+        """
+        size = packed & _DIMENSION_MASK
+        win_length = packed >> _DIMENSION_BITS & _DIMENSION_MASK
+        cells = size * size
+        if size < 1 or not 1 <= win_length <= size:
+            raise ValueError("Invalid board dimensions in packed position")
+        x_mask = packed >> _HEADER_BITS & ((1 << cells) - 1)
+        o_mask = packed >> (_HEADER_BITS + cells)
+        if x_mask & o_mask or o_mask >> cells:
+            raise ValueError("Invalid stones in packed position")
+        object.__setattr__(self, "_packed", packed)
+
+    @classmethod
+    def from_masks(
+        cls, size: int, x_mask: int, o_mask: int, win_length: Optional[int] = None
+    ) -> "Position":
+        """
+        Build a position from one bitmask per player.
+
+        Args:
+            size: Number of rows and columns
+            x_mask: Bits of the cells holding X
+            o_mask: Bits of the cells holding O
+            win_length: Stones in a row needed to win. Defaults to ``size``
+
+        Returns:
+            The position
+        """
+        if win_length is None:
+            win_length = size
+        if not 1 <= size <= MAX_SIZE:
+            raise ValueError(f"Board size must be between 1 and {MAX_SIZE}")
+        if not 1 <= win_length <= size:
+            raise ValueError("Win length must be between 1 and the board size")
+        cells = size * size
+        if x_mask < 0 or o_mask < 0 or (x_mask | o_mask) >> cells:
+            raise ValueError("Masks must only use the board's cells")
+        if x_mask & o_mask:
+            raise ValueError("A cell cannot hold both X and O")
+        return cls(
+            size
+            | win_length << _DIMENSION_BITS
+            | x_mask << _HEADER_BITS
+            | o_mask << (_HEADER_BITS + cells)
+        )
+
+    @classmethod
+    def from_board(cls, board: Board) -> "Position":
+        """
+        Snapshot a board's stones.
+
+        Args:
+            board: Board holding only 'X' and 'O' stones
+
+        Returns:
+            The position
+        """
+        x_mask = o_mask = 0
+        bit = 1
+        for row in board.grid:
+            for cell in row:
+                if cell == "X":
+                    x_mask |= bit
+                elif cell == "O":
+                    o_mask |= bit
+                elif cell is not None:
+                    raise ValueError(f"Unsupported symbol {cell!r}")
+                bit <<= 1
+        return cls.from_masks(board.size, x_mask, o_mask, board.win_length)
+
+    @classmethod
+    def from_notation(cls, text: str) -> "Position":
+        """
+        Parse a position such as ``X.O/.X./...`` or ``..../..../..../....:3``.
+
+        Returns:
+            The position
+        """
+        rows, _, win_length = text.strip().partition(":")
+        rows = rows.upper().split("/")
+        size = len(rows)
+        if any(len(row) != size for row in rows):
+            raise ValueError(f"Invalid position {text!r}: rows must form a square")
+        x_mask = o_mask = 0
+        for bit, cell in enumerate("".join(rows)):
+            if cell == "X":
+                x_mask |= 1 << bit
+            elif cell == "O":
+                o_mask |= 1 << bit
+            elif cell != ".":
+                raise ValueError(f"Invalid cell {cell!r} in position {text!r}")
+        if win_length and not win_length.isdigit():
+            raise ValueError(f"Invalid win length in position {text!r}")
+        return cls.from_masks(size, x_mask, o_mask, int(win_length or size))
+
+    @property
+    def notation(self) -> str:
+        """The position in text notation, as read by :meth:`from_notation`."""
+        size = self.size
+        marks = "".join("." if cell is None else cell for cell in self.cells())
+        rows = "/".join(
+            marks[start : start + size] for start in range(0, len(marks), size)
+        )
+        if self.win_length != size:
+            rows += f":{self.win_length}"
+        return rows
+
+    def to_board(self) -> Board:
+        """
+        Build a board holding this position.
+
+        Returns:
+            A new board whose ``current_player`` is X when both players
+            have the same number of stones and O otherwise
+        """
+        packed = self._packed
+        size = packed & _DIMENSION_MASK
+        win_length = packed >> _DIMENSION_BITS & _DIMENSION_MASK
+        count = size * size
+        x_mask = packed >> _HEADER_BITS & ((1 << count) - 1)
+        o_mask = packed >> (_HEADER_BITS + count)
+        x_bits = format(x_mask, f"0{count}b")[::-1]
+        o_bits = format(o_mask, f"0{count}b")[::-1]
+        cells = [
+            "X" if x == "1" else "O" if o == "1" else None
+            for x, o in zip(x_bits, o_bits)
+        ]
+        return Board.from_grid(
+            [cells[start : start + size] for start in range(0, count, size)],
+            win_length,
+            "X" if x_bits.count("1") == o_bits.count("1") else "O",
+        )
+
+    @property
+    def packed(self) -> int:
+        """The integer holding the whole position."""
+        return self._packed
+
+    @property
+    def size(self) -> int:
+        """Number of rows and columns."""
+        return self._packed & _DIMENSION_MASK
+
+    @property
+    def win_length(self) -> int:
+        """Stones in a row needed to win."""
+        return self._packed >> _DIMENSION_BITS & _DIMENSION_MASK
+
+    @property
+    def x_mask(self) -> int:
+        """Bitmask of the cells holding X."""
+        cells = self.size * self.size
+        return self._packed >> _HEADER_BITS & ((1 << cells) - 1)
+
+    @property
+    def o_mask(self) -> int:
+        """Bitmask of the cells holding O."""
+        size = self.size
+        return self._packed >> (_HEADER_BITS + size * size)
+
+    @property
+    def side_to_move(self) -> str:
+        """'X' when both players have as many stones, otherwise 'O'."""
+        x_count = bin(self.x_mask).count("1")
+        return "X" if x_count == bin(self.o_mask).count("1") else "O"
+
+    def __getitem__(self, cell: Tuple[int, int]) -> Optional[str]:
+        """Return the stone at (row, col), or None for an empty cell."""
+        row, col = cell
+        size = self.size
+        if not (0 <= row < size and 0 <= col < size):
+            raise IndexError(f"Cell {cell} is off the board")
+        bit = row * size + col
+        if self.x_mask >> bit & 1:
+            return "X"
+        if self.o_mask >> bit & 1:
+            return "O"
+        return None
+
+    def cells(self) -> Iterator[Optional[str]]:
+        """Yield every cell in row-major order."""
+        x_mask, o_mask = self.x_mask, self.o_mask
+        for bit in range(self.size * self.size):
+            if x_mask >> bit & 1:
+                yield "X"
+            elif o_mask >> bit & 1:
+                yield "O"
+            else:
+                yield None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Position is immutable")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._packed == other._packed
+
+    def __hash__(self) -> int:
+        return hash(self._packed)
+
+    def __reduce__(self):
+        return Position, (self._packed,)
+
+    def __repr__(self) -> str:
+        return f"Position.from_notation({self.notation!r})"
@@ -0,0 +1,263 @@
+"""Compact binary game records with a buffered writer and an mmap reader.
+
+A record file starts with an 8-byte header (``b"TTTR"``, a format version
+and three reserved bytes) followed by one record per game, little-endian::
+
+    u32  length of the rest of the record
+    u8   board size          u8  win length
+    u8   winner (0 none, 1 X, 2 O)
+    u16  number of moves
+    u8   length + UTF-8 name of the X player
+    u8   length + UTF-8 name of the O player
+    moves, packed
+
+Each move is the cell index ``row * size + col`` in just enough bits for
+the board (4 bits on 3x3, 5 on 4x4 and 5x5), so a classic game takes
+about 20 bytes. X always moves first. Files are only ever appended to.
+"""
+
+import mmap
+import struct
+from array import array
+from typing import Iterator, NamedTuple, Optional, Tuple
+
+from .board import Board
+
+MAGIC = b"TTTR"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sB3x")
+RECORD_HEADER = struct.Struct("<IBBBH")
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+_WINNER_CODES = {None: 0, "X": 1, "O": 2}
+_WINNERS = (None, "X", "O")
+
+
+def move_bits(size: int) -> int:
+    """Bits used to store one move on a ``size`` x ``size`` board."""
+    return max(1, (size * size - 1).bit_length())
+
+
+class GameRecord(NamedTuple):
+    """One finished (or abandoned) game."""
+
+    size: int
+    win_length: int
+    moves: Tuple[Tuple[int, int], ...]
+    winner: Optional[str] = None
+    player_x: str = ""
+    player_o: str = ""
+
+    def replay(self) -> Board:
+        """
+        Play the moves on a new board.
+
+        Returns:
+            The board after the last move
+        """
+        board = Board(self.size, self.win_length)
+        for row, col in self.moves:
+            if not board.make_move(row, col):
+                raise ValueError(f"Illegal move {(row, col)} in game record")
+        return board
+
+
+def encode_record(record: GameRecord) -> bytes:
+    """
+    Pack a game into its binary form, including the length prefix.
+
+    Args:
+        record: Game to pack
+
+    Returns:
+        The record's bytes
+    """
+    size, win_length = record.size, record.win_length
+    if not 1 <= size <= 255 or not 1 <= win_length <= size:
+        raise ValueError("Invalid board dimensions in game record")
+    if record.winner not in _WINNER_CODES:
+        raise ValueError(f"Invalid winner {record.winner!r} in game record")
+    if len(record.moves) > size * size:
+        raise ValueError("Game record has more moves than cells")
+    names = b""
+    for name in (record.player_x, record.player_o):
+        encoded = name.encode("utf-8")
+        if len(encoded) > 255:
+            raise ValueError(f"Player name {name!r} is longer than 255 bytes")
+        names += bytes((len(encoded),)) + encoded
+
+    bits = move_bits(size)
+    packed = 0
+    for index, (row, col) in enumerate(record.moves):
+        if not (0 <= row < size and 0 <= col < size):
+            raise ValueError(f"Move {(row, col)} is off the board")
+        packed |= (row * size + col) << (index * bits)
+    moves = packed.to_bytes((len(record.moves) * bits + 7) // 8, "little")
+
+    length = RECORD_HEADER.size - 4 + len(names) + len(moves)
+    header = RECORD_HEADER.pack(
+        length, size, win_length, _WINNER_CODES[record.winner], len(record.moves)
+    )
+    return header + names + moves
+
+
+def decode_record(buffer, offset: int = 0) -> Tuple[GameRecord, int]:
+    """
+    Unpack the record starting at ``offset``.
+
+    Args:
+        buffer: Bytes-like object holding records
+        offset: Position of the record's length prefix
+
+    Returns:
+        Tuple of (record, offset of the next record)
+    """
+    if offset + RECORD_HEADER.size > len(buffer):
+        raise ValueError(f"Truncated game record at offset {offset}")
+    length, size, win_length, winner, count = RECORD_HEADER.unpack_from(buffer, offset)
+    end = offset + 4 + length
+    if end > len(buffer) or winner >= len(_WINNERS):
+        raise ValueError(f"Corrupt game record at offset {offset}")
+
+    position = offset + RECORD_HEADER.size
+    names = []
+    for _ in range(2):
+        name_length = buffer[position]
+        position += 1
+        names.append(bytes(buffer[position : position + name_length]).decode("utf-8"))
+        position += name_length
+
+    bits = move_bits(size)
+    packed = int.from_bytes(buffer[position:end], "little")
+    mask = (1 << bits) - 1
+    moves = tuple(
+        divmod(packed >> (index * bits) & mask, size) for index in range(count)
+    )
+    return GameRecord(size, win_length, moves, _WINNERS[winner], *names), end
+
+
+class RecordWriter:
+    """
+    Append games to a record file, buffering writes.
+
+    Usable as a context manager; records still in the buffer are written
+    on :meth:`flush` and :meth:`close`.
+    """
+
+    def __init__(self, path: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Open ``path`` for appending, creating it with a header if needed.
+
+        Args:
+            path: Record file
+            buffer_size: Bytes to collect before writing to the file
+        """
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION))
+            self._file.flush()
+        else:
+            with open(path, "rb") as existing:
+                _check_header(existing.read(FILE_HEADER.size), path)
+
+    def write(self, record: GameRecord):
+        """Append one game."""
+        self._buffer += encode_record(record)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RecordReader:
+    """
+    Read games from a record file through a memory map.
+
+    Iterating decodes games one at a time. Indexing first builds an index
+    of record offsets by hopping over the length prefixes, without decoding
+    any moves, then decodes only the requested game.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map ``path`` into memory.
+
+        Args:
+            path: Record file written by :class:`RecordWriter`
+        """
+        with open(path, "rb") as f:
+            _check_header(f.read(FILE_HEADER.size), path)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets: Optional[array] = None
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        offset = FILE_HEADER.size
+        end = len(self._map)
+        while offset < end:
+            record, offset = decode_record(self._map, offset)
+            yield record
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __getitem__(self, index: int) -> GameRecord:
+        offsets = self._index()
+        if index < 0:
+            index += len(offsets)
+        if not 0 <= index < len(offsets):
+            raise IndexError("Game record index out of range")
+        return decode_record(self._map, offsets[index])[0]
+
+    def _index(self) -> array:
+        if self._offsets is None:
+            offsets = array("Q")
+            data = self._map
+            offset, end = FILE_HEADER.size, len(data)
+            while offset < end:
+                offsets.append(offset)
+                if offset + 4 > end:
+                    raise ValueError(f"Truncated game record at offset {offset}")
+                offset += 4 + int.from_bytes(data[offset : offset + 4], "little")
+            if offset != end:
+                raise ValueError(f"Truncated game record at offset {offsets[-1]}")
+            self._offsets = offsets
+        return self._offsets
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _check_header(header: bytes, path: str):
+    if len(header) < FILE_HEADER.size:
+        raise ValueError(f"{path!r} is not a game record file")
+    magic, version = FILE_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path!r} is not a game record file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported game record version {version}")
@@ -0,0 +1,513 @@
+"""Asyncio HTTP server hosting many concurrent games behind a JSON API.
+
+Endpoints::
+
+    POST   /games                 Create a game
+    GET    /games/{id}            Game state
+    POST   /games/{id}/moves      Play {"row": r, "col": c} for the side to move
+    POST   /games/{id}/ai-move    Let the AI play for the side to move
+    DELETE /games/{id}            End a game
+
+Games live in memory and expire after ``session_ttl`` seconds without a
+request. AI searches run in an executor (worker processes by default), so
+the event loop keeps serving other games while one is thinking.
+"""
+
+import asyncio
+import json
+import secrets
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ai import AIPlayer
+from .board import Board
+from .cache import PositionCache
+from .transposition import SharedTranspositionTable
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_SESSION_TTL = 600.0
+DEFAULT_MAX_SESSIONS = 10_000
+MAX_BOARD_SIZE = 15
+MAX_BODY_SIZE = 64 * 1024
+# Seconds a keep-alive connection may sit idle between requests.
+KEEP_ALIVE_TIMEOUT = 30.0
+
+DIFFICULTIES = ("easy", "medium", "hard")
+
+# Each executor thread or process keeps its own players, so transposition
+# tables stay warm across requests without being shared between threads,
+# unless the server shares one table between all of its workers.
+_local = threading.local()
+
+
+class HTTPError(Exception):
+    """An error answered with ``status`` and a JSON ``{"error": message}``."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _ai_move(
+    difficulty: str,
+    time_limit: Optional[float],
+    board: Board,
+    symbol: str,
+    shared_table: Optional[Tuple[str, int]] = None,
+    cache_path: Optional[str] = None,
+) -> Tuple[int, int]:
+    """
+    Executor entry point: choose a move with a per-worker cached player.
+
+    Each worker keeps one player per board variant and AI setting. Boards
+    larger than 3x3 are searched by time-limited iterative deepening, as an
+    exhaustive search would not finish. ``shared_table`` is the (name, size)
+    of a :class:`SharedTranspositionTable` for the player to use instead of
+    its own table, and ``cache_path`` the file of a :class:`PositionCache`
+    to consult before searching.
+    """
+    players: Dict[Tuple, AIPlayer] = _local.__dict__.setdefault("players", {})
+    search = "minimax" if board.size == 3 else "iterative"
+    key = (
+        board.size,
+        board.win_length,
+        difficulty,
+        search,
+        time_limit,
+        shared_table,
+        cache_path,
+    )
+    ai = players.get(key)
+    if ai is None:
+        table = None
+        if shared_table is not None:
+            tables = _local.__dict__.setdefault("tables", {})
+            if shared_table not in tables:
+                tables[shared_table] = SharedTranspositionTable(
+                    shared_table[1], shared_table[0]
+                )
+            table = tables[shared_table]
+        cache = None
+        if cache_path is not None:
+            caches = _local.__dict__.setdefault("caches", {})
+            if cache_path not in caches:
+                caches[cache_path] = PositionCache(cache_path)
+            cache = caches[cache_path]
+        ai = players[key] = AIPlayer(
+            difficulty,
+            search=search,
+            time_limit=time_limit if search == "iterative" else None,
+            transposition_table=table,
+            cache=cache,
+        )
+    ai.set_symbols(symbol, "O" if symbol == "X" else "X")
+    return ai.get_best_move(board)
+
+
+class Session:
+    """One game hosted by the server."""
+
+    __slots__ = ("id", "board", "difficulty", "moves", "last_seen", "lock")
+
+    def __init__(self, session_id: str, board: Board, difficulty: str):
+        self.id = session_id
+        self.board = board
+        self.difficulty = difficulty
+        self.moves: List[Tuple[int, int]] = []
+        self.last_seen = time.monotonic()
+        # Serializes moves within one game; other games are unaffected.
+        self.lock = asyncio.Lock()
+
+    def to_json(self) -> Dict[str, Any]:
+        """Public state of the game."""
+        board = self.board
+        winner = board.check_winner()
+        if winner is not None:
+            status = "won"
+        elif board.is_full():
+            status = "draw"
+        else:
+            status = "in_progress"
+        return {
+            "id": self.id,
+            "size": board.size,
+            "win_length": board.win_length,
+            "difficulty": self.difficulty,
+            "board": board.grid,
+            "current_player": board.current_player,
+            "status": status,
+            "winner": winner,
+            "moves": self.moves,
+        }
+
+
+class GameServer:
+    """
+    In-memory game sessions served over HTTP/1.1 with keep-alive.
+
+    The request handling in :meth:`handle` is independent of the transport,
+    so it can be driven directly without sockets.
+    """
+
+    def __init__(
+        self,
+        session_ttl: float = DEFAULT_SESSION_TTL,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        executor: Optional[Executor] = None,
+        workers: Optional[int] = None,
+        ai_time_limit: float = 1.0,
+        shared_tt_size: int = 0,
+        cache_path: Optional[str] = None,
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            session_ttl: Seconds after its last request that a game expires
+            max_sessions: Most games hosted at once
+            executor: Where AI searches run. Defaults to a process pool,
+                started by :meth:`start` and shut down by :meth:`close`
+            workers: Processes in the default pool (defaults to the number
+                of CPUs)
+            ai_time_limit: Seconds per AI move on boards larger than 3x3
+            shared_tt_size: Entries in a transposition table in shared
+                memory used by every AI worker, so each one benefits from
+                the others' searches; 0 gives each worker its own table
+            cache_path: File of a persistent :class:`PositionCache` used by
+                every AI worker, so search results survive restarts
+        """
+        if session_ttl <= 0:
+            raise ValueError("Session TTL must be positive")
+        if max_sessions < 1:
+            raise ValueError("Max sessions must be at least 1")
+        if shared_tt_size < 0:
+            raise ValueError("Shared table size must not be negative")
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self.ai_time_limit = ai_time_limit
+        self.sessions: Dict[str, Session] = {}
+        self.workers = workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+        self.cache_path = cache_path
+        self.shared_table: Optional[SharedTranspositionTable] = (
+            SharedTranspositionTable(shared_tt_size) if shared_tt_size else None
+        )
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """
+        Start listening and expiring idle sessions.
+
+        Returns:
+            The listening :class:`asyncio.Server`; port 0 picks a free port
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers)
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self._reaper = asyncio.ensure_future(self._expire_loop())
+        return self._server
+
+    async def close(self):
+        """
+        Stop listening and drop all sessions.
+
+        Also shuts down an owned executor and frees the shared table.
+        """
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.sessions.clear()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self.shared_table is not None:
+            self.shared_table.close()
+            self.shared_table.unlink()
+            self.shared_table = None
+
+    def expire_sessions(self, now: Optional[float] = None) -> int:
+        """
+        Drop sessions idle for longer than ``session_ttl``.
+
+        Returns:
+            Number of sessions dropped
+        """
+        cutoff = (time.monotonic() if now is None else now) - self.session_ttl
+        expired = [sid for sid, s in self.sessions.items() if s.last_seen < cutoff]
+        for sid in expired:
+            del self.sessions[sid]
+        return len(expired)
+
+    async def _expire_loop(self):
+        while True:
+            await asyncio.sleep(min(60.0, self.session_ttl / 4))
+            self.expire_sessions()
+
+    async def handle(
+        self, method: str, path: str, body: Optional[Dict[str, Any]] = None
+    ) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        """
+        Answer one API request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            body: Decoded JSON body, if any
+
+        Returns:
+            Tuple of (status, JSON-serializable response)
+        """
+        try:
+            return await self._route(method, path.split("?", 1)[0], body or {})
+        except HTTPError as error:
+            return error.status, {"error": error.message}
+
+    async def _route(
+        self, method: str, path: str, body: Dict[str, Any]
+    ) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        parts = [part for part in path.split("/") if part]
+        if not parts or parts[0] != "games" or len(parts) > 3:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+
+        if len(parts) == 1:
+            _require(method, "POST")
+            return HTTPStatus.CREATED, self._create(body).to_json()
+
+        session = self._session(parts[1])
+        if len(parts) == 2:
+            if method == "DELETE":
+                del self.sessions[session.id]
+                return HTTPStatus.OK, {"id": session.id, "deleted": True}
+            _require(method, "GET")
+            return HTTPStatus.OK, session.to_json()
+
+        _require(method, "POST")
+        if parts[2] == "moves":
+            row, col = _int_field(body, "row"), _int_field(body, "col")
+            async with session.lock:
+                self._play(session, row, col)
+        elif parts[2] == "ai-move":
+            async with session.lock:
+                _check_in_progress(session)
+                row, col = await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    _ai_move,
+                    session.difficulty,
+                    self.ai_time_limit,
+                    session.board.copy(),
+                    session.board.current_player,
+                    self._shared_table_spec(),
+                    self.cache_path,
+                )
+                self._play(session, row, col)
+        else:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No such endpoint: {path}")
+        return HTTPStatus.OK, session.to_json()
+
+    def _shared_table_spec(self) -> Optional[Tuple[str, int]]:
+        """Name and size of the shared table, as sent to the AI workers."""
+        table = self.shared_table
+        return None if table is None else (table.name, table.max_size)
+
+    def _create(self, body: Dict[str, Any]) -> Session:
+        if len(self.sessions) >= self.max_sessions:
+            self.expire_sessions()
+            if len(self.sessions) >= self.max_sessions:
+                raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many games")
+        difficulty = body.get("difficulty", "hard")
+        if difficulty not in DIFFICULTIES:
+            raise HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                f"difficulty must be one of {', '.join(DIFFICULTIES)}",
+            )
+        size = _int_field(body, "size", 3)
+        if not 1 <= size <= MAX_BOARD_SIZE:
+            raise HTTPError(
+                HTTPStatus.BAD_REQUEST, f"size must be between 1 and {MAX_BOARD_SIZE}"
+            )
+        win_length = body.get("win_length")
+        try:
+            board = Board(size, None if win_length is None else int(win_length))
+        except (TypeError, ValueError) as error:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(error)) from None
+
+        session_id = secrets.token_urlsafe(12)
+        session = Session(session_id, board, difficulty)
+        self.sessions[session_id] = session
+        return session
+
+    def _session(self, session_id: str) -> Session:
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No such game: {session_id}")
+        session.last_seen = time.monotonic()
+        return session
+
+    @staticmethod
+    def _play(session: Session, row: int, col: int):
+        _check_in_progress(session)
+        if not session.board.make_move(row, col):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Illegal move: ({row}, {col})")
+        session.moves.append((row, col))
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        _read_request(reader), KEEP_ALIVE_TIMEOUT
+                    )
+                except HTTPError as error:
+                    await _write_response(
+                        writer, error.status, {"error": error.message}, False
+                    )
+                    break
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                status, payload = await self.handle(method, path, body)
+                await _write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _require(method: str, expected: str):
+    if method != expected:
+        raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"Use {expected}")
+
+
+def _check_in_progress(session: Session):
+    if session.board.is_game_over():
+        raise HTTPError(HTTPStatus.CONFLICT, "Game is over")
+
+
+def _int_field(body: Dict[str, Any], name: str, default: Optional[int] = None) -> int:
+    value = body.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer")
+    return value
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """
+    Read one HTTP/1.1 request.
+
+    Returns:
+        Tuple of (method, path, decoded JSON body or None, keep_alive), or
+        None when the client closed the connection
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" and (
+        version == "HTTP/1.1" or connection == "keep-alive"
+    )
+
+    body = None
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Bad Content-Length") from None
+    if length > MAX_BODY_SIZE:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Body too large")
+    if length:
+        try:
+            body = json.loads(await reader.readexactly(length))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be JSON") from None
+        if not isinstance(body, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+    return method.upper(), path, body, keep_alive
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter,
+    status: HTTPStatus,
+    payload: Dict[str, Any],
+    keep_alive: bool,
+):
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: Optional[int] = None,
+    session_ttl: float = DEFAULT_SESSION_TTL,
+    ai_time_limit: float = 1.0,
+    shared_tt_size: int = 0,
+    cache_path: Optional[str] = None,
+):
+    """
+    Run a :class:`GameServer` until interrupted.
+
+    Args:
+        host: Interface to bind; loopback by default
+        port: TCP port
+        workers: AI worker processes (defaults to the number of CPUs)
+        session_ttl: Seconds after its last request that a game expires
+        ai_time_limit: Seconds per AI move on boards larger than 3x3
+        shared_tt_size: Entries in a transposition table shared by all AI
+            workers (0 gives each worker its own)
+        cache_path: Persistent position cache file for the AI workers
+    """
+
+    async def run():
+        server = GameServer(
+            session_ttl,
+            workers=workers,
+            ai_time_limit=ai_time_limit,
+            shared_tt_size=shared_tt_size,
+            cache_path=cache_path,
+        )
+        listener = await server.start(host, port)
+        address = listener.sockets[0].getsockname()
+        print(f"Serving Tic-Tac-Toe on http://{address[0]}:{address[1]}")
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
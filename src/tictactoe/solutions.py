@@ -0,0 +1,181 @@
+"""Precomputed perfect-play table for standard 3x3 Tic-Tac-Toe.
+
+Every position reachable from the empty board (X moving first) is solved
+offline and stored in ``data/solutions.bin``. The file is a 6-byte header
+(``MAGIC``, format version, board size) followed by one 2-byte record per
+base-3 encoded position: the best move's cell index (row * 3 + col, or
+``NO_MOVE`` for unreachable and finished positions) and the signed score
+for the side to move, on the same scale as ``AIPlayer`` hard mode.
+
+Regenerate the table with::
+
+    python -m tictactoe.solutions
+"""
+
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .board import Board
+
+MAGIC = b"TTTS"
+VERSION = 1
+SIZE = 3
+NO_MOVE = 0xFF
+HEADER = struct.Struct("<4sBB")
+TABLE_PATH = Path(__file__).parent / "data" / "solutions.bin"
+
+_CELL_CODES = {None: 0, "X": 1, "O": 2}
+_POWERS = tuple(3**i for i in range(SIZE * SIZE))
+
+_table: Optional["SolutionTable"] = None
+
+
+def position_index(board: Board) -> Optional[int]:
+    """
+    Encode a 3x3 board as a base-3 integer (0 empty, 1 X, 2 O).
+
+    Returns:
+        The index, or None if the board is not a classic 3x3 X/O board
+    """
+    if board.size != SIZE or board.win_length != SIZE:
+        return None
+    grid = board.grid
+    index = 0
+    for power, cell in zip(_POWERS, (cell for row in grid for cell in row)):
+        code = _CELL_CODES.get(cell)
+        if code is None:
+            return None
+        index += code * power
+    return index
+
+
+def side_to_move(board: Board) -> Optional[str]:
+    """Return who moves next in a legal game with X first, or None if illegal."""
+    cells = [cell for row in board.grid for cell in row]
+    x_count, o_count = cells.count("X"), cells.count("O")
+    if x_count == o_count:
+        return "X"
+    if x_count == o_count + 1:
+        return "O"
+    return None
+
+
+class SolutionTable:
+    """Read-only view over an encoded solution table."""
+
+    def __init__(self, data: bytes):
+        """
+        Wrap encoded table bytes.
+
+        Args:
+            data: Table contents, as produced by :func:`generate_table`
+
+        Raises:
+            ValueError: If the header or length does not match this format
+        """
+        if len(data) != HEADER.size + 2 * 3 ** (SIZE * SIZE):
+            raise ValueError("Solution table has an unexpected length")
+        magic, version, size = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or size != SIZE:
+            raise ValueError("Unsupported solution table format")
+        self._moves = data[HEADER.size :: 2]
+        self._scores = data[HEADER.size + 1 :: 2]
+
+    def lookup(
+        self, board: Board, player: str
+    ) -> Optional[Tuple[Tuple[int, int], int]]:
+        """
+        Look up the perfect-play move for ``player`` on ``board``.
+
+        Args:
+            board: Current game board
+            player: Symbol of the player about to move
+
+        Returns:
+            Tuple of ((row, col), score), or None if the position is not in
+            the table or it is not ``player``'s turn in a legal game
+        """
+        index = position_index(board)
+        if index is None or side_to_move(board) != player:
+            return None
+        move = self._moves[index]
+        if move == NO_MOVE:
+            return None
+        score = self._scores[index]
+        if score > 127:
+            score -= 256
+        return (move // SIZE, move % SIZE), score
+
+
+def generate_table() -> bytes:
+    """
+    Solve every reachable position and encode the results.
+
+    Returns:
+        The encoded table, ready to be written to ``TABLE_PATH``
+    """
+    records = bytearray([NO_MOVE, 0]) * 3 ** (SIZE * SIZE)
+    solved: Dict[int, int] = {}
+
+    def solve(board: Board, player: str, index: int) -> int:
+        if index in solved:
+            return solved[index]
+        opponent = "O" if player == "X" else "X"
+        best_score, best_move = -100, NO_MOVE
+        for row, col in board.get_empty_positions():
+            cell = row * SIZE + col
+            board.push(row, col, player)
+            if board.check_winner() == player:
+                score = 10
+            elif board.is_full():
+                score = 0
+            else:
+                reply = solve(
+                    board, opponent, index + _CELL_CODES[player] * _POWERS[cell]
+                )
+                # Shift the opponent's score one ply further from this node.
+                score = -reply + (reply > 0) - (reply < 0)
+            board.pop()
+            if score > best_score:
+                best_score, best_move = score, cell
+        records[2 * index] = best_move
+        records[2 * index + 1] = best_score & 0xFF
+        solved[index] = best_score
+        return best_score
+
+    solve(Board(), "X", 0)
+    return HEADER.pack(MAGIC, VERSION, SIZE) + bytes(records)
+
+
+def write_table(path: Path = TABLE_PATH) -> int:
+    """
+    Generate the table and write it to ``path``.
+
+    Returns:
+        Number of positions solved
+    """
+    data = generate_table()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return sum(move != NO_MOVE for move in data[HEADER.size :: 2])
+
+
+def load_table() -> SolutionTable:
+    """Return the packaged solution table, loading it on first use."""
+    global _table  # pylint: disable=global-statement
+    if _table is None:
+        _table = SolutionTable(TABLE_PATH.read_bytes())
+    return _table
+
+
+def main():
+    """Regenerate the packaged solution table."""
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else TABLE_PATH
+    positions = write_table(path)
+    print(f"Solved {positions} positions, wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Per-move search statistics reported by :class:`~tictactoe.ai.AIPlayer`."""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class SearchStats:
+    """
+    Statistics for one ``get_best_move`` call.
+
+    Attributes:
+        method: How the move was chosen: 'random', 'medium', 'table',
+            'cache' or the hard-mode search algorithm
+        nodes: Positions visited by the search
+        expanded: Visited positions whose children were searched
+        max_depth: Deepest ply reached below the root
+        tt_hits: Transposition table lookups that found an entry
+        tt_misses: Transposition table lookups that found nothing
+        wall_time: Seconds spent choosing the move
+    """
+
+    method: str = ""
+    nodes: int = 0
+    expanded: int = 0
+    max_depth: int = 0
+    tt_hits: int = 0
+    tt_misses: int = 0
+    wall_time: float = 0.0
+
+    @property
+    def branching_factor(self) -> float:
+        """Average number of children searched per expanded position."""
+        # The root is expanded but not counted as a visited node.
+        return self.nodes / (self.expanded + 1) if self.nodes else 0.0
+
+    @property
+    def tt_hit_rate(self) -> float:
+        """Fraction of transposition table lookups that found an entry."""
+        lookups = self.tt_hits + self.tt_misses
+        return self.tt_hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """All statistics, including derived ones, as a flat dict."""
+        data = asdict(self)
+        data["branching_factor"] = self.branching_factor
+        data["tt_hit_rate"] = self.tt_hit_rate
+        return data
@@ -0,0 +1,345 @@
+"""AI-vs-AI self-play tournaments run across a process pool."""
+
+import math
+import random
+import time
+from array import array
+from multiprocessing import Pool
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .ai import AIPlayer
+from .board import Board
+from .mcts import MCTSPlayer
+from .records import GameRecord, RecordWriter
+
+# Engine names accepted by make_player.
+ENGINES = ("easy", "medium", "hard", "alphabeta", "iterative", "table", "mcts")
+
+GAMES_PER_TASK = 250
+
+# Latency histogram buckets: bucket i counts latencies up to
+# MIN_LATENCY * LATENCY_BUCKET_RATIO ** i seconds, from 1 microsecond to
+# over 1000 seconds, so reported percentiles are within 5% of the truth.
+MIN_LATENCY = 1e-6
+LATENCY_BUCKET_RATIO = 1.05
+LATENCY_BUCKETS = 430
+
+
+def make_player(engine: str, seed: Optional[int] = None):
+    """
+    Create a player for an engine name.
+
+    Args:
+        engine: One of ``ENGINES``
+        seed: Seed for the player's random choices
+
+    Returns:
+        An object with ``get_best_move(board)`` and ``set_symbols(...)``
+    """
+    if engine in ("easy", "medium", "hard"):
+        return AIPlayer(engine, seed=seed)
+    if engine == "alphabeta":
+        return AIPlayer("hard", search=engine, seed=seed)
+    if engine == "iterative":
+        # A node budget, unlike a time limit, keeps games reproducible.
+        return AIPlayer("hard", search=engine, node_limit=20_000, seed=seed)
+    if engine == "table":
+        return AIPlayer("hard", use_solution_table=True, seed=seed)
+    if engine == "mcts":
+        return MCTSPlayer(iterations=500, seed=seed)
+    raise ValueError(f"Unknown engine {engine!r}; choose from {', '.join(ENGINES)}")
+
+
+def play_game(player_x, player_o, size: int = 3, win_length: Optional[int] = None):
+    """
+    Play one game between two players.
+
+    Args:
+        player_x: Player moving first, as X
+        player_o: Player moving second, as O
+        size: Board size
+        win_length: Stones in a row needed to win
+
+    Returns:
+        Tuple of (winner symbol or None, list of (row, col) moves, list of
+        per-move latencies in seconds)
+    """
+    player_x.set_symbols("X", "O")
+    player_o.set_symbols("O", "X")
+    board = Board(size, win_length)
+    moves = []
+    latencies = []
+    while not board.is_game_over():
+        player = player_x if board.current_player == "X" else player_o
+        start = time.perf_counter()
+        row, col = player.get_best_move(board)
+        latencies.append(time.perf_counter() - start)
+        board.make_move(row, col)
+        moves.append((row, col))
+    return board.check_winner(), moves, latencies
+
+
+class _Task(NamedTuple):
+    engine_a: str
+    engine_b: str
+    first_game: int
+    games: int
+    seed: int
+    size: int
+    win_length: Optional[int]
+    record: bool = False
+
+
+class LatencyHistogram:
+    """
+    Counts of move latencies in fixed, logarithmically spaced buckets.
+
+    Memory does not grow with the number of samples, and histograms from
+    different tasks are combined with :meth:`merge`. Percentiles are read
+    as the upper bound of the bucket holding the requested rank, capped at
+    the largest sample.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = array("Q", bytes(8 * LATENCY_BUCKETS))
+        self.total = 0
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return self.total
+
+    def add(self, seconds: float):
+        """Count one latency."""
+        if seconds <= MIN_LATENCY:
+            bucket = 0
+        else:
+            bucket = min(
+                LATENCY_BUCKETS - 1,
+                math.ceil(math.log(seconds / MIN_LATENCY, LATENCY_BUCKET_RATIO)),
+            )
+        self.counts[bucket] += 1
+        self.total += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add the samples of another histogram to this one."""
+        counts = self.counts
+        for bucket, count in enumerate(other.counts):
+            if count:
+                counts[bucket] += count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentiles(self, points=(50, 90, 99)) -> Dict[int, float]:
+        """Nearest-rank percentiles, in seconds."""
+        result = {}
+        for p in points:
+            if not self.total:
+                result[p] = 0.0
+                continue
+            rank = max(1, -(-p * self.total // 100))
+            seen = 0
+            for bucket, count in enumerate(self.counts):
+                seen += count
+                if seen >= rank:
+                    break
+            # The last bucket also holds everything beyond the range.
+            if bucket == LATENCY_BUCKETS - 1:
+                result[p] = self.max
+            else:
+                result[p] = min(MIN_LATENCY * LATENCY_BUCKET_RATIO**bucket, self.max)
+        return result
+
+
+def _task_seed(seed: int, task_index: int) -> int:
+    """Derive a task's seed so results do not depend on worker scheduling."""
+    return random.Random(seed * 1_000_003 + task_index).getrandbits(63)
+
+
+def _play_games(
+    task: _Task,
+) -> Tuple[List[int], LatencyHistogram, List[GameRecord]]:
+    """
+    Play a block of games, alternating colors by game number.
+
+    Returns:
+        [wins, draws, losses] for engine A, a histogram of the move
+        latencies, and a record of each game if the task asks for them
+    """
+    rng = random.Random(task.seed)
+    player_a = make_player(task.engine_a, rng.getrandbits(63))
+    player_b = make_player(task.engine_b, rng.getrandbits(63))
+    outcome = [0, 0, 0]
+    latencies = LatencyHistogram()
+    records = []
+    for game in range(task.first_game, task.first_game + task.games):
+        a_is_x = game % 2 == 0
+        if a_is_x:
+            engine_x, engine_o = task.engine_a, task.engine_b
+            winner, moves, game_latencies = play_game(
+                player_a, player_b, task.size, task.win_length
+            )
+        else:
+            engine_x, engine_o = task.engine_b, task.engine_a
+            winner, moves, game_latencies = play_game(
+                player_b, player_a, task.size, task.win_length
+            )
+        if task.record:
+            records.append(
+                GameRecord(
+                    task.size,
+                    task.win_length or task.size,
+                    tuple(moves),
+                    winner,
+                    engine_x,
+                    engine_o,
+                )
+            )
+        if winner is None:
+            outcome[1] += 1
+        elif (winner == "X") == a_is_x:
+            outcome[0] += 1
+        else:
+            outcome[2] += 1
+        for seconds in game_latencies:
+            latencies.add(seconds)
+    return outcome, latencies, records
+
+
+class TournamentResult(NamedTuple):
+    """Aggregate outcome of a tournament, from engine A's point of view."""
+
+    engine_a: str
+    engine_b: str
+    wins: int
+    draws: int
+    losses: int
+    elapsed: float
+    latency_percentiles: Dict[int, float]
+
+    @property
+    def games(self) -> int:
+        """Number of games played."""
+        return self.wins + self.draws + self.losses
+
+    @property
+    def games_per_second(self) -> float:
+        """Throughput over the whole run."""
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        """Human-readable report."""
+        games = self.games or 1
+        latency = ", ".join(
+            f"p{p} {seconds * 1e3:.3f}ms"
+            for p, seconds in self.latency_percentiles.items()
+        )
+        return "\n".join(
+            [
+                f"{self.engine_a} vs {self.engine_b}: {self.games} games",
+                f"  {self.engine_a} wins: {self.wins} ({self.wins / games:.1%})",
+                f"  draws:   {self.draws} ({self.draws / games:.1%})",
+                f"  {self.engine_a} losses: {self.losses} "
+                f"({self.losses / games:.1%})",
+                f"  games/s: {self.games_per_second:,.1f}",
+                f"  move latency: {latency}",
+            ]
+        )
+
+
+def run_tournament(
+    engine_a: str,
+    engine_b: str,
+    games: int,
+    workers: int = 1,
+    seed: int = 0,
+    size: int = 3,
+    win_length: Optional[int] = None,
+    record: Optional[str] = None,
+) -> TournamentResult:
+    """
+    Play ``games`` games between two engines, alternating who moves first.
+
+    Games are split into fixed blocks, each with a seed derived from
+    ``seed`` and its block number, so a run is reproducible for any worker
+    count.
+
+    Args:
+        engine_a: Engine name for the first player (see ``ENGINES``)
+        engine_b: Engine name for the second player
+        games: Number of games
+        workers: Number of worker processes
+        seed: Base seed for all players
+        size: Board size
+        win_length: Stones in a row needed to win
+        record: Record file to append every game to, or None
+
+    Returns:
+        The aggregated result
+    """
+    for engine in (engine_a, engine_b):
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown engine {engine!r}; choose from {', '.join(ENGINES)}"
+            )
+    if games < 1:
+        raise ValueError("Games must be at least 1")
+    if workers < 1:
+        raise ValueError("Workers must be at least 1")
+
+    tasks = [
+        _Task(
+            engine_a,
+            engine_b,
+            first,
+            min(GAMES_PER_TASK, games - first),
+            _task_seed(seed, index),
+            size,
+            win_length,
+            record is not None,
+        )
+        for index, first in enumerate(range(0, games, GAMES_PER_TASK))
+    ]
+
+    writer = RecordWriter(record) if record is not None else None
+    start = time.perf_counter()
+    try:
+        if workers == 1:
+            totals, latencies = _merge(map(_play_games, tasks), writer)
+        else:
+            with Pool(workers) as pool:
+                # Recorded games are kept in game order.
+                imap = pool.imap if writer is not None else pool.imap_unordered
+                totals, latencies = _merge(imap(_play_games, tasks), writer)
+    finally:
+        if writer is not None:
+            writer.close()
+    elapsed = time.perf_counter() - start
+
+    return TournamentResult(
+        engine_a,
+        engine_b,
+        totals[0],
+        totals[1],
+        totals[2],
+        elapsed,
+        latencies.percentiles(),
+    )
+
+
+def _merge(
+    results, writer: Optional[RecordWriter]
+) -> Tuple[List[int], LatencyHistogram]:
+    """Sum per-task outcomes and latency histograms and record their games."""
+    totals = [0, 0, 0]
+    latencies = LatencyHistogram()
+    for outcome, task_latencies, records in results:
+        for i in range(3):
+            totals[i] += outcome[i]
+        latencies.merge(task_latencies)
+        for game in records:
+            writer.write(game)
+    return totals, latencies
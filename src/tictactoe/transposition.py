@@ -0,0 +1,351 @@
+"""Transposition table and position canonicalization for the AI search."""
+
+import struct
+from collections import OrderedDict
+from functools import lru_cache
+from multiprocessing import shared_memory
+from operator import itemgetter
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+DEFAULT_MAX_SIZE = 100_000
+
+# Bits for each board dimension in the low end of a position key, so that
+# one table can hold positions of several board variants.
+DIMENSION_BITS = 8
+
+# Shared table slots are three unsigned 64-bit words: check, score, meta.
+_SLOT_WORDS = 3
+_WORD_MASK = (1 << 64) - 1
+# Set in the meta word of every written slot, so empty slots never match.
+_VALID = 1 << 63
+_SLOT_HASH = 0x9E3779B97F4A7C15
+_SCORE = struct.Struct("<d")
+
+
+class TTEntry(NamedTuple):
+    """A cached search result."""
+
+    score: int
+    flag: int
+    depth: int
+
+
+class TranspositionTable:
+    """
+    Size-bounded cache of search results keyed on canonical positions.
+
+    Entries are evicted in least-recently-used order once ``max_size`` is
+    reached. Every lookup updates the ``hits`` / ``misses`` counters.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Initialize an empty table.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[int, TTEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: int) -> bool:
+        """Check whether a key is cached without touching the counters."""
+        return key in self._entries
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that found an entry."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: int) -> Optional[TTEntry]:
+        """
+        Look up a position.
+
+        Args:
+            key: Position key, usually from :func:`canonical_key`
+
+        Returns:
+            The cached entry, or None if the position is not cached
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def peek(self, key: int) -> Optional[TTEntry]:
+        """Look up a position without touching the counters or LRU order."""
+        return self._entries.get(key)
+
+    def store(self, key: int, score: int, flag: int = EXACT, depth: int = 0):
+        """
+        Cache a search result, evicting the least recently used entry if full.
+
+        Args:
+            key: Position key, usually from :func:`canonical_key`
+            score: Score found by the search
+            flag: EXACT, LOWER_BOUND or UPPER_BOUND
+            depth: Remaining search depth the score was computed with
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.max_size:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = TTEntry(score, flag, depth)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class SharedTranspositionTable:
+    """
+    Transposition table in shared memory, used by several processes at once.
+
+    Entries live in a fixed array of slots; a key can only be stored in the
+    one slot it hashes to, which a newer entry simply overwrites. Each slot
+    holds three 64-bit words: the score, the flag and depth, and the key
+    XOR-ed with both. Nothing is locked: a slot left mixed by two processes
+    writing at once fails the XOR check and reads as a miss, never as a
+    wrong entry.
+
+    A pickled table attaches to the same memory when unpickled, so players
+    sent to worker processes keep sharing it. The creating process should
+    call :meth:`unlink` once every process is done with the table. Counters
+    are kept per process.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, name: Optional[str] = None):
+        """
+        Create a table, or attach to an existing one.
+
+        Args:
+            max_size: Number of slots; must match the table's when attaching
+            name: Shared memory block of the table to attach to, or None to
+                create a new table
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        size = max_size * _SLOT_WORDS * 8
+        if name is None:
+            self._memory = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._memory = _attach_memory(name)
+            if self._memory.size < size:
+                self._memory.close()
+                raise ValueError(
+                    f"Shared table {name!r} has fewer than {max_size} slots"
+                )
+        self._words = self._memory.buf.cast("Q")
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block, for attaching from elsewhere."""
+        return self._memory.name
+
+    def __reduce__(self):
+        return SharedTranspositionTable, (self.max_size, self.name)
+
+    def __len__(self) -> int:
+        """Return the number of filled slots."""
+        return sum(
+            1 for meta in self._words[2 : self.max_size * _SLOT_WORDS : 3] if meta
+        )
+
+    def __contains__(self, key: int) -> bool:
+        """Check whether a key is cached without touching the counters."""
+        return self.peek(key) is not None
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that found an entry."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _slot(self, key: int) -> Tuple[int, int]:
+        """Return (key folded to 64 bits, index of the slot's first word)."""
+        key64 = (key ^ key >> 64) & _WORD_MASK
+        index = (key64 * _SLOT_HASH & _WORD_MASK) % self.max_size
+        return key64, index * _SLOT_WORDS
+
+    def get(self, key: int) -> Optional[TTEntry]:
+        """
+        Look up a position.
+
+        Args:
+            key: Position key, usually from :func:`canonical_key`
+
+        Returns:
+            The cached entry, or None if the position is not cached
+        """
+        entry = self.peek(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def peek(self, key: int) -> Optional[TTEntry]:
+        """Look up a position without touching the counters."""
+        key64, slot = self._slot(key)
+        words = self._words
+        check, bits, meta = words[slot], words[slot + 1], words[slot + 2]
+        if not meta or check ^ bits ^ meta != key64:
+            return None
+        score = _SCORE.unpack(bits.to_bytes(8, "little"))[0]
+        if score.is_integer():
+            score = int(score)
+        return TTEntry(score, meta & 3, (meta & ~_VALID) >> 2)
+
+    def store(self, key: int, score: int, flag: int = EXACT, depth: int = 0):
+        """
+        Cache a search result, replacing whatever its slot held.
+
+        Args:
+            key: Position key, usually from :func:`canonical_key`
+            score: Score found by the search
+            flag: EXACT, LOWER_BOUND or UPPER_BOUND
+            depth: Remaining search depth the score was computed with
+        """
+        key64, slot = self._slot(key)
+        words = self._words
+        old_meta = words[slot + 2]
+        if old_meta and words[slot] ^ words[slot + 1] ^ old_meta != key64:
+            self.evictions += 1
+        bits = int.from_bytes(_SCORE.pack(score), "little")
+        meta = _VALID | depth << 2 | flag
+        words[slot + 1] = bits
+        words[slot + 2] = meta
+        words[slot] = key64 ^ bits ^ meta
+
+    def clear(self):
+        """Empty every slot, for all processes, and reset the counters."""
+        self._memory.buf[: self.max_size * _SLOT_WORDS * 8] = bytes(
+            self.max_size * _SLOT_WORDS * 8
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def close(self):
+        """Detach this process from the table."""
+        if self._words is not None:
+            self._words.release()
+            self._words = None
+            self._memory.close()
+
+    def __del__(self):
+        # The word view must be released before the memory can be closed.
+        if getattr(self, "_words", None) is not None:
+            self.close()
+
+    def unlink(self):
+        """Free the shared memory once all processes have closed the table."""
+        self._memory.unlink()
+
+
+def _attach_memory(name: str) -> shared_memory.SharedMemory:
+    """Open an existing shared memory block without taking ownership of it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching always registers the block with the
+        # resource tracker. Worker processes share their parent's tracker,
+        # so that is harmless there.
+        return shared_memory.SharedMemory(name=name)
+
+
+@lru_cache(maxsize=None)
+def symmetry_getters(size: int) -> Tuple[Callable, ...]:
+    """
+    Return one getter per symmetry of a square board.
+
+    Each getter maps a flat, row-major list of cells to the cells of the
+    rotated or reflected board, for all 8 rotations and reflections.
+    """
+    permutations = []
+    for flip in (False, True):
+        for turns in range(4):
+            permutation = []
+            for row in range(size):
+                for col in range(size):
+                    r, c = (row, size - 1 - col) if flip else (row, col)
+                    for _ in range(turns):
+                        r, c = c, size - 1 - r
+                    permutation.append(r * size + c)
+            permutations.append(tuple(permutation))
+    return tuple(itemgetter(*permutation) for permutation in set(permutations))
+
+
+def variant_key(size: int, win_length: int) -> int:
+    """
+    Identify a board variant in the low ``2 * DIMENSION_BITS`` bits of a key.
+
+    Args:
+        size: Board size
+        win_length: Stones in a row needed to win
+
+    Returns:
+        Integer to combine with a position's encoding
+    """
+    if not 0 < win_length <= size < 1 << DIMENSION_BITS:
+        raise ValueError(f"Unsupported board variant {size}x{size}, k={win_length}")
+    return size << DIMENSION_BITS | win_length
+
+
+def canonical_key(
+    grid: Sequence[Sequence[Optional[str]]],
+    player: str,
+    win_length: Optional[int] = None,
+) -> int:
+    """
+    Encode a position so that all of its symmetric variants share one key.
+
+    Cells are encoded in base 3 relative to ``player`` (0 empty, 1 player,
+    2 opponent) and the smallest encoding over the 8 symmetries is kept.
+    The board size and win length are part of the key, so positions of
+    different variants never share one.
+
+    Args:
+        grid: Board grid as a list of rows
+        player: Symbol whose stones are encoded as 1
+        win_length: Stones in a row needed to win (defaults to the size)
+
+    Returns:
+        Integer key shared by every rotation and reflection of the position
+    """
+    size = len(grid)
+    cells: List[str] = [
+        "0" if cell is None else "1" if cell == player else "2"
+        for row in grid
+        for cell in row
+    ]
+    encoding = int(min("".join(getter(cells)) for getter in symmetry_getters(size)), 3)
+    return encoding << 2 * DIMENSION_BITS | variant_key(
+        size, size if win_length is None else win_length
+    )
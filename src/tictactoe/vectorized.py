@@ -0,0 +1,118 @@
+"""NumPy-vectorized game-state checks over large batches of boards.
+
+This module needs the optional NumPy dependency::
+
+    pip install tictactoe-vish[fast]
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from .board import Board, winning_lines
+
+EMPTY = 0
+X = 1
+O = 2  # noqa: E741
+
+_CODES = {None: EMPTY, "X": X, "O": O}
+_SYMBOLS = {EMPTY: None, X: "X", O: "O"}
+
+
+class BoardBatch:
+    """
+    Many same-sized boards stored as one ``(n, size, size)`` int8 array.
+
+    Cells hold EMPTY, X or O. Winner, draw and empty-cell checks run over
+    the whole batch in a handful of array operations.
+    """
+
+    def __init__(self, cells: np.ndarray, win_length: Optional[int] = None):
+        """
+        Wrap an array of board cells.
+
+        Args:
+            cells: Array of shape (n, size, size) with EMPTY/X/O values
+            win_length: Stones in a row needed to win. Defaults to ``size``
+        """
+        cells = np.asarray(cells, dtype=np.int8)
+        if cells.ndim != 3 or cells.shape[1] != cells.shape[2]:
+            raise ValueError("cells must have shape (n, size, size)")
+        self.cells = cells
+        self.size = cells.shape[1]
+        self.win_length = self.size if win_length is None else win_length
+        if not 1 <= self.win_length <= self.size:
+            raise ValueError("Win length must be between 1 and the board size")
+
+    @classmethod
+    def from_boards(cls, boards: Iterable[Board]) -> "BoardBatch":
+        """
+        Pack boards into a batch.
+
+        Args:
+            boards: Boards that all share one size and win length
+
+        Returns:
+            The batch
+        """
+        boards = list(boards)
+        if not boards:
+            raise ValueError("Cannot build a batch from no boards")
+        size, win_length = boards[0].size, boards[0].win_length
+        if any((b.size, b.win_length) != (size, win_length) for b in boards):
+            raise ValueError("All boards must share size and win length")
+        cells = np.array(
+            [[[_CODES[cell] for cell in row] for row in b.grid] for b in boards],
+            dtype=np.int8,
+        )
+        return cls(cells, win_length)
+
+    def __len__(self) -> int:
+        """Return the number of boards in the batch."""
+        return self.cells.shape[0]
+
+    def to_boards(self) -> List[Board]:
+        """Unpack the batch into individual boards."""
+        boards = []
+        for cells in self.cells:
+            board = Board(self.size, self.win_length)
+            for (row, col), code in np.ndenumerate(cells):
+                if code != EMPTY:
+                    board.make_move(row, col, _SYMBOLS[int(code)])
+            boards.append(board)
+        return boards
+
+    def empty_mask(self) -> np.ndarray:
+        """Boolean array of shape (n, size, size), True for empty cells."""
+        return self.cells == EMPTY
+
+    def empty_counts(self) -> np.ndarray:
+        """Number of empty cells on each board."""
+        return self.empty_mask().sum(axis=(1, 2))
+
+    def winners(self) -> np.ndarray:
+        """
+        Winner of each board.
+
+        Returns:
+            Array of EMPTY (no winner), X or O per board. A board on which
+            both players have a line, which a legal game never reaches,
+            reports X
+        """
+        lines = np.array(winning_lines(self.size, self.win_length), dtype=np.intp)
+        line_cells = self.cells.reshape(len(self), -1)[:, lines]
+        x_wins = (line_cells == X).all(axis=2).any(axis=1)
+        o_wins = (line_cells == O).all(axis=2).any(axis=1)
+        return np.where(x_wins, X, np.where(o_wins, O, EMPTY)).astype(np.int8)
+
+    def full_mask(self) -> np.ndarray:
+        """True for boards with no empty cell."""
+        return ~self.empty_mask().any(axis=(1, 2))
+
+    def draw_mask(self) -> np.ndarray:
+        """True for full boards without a winner."""
+        return self.full_mask() & (self.winners() == EMPTY)
+
+    def game_over_mask(self) -> np.ndarray:
+        """True for boards that are won or full."""
+        return (self.winners() != EMPTY) | self.full_mask()
@@ -1,9 +1,27 @@
 """Unit tests for the AI player."""
 
+import asyncio
+import pickle
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
 
-from src.tictactoe.ai import AIPlayer
+from src.tictactoe.ai import (
+    CLOCK_CHECK_INTERVAL,
+    AIPlayer,
+    SearchCancelled,
+    position_key,
+)
 from src.tictactoe.board import Board
+from src.tictactoe.transposition import (
+    DIMENSION_BITS,
+    SharedTranspositionTable,
+    variant_key,
+)
 
 
 class TestAIPlayer:
@@ -276,3 +294,737 @@ class TestAIPlayer:
 
         winning_move = ai._find_winning_move(board, "X")
         assert winning_move == (0, 2)
+
+
+class TestAlphaBetaSearch:
+    """Test cases for the alpha-beta search mode."""
+
+    def test_set_search(self):
+        """Test selecting the search algorithm."""
+        ai = AIPlayer()
+        assert ai.search == "minimax"
+
+        ai.set_search("alphabeta")
+        assert ai.search == "alphabeta"
+        assert AIPlayer(search="alphabeta").search == "alphabeta"
+
+        with pytest.raises(ValueError):
+            ai.set_search("invalid")
+        with pytest.raises(ValueError):
+            AIPlayer(search="invalid")
+
+    @pytest.mark.parametrize("tt_size", [0, 1000])
+    def test_matches_minimax_moves(self, tt_size):
+        """Test that alpha-beta picks exactly the moves minimax picks."""
+        minimax = AIPlayer("hard", tt_size=tt_size)
+        alphabeta = AIPlayer("hard", tt_size=tt_size, search="alphabeta")
+
+        for moves in [
+            [(1, 1, "X")],
+            [(0, 1, "X")],
+            [(0, 0, "X"), (1, 1, "O"), (2, 2, "X")],
+            [(0, 0, "X"), (0, 1, "X"), (1, 1, "O")],
+            [(0, 0, "O"), (1, 1, "O"), (0, 1, "X")],
+        ]:
+            board = Board()
+            for row, col, player in moves:
+                board.make_move(row, col, player)
+            for symbols in [("O", "X"), ("X", "O")]:
+                minimax.set_symbols(*symbols)
+                alphabeta.set_symbols(*symbols)
+                assert alphabeta.get_best_move(board) == minimax.get_best_move(board)
+
+    def test_visits_fewer_nodes(self):
+        """Test that pruning reduces the number of nodes searched."""
+        board = Board()
+        board.make_move(0, 0, "X")
+
+        minimax = AIPlayer("hard", tt_size=0)
+        alphabeta = AIPlayer("hard", tt_size=0, search="alphabeta")
+        minimax.get_best_move(board)
+        alphabeta.get_best_move(board)
+
+        assert 0 < alphabeta.nodes_searched < minimax.nodes_searched // 10
+
+    def test_move_ordering(self):
+        """Test center-first, corners-next ordering and killer moves."""
+        ai = AIPlayer(search="alphabeta")
+        moves = [(0, 1), (0, 0), (1, 1)]
+        assert ai._order_moves(moves, 1) == [(1, 1), (0, 0), (0, 1)]
+
+        ai._record_cutoff((0, 1), 1, 5)
+        assert ai._order_moves(moves, 1)[0] == (0, 1)
+        assert ai._order_moves(moves, 2)[0] == (0, 1)  # history heuristic
+        assert ai._history[(0, 1)] == 25
+
+
+class TestInPlaceSearch:
+    """Test cases for searching with push/pop instead of board copies."""
+
+    @pytest.mark.parametrize("search", ["minimax", "alphabeta"])
+    def test_search_creates_no_boards(self, search):
+        """Test that a hard-mode search never copies the board."""
+        board = Board()
+        board.make_move(0, 0, "X")
+        board.make_move(1, 1, "O")
+        board.make_move(2, 2, "X")
+        grid = [row[:] for row in board.grid]
+
+        ai = AIPlayer("hard", search=search)
+        with patch.object(Board, "copy", side_effect=AssertionError("copied")):
+            with patch.object(Board, "__init__", side_effect=AssertionError("new")):
+                ai.get_best_move(board)
+                ai._find_winning_move(board, "X")
+
+        assert board.grid == grid
+
+
+class TestIterativeDeepening:
+    """Test cases for the budgeted iterative-deepening search mode."""
+
+    def test_large_boards_use_zobrist_keys(self):
+        """Test that big boards key the table by the incremental hash."""
+        board = Board(5, 4)
+        board.make_move(2, 2)
+        ai = AIPlayer("hard", search="iterative", node_limit=500)
+        assert board.is_position_empty(*ai.get_best_move(board))
+        key = ai._table_key(board, True)
+        assert key >> 2 * DIMENSION_BITS + 2 == board.zobrist_hash
+        assert key & (1 << 2 * DIMENSION_BITS) - 1 == variant_key(5, 4)
+        assert len(ai.transposition_table) > 0
+
+        small = Board()
+        ai.get_best_move(small)
+        assert ai._table_key(small, True) == variant_key(3, 3) * 2 + 1
+
+    def test_warm_table_scores_are_exact(self):
+        """Test that reusing the table across positions keeps scores exact."""
+        rng = random.Random(1)
+        warm = AIPlayer("hard", search="iterative")
+        for _ in range(40):
+            board = Board()
+            for _ in range(rng.randrange(9)):
+                if board.is_game_over():
+                    break
+                board.make_move(*rng.choice(board.get_empty_positions()))
+            if board.is_game_over():
+                continue
+            side = board.current_player
+            other = "O" if side == "X" else "X"
+            fresh = AIPlayer("hard", search="alphabeta", tt_size=0)
+            fresh.set_symbols(side, other)
+            warm.set_symbols(side, other)
+            fresh.get_best_move(board)
+            warm.get_best_move(board)
+            assert warm.last_score == fresh.last_score
+
+    def test_set_limits(self):
+        """Test configuring and validating the search budget."""
+        ai = AIPlayer(search="iterative", time_limit=0.5, node_limit=100)
+        assert ai.time_limit == 0.5
+        assert ai.node_limit == 100
+
+        ai.set_limits()
+        assert ai.time_limit is None
+        assert ai.node_limit is None
+
+        with pytest.raises(ValueError):
+            ai.set_limits(time_limit=0)
+        with pytest.raises(ValueError):
+            ai.set_limits(node_limit=0)
+
+    def test_unlimited_search_plays_perfectly(self):
+        """Test that without limits the search is exact on 3x3."""
+        ai = AIPlayer(search="iterative")
+        board = Board()
+        board.make_move(0, 0, "X")
+        board.make_move(0, 1, "X")
+        assert ai.get_best_move(board) == (0, 2)
+
+        board = Board()
+        board.make_move(0, 0, "O")
+        board.make_move(1, 1, "O")
+        board.make_move(0, 1, "X")
+        assert ai.get_best_move(board) == (2, 2)
+
+    def test_self_play_is_a_draw(self):
+        """Test that two unlimited iterative players draw on 3x3."""
+        ai_o = AIPlayer(search="iterative")
+        ai_x = AIPlayer(search="iterative")
+        ai_x.set_symbols("X", "O")
+        board = Board()
+
+        while not board.is_game_over():
+            player = ai_x if board.current_player == "X" else ai_o
+            assert board.make_move(*player.get_best_move(board)) is True
+
+        assert board.check_winner() is None
+
+    def test_time_limit_on_large_board(self):
+        """Test that a large-board search returns within its time budget."""
+        ai = AIPlayer(search="iterative", time_limit=0.2)
+        board = Board(5, 4)
+        board.make_move(2, 2, "X")
+
+        start = time.perf_counter()
+        move = ai.get_best_move(board)
+        elapsed = time.perf_counter() - start
+
+        assert board.is_position_empty(*move)
+        assert elapsed < 1.0
+        assert ai.search_depth >= 1
+        assert board.undo_count == 0  # interrupted search left no stones
+
+    def test_clock_checks_follow_node_cost(self):
+        """Test that costly nodes make the search look at the clock sooner."""
+        ai = AIPlayer(search="iterative", time_limit=0.05)
+        board = Board(15, 5)
+        board.make_move(7, 7, "X")
+
+        start = time.perf_counter()
+        ai.get_best_move(board)
+        elapsed = time.perf_counter() - start
+
+        assert ai._clock_interval < CLOCK_CHECK_INTERVAL
+        assert elapsed < 0.1
+
+    def test_node_limit(self):
+        """Test that the node budget bounds the search."""
+        ai = AIPlayer(search="iterative", node_limit=200)
+        board = Board(4)
+        board.make_move(0, 0, "X")
+
+        move = ai.get_best_move(board)
+        assert board.is_position_empty(*move)
+        assert ai.nodes_searched <= 201
+        assert board.get_empty_positions() == Board(4).get_empty_positions()[1:]
+
+    def test_finds_win_and_block_on_large_board(self):
+        """Test that shallow iterations already find tactical moves."""
+        board = Board(6, 4)
+        for col in range(3):
+            board.make_move(5, col, "O")
+        board.make_move(0, 0, "X")
+        board.make_move(0, 1, "X")
+        board.make_move(0, 2, "X")
+
+        ai = AIPlayer(search="iterative", node_limit=500)
+        assert ai.get_best_move(board) == (5, 3)
+
+        ai.set_symbols("X", "O")
+        assert ai.get_best_move(board) == (0, 3)
+
+    def test_evaluate_is_bounded(self):
+        """Test that heuristic scores never reach proven win scores."""
+        ai = AIPlayer()
+        board = Board(4, 3)
+        assert ai._evaluate(board) == 0
+        for row, col in [(0, 0), (0, 1), (1, 1), (2, 2)]:
+            board.make_move(row, col, "O")
+        assert 0 < ai._evaluate(board) < 1
+
+        board = Board(4, 3)
+        board.make_move(1, 1, "X")
+        assert -1 < ai._evaluate(board) < 0
+
+
+class TestPrincipalVariation:
+    """Test cases for reading the expected line of play."""
+
+    @pytest.mark.parametrize("search", ["minimax", "alphabeta", "iterative"])
+    def test_line_is_consistent(self, search):
+        """Test that the line is legal, ends the game and matches the score."""
+        board = Board()
+        board.make_move(0, 0)
+        ai = AIPlayer("hard", search=search)
+        ai.set_symbols("O", "X")
+        move = ai.get_best_move(board)
+        line = ai.principal_variation(board, move)
+        assert board.get_empty_positions() == [
+            cell for cell in Board().get_empty_positions() if cell != (0, 0)
+        ]
+        assert line[0] == move
+        replay = board.copy()
+        for row, col in line:
+            assert replay.make_move(row, col)
+        assert replay.is_game_over()
+        assert ai.last_score == 0 and replay.check_winner() is None
+
+    def test_forced_win(self):
+        """Test the line and score of a forced win."""
+        board = Board()
+        for move in [(1, 1), (0, 1), (0, 0)]:
+            board.make_move(*move)
+        ai = AIPlayer("hard")
+        ai.set_symbols("O", "X")
+        move = ai.get_best_move(board)
+        line = ai.principal_variation(board, move)
+        assert move == (2, 2)
+        assert len(line) == 4
+        assert ai.last_score == -7  # X wins with the fourth move of the line
+        assert ai.principal_variation(board, move, max_length=2) == line[:2]
+
+
+class TestGameContext:
+    """Test cases for search state carried between moves of a game."""
+
+    @staticmethod
+    def _play(board, moves):
+        for move in moves:
+            board.make_move(*move)
+
+    def test_context_carries_over_and_resets(self):
+        """Test that one game keeps its context and a reset starts afresh."""
+        board = Board(4, 3)
+        ai = AIPlayer("hard", search="alphabeta")
+        ai.set_symbols("O", "X")
+        self._play(board, [(1, 1)])
+        move = ai.get_best_move(board)
+        context = ai.game_context
+        assert context.game_id == board.game_id and context.stones == 1
+        line = ai.principal_variation(board, move)
+        assert context.pv[position_key(board)] == move
+
+        # The expected reply leads to a position whose PV move is tried first.
+        self._play(board, line[:2])
+        assert ai._order_root(board)[0] == line[2]
+        history = dict(context.history)
+        ai.get_best_move(board)
+        assert ai.game_context is context and context.stones == 3
+        assert all(context.history.get(m, 0) >= s >> 1 for m, s in history.items())
+
+        board.reset()
+        self._play(board, [(0, 0)])
+        ai.get_best_move(board)
+        assert ai.game_context is not context
+        assert ai.game_context.game_id == board.game_id
+
+    def test_same_moves_as_fresh_players(self):
+        """Test that the carried context only changes move ordering."""
+        board = Board(4, 3)
+        ai = AIPlayer("hard", search="alphabeta")
+        ai.set_symbols("O", "X")
+        rng = random.Random(2)
+        while not board.is_game_over():
+            if board.current_player == "X":
+                board.make_move(*rng.choice(board.get_empty_positions()))
+                continue
+            fresh = AIPlayer("hard", search="alphabeta")
+            fresh.set_symbols("O", "X")
+            move = ai.get_best_move(board)
+            assert move == fresh.get_best_move(board)
+            assert ai.last_score == fresh.last_score
+            board.make_move(*move)
+
+    def test_earlier_position_starts_new_context(self):
+        """Test that going back in a game does not reuse later state."""
+        board = Board()
+        ai = AIPlayer("hard", search="iterative")
+        self._play(board, [(0, 0)])
+        earlier = board.copy()
+        self._play(board, [(1, 1), (2, 2)])
+        ai.get_best_move(board)
+        context = ai.game_context
+        ai.get_best_move(earlier)
+        assert ai.game_context is not context
+        assert ai.game_context.stones == 1
+
+
+class TestParallelSearch:
+    """Test cases for the root-split 'parallel' search mode."""
+
+    def test_same_moves_as_alphabeta(self):
+        """Test that splitting the root across workers picks the same moves."""
+        rng = random.Random(6)
+        parallel = AIPlayer("hard", search="parallel", search_workers=2)
+        serial = AIPlayer("hard", search="alphabeta")
+        try:
+            for _ in range(30):
+                board = Board()
+                for _ in range(rng.randrange(7)):
+                    if board.is_game_over():
+                        break
+                    board.make_move(*rng.choice(board.get_empty_positions()))
+                if board.is_game_over():
+                    continue
+                side = board.current_player
+                other = "O" if side == "X" else "X"
+                parallel.set_symbols(side, other)
+                serial.set_symbols(side, other)
+                assert parallel.get_best_move(board) == serial.get_best_move(board)
+                assert parallel.last_score == serial.last_score
+                assert parallel.nodes_searched > 0
+        finally:
+            parallel.close()
+        assert parallel._pool is None
+
+    def test_larger_board(self):
+        """Test a 4x4 position and that the board is left unchanged."""
+        board = Board(4, 3)
+        for move in [(1, 1), (2, 2), (1, 2)]:
+            board.make_move(*move)
+        ai = AIPlayer("hard", search="parallel", search_workers=2)
+        ai.set_symbols("O", "X")
+        try:
+            move = ai.get_best_move(board)
+        finally:
+            ai.close()
+        reference = AIPlayer("hard", search="alphabeta")
+        reference.set_symbols("O", "X")
+        assert move == reference.get_best_move(board)
+        assert board.undo_count == 0 and len(board.get_empty_positions()) == 13
+
+    def test_shared_table(self):
+        """Test that workers fill and use one shared transposition table."""
+        table = SharedTranspositionTable(50_000)
+        parallel = AIPlayer(
+            "hard", search="parallel", search_workers=2, transposition_table=table
+        )
+        serial = AIPlayer("hard", search="alphabeta")
+        rng = random.Random(3)
+        try:
+            for _ in range(10):
+                board = Board()
+                board.make_move(*rng.choice(board.get_empty_positions()))
+                parallel.set_symbols("O", "X")
+                serial.set_symbols("O", "X")
+                assert parallel.get_best_move(board) == serial.get_best_move(board)
+                assert parallel.last_score == serial.last_score
+            assert len(table) > 0
+        finally:
+            parallel.close()
+            table.close()
+            table.unlink()
+
+    def test_stop_reaches_workers(self):
+        """Test that a stop event ends the workers' search promptly."""
+        ai = AIPlayer("hard", search="parallel", search_workers=2)
+        stop = threading.Event()
+        timer = threading.Timer(0.05, stop.set)
+        try:
+            ai.get_best_move(Board(3, 3))
+            timer.start()
+            start = time.perf_counter()
+            with pytest.raises(SearchCancelled):
+                ai.get_best_move(Board(4, 4), stop)
+            assert time.perf_counter() - start < 1.0
+        finally:
+            timer.cancel()
+            ai.close()
+
+    def test_stopped_search_leaves_workers_usable(self):
+        """Test that a cancelled search does not cancel the next one."""
+        ai = AIPlayer("hard", search="parallel", search_workers=2)
+        stop = threading.Event()
+        stop.set()
+        board = Board()
+        board.make_move(1, 1)
+        ai.set_symbols("O", "X")
+        try:
+            with pytest.raises(SearchCancelled):
+                ai.get_best_move(Board(4, 4), stop)
+            assert ai.get_best_move(board) in [(0, 0), (0, 2), (2, 0), (2, 2)]
+            assert ai.last_score == 0
+        finally:
+            ai.close()
+
+    def test_stats(self):
+        """Test that workers report the positions they expanded."""
+        ai = AIPlayer("hard", search="parallel", search_workers=2, collect_stats=True)
+        board = Board()
+        board.make_move(1, 1)
+        ai.set_symbols("O", "X")
+        try:
+            ai.get_best_move(board)
+        finally:
+            ai.close()
+        stats = ai.last_stats
+        assert stats.nodes == ai.nodes_searched
+        assert 0 < stats.expanded < stats.nodes
+        assert 2 < stats.max_depth <= 8
+        assert 1 < stats.branching_factor < 8
+
+    def test_workers_option(self):
+        """Test configuring the number of workers."""
+        assert AIPlayer(search="parallel", search_workers=3).search_workers == 3
+        assert AIPlayer(search="parallel").search_workers >= 1
+        with pytest.raises(ValueError):
+            AIPlayer(search="parallel", search_workers=0)
+
+
+class TestBatchedMoves:
+    """Test cases for get_best_moves."""
+
+    @staticmethod
+    def _boards():
+        boards = []
+        for moves in [
+            [(0, 0, "X")],
+            [(1, 1, "X")],
+            [(0, 0, "X"), (0, 1, "X"), (1, 1, "O")],
+            [(0, 0, "X")],
+            [(2, 2, "X"), (1, 1, "O"), (0, 0, "X")],
+        ]:
+            board = Board()
+            for row, col, player in moves:
+                board.make_move(row, col, player)
+            boards.append(board)
+        return boards
+
+    def test_matches_single_calls(self):
+        """Test that batched moves equal one-by-one moves, in order."""
+        boards = self._boards()
+        expected = [AIPlayer("hard").get_best_move(board) for board in boards]
+        assert AIPlayer("hard").get_best_moves(boards) == expected
+
+    def test_deduplicates_positions(self):
+        """Test that identical positions are only searched once."""
+        boards = self._boards()
+        ai = AIPlayer("hard")
+        with patch.object(ai, "get_best_move", wraps=ai.get_best_move) as spy:
+            moves = ai.get_best_moves(boards)
+        assert spy.call_count == 4
+        assert moves[0] == moves[3]
+
+    def test_worker_processes(self):
+        """Test splitting a batch across worker processes."""
+        boards = self._boards() * 3
+        expected = AIPlayer("hard").get_best_moves(boards)
+        assert AIPlayer("hard").get_best_moves(boards, workers=2) == expected
+
+    def test_workers_get_player_without_table(self):
+        """Test that workers get the player once and no table entries."""
+        ai = AIPlayer("hard", search="alphabeta")
+        ai.get_best_move(Board())
+        table = ai.transposition_table
+        entries = len(table)
+        assert entries > 0
+        copy = pickle.loads(ai._pickle_for_workers())
+        assert ai.transposition_table is table and len(table) == entries
+        assert len(copy.transposition_table) == 0
+        assert copy.transposition_table.max_size == table.max_size
+
+        boards = self._boards() * 3
+        original = AIPlayer._pickle_for_workers
+        with patch.object(
+            AIPlayer, "_pickle_for_workers", autospec=True, side_effect=original
+        ) as spy:
+            moves = ai.get_best_moves(boards, workers=2)
+        assert spy.call_count == 1
+        assert moves == AIPlayer("hard").get_best_moves(boards)
+
+    def test_keys_ignore_move_order(self):
+        """Test that transposed positions are deduplicated."""
+        first, second = Board(5, 4), Board(5, 4)
+        for row, col in [(0, 0), (2, 2), (4, 4)]:
+            first.make_move(row, col)
+        for row, col in [(4, 4), (2, 2), (0, 0)]:
+            second.make_move(row, col)
+        assert position_key(first) == position_key(second)
+        assert position_key(first) != position_key(Board(5, 4))
+        assert position_key(Board(5, 4)) != position_key(Board(5, 3))
+
+    def test_non_hard_difficulties(self):
+        """Test that other difficulties answer every board."""
+        boards = self._boards()
+        moves = AIPlayer("easy").get_best_moves(boards)
+        assert len(moves) == len(boards)
+        assert all(b.is_position_empty(*m) for b, m in zip(boards, moves))
+
+    def test_invalid_workers(self):
+        """Test that a non-positive worker count is rejected."""
+        with pytest.raises(ValueError):
+            AIPlayer().get_best_moves([], workers=0)
+        assert AIPlayer().get_best_moves([]) == []
+
+
+class TestSearchStats:
+    """Test cases for per-move search statistics."""
+
+    @staticmethod
+    def _opening():
+        board = Board()
+        board.make_move(0, 0)
+        board.make_move(1, 1)
+        return board
+
+    def test_disabled_by_default(self):
+        """Test that no statistics are kept unless asked for."""
+        ai = AIPlayer("hard")
+        ai.get_best_move(self._opening())
+        assert ai.last_stats is None
+
+    def test_minimax_stats(self):
+        """Test the statistics of a plain minimax search."""
+        ai = AIPlayer("hard", tt_size=0, collect_stats=True)
+        ai.set_symbols("X", "O")
+        ai.get_best_move(self._opening())
+        stats = ai.last_stats
+
+        assert stats.method == "minimax"
+        assert stats.nodes == ai.nodes_searched > 0
+        # Seven empty cells: the deepest line fills the board.
+        assert stats.max_depth == 7
+        assert stats.tt_hits == stats.tt_misses == 0
+        assert stats.tt_hit_rate == 0.0
+        assert 1 < stats.branching_factor < 7
+        assert stats.wall_time > 0
+
+    def test_table_hits_and_misses(self):
+        """Test that transposition table lookups are counted per move."""
+        ai = AIPlayer("hard", collect_stats=True)
+        board = self._opening()
+        ai.get_best_move(board)
+        first = ai.last_stats
+        assert first.tt_misses > 0
+        assert first.tt_hits + first.tt_misses == (
+            ai.transposition_table.hits + ai.transposition_table.misses
+        )
+
+        ai.get_best_move(board)
+        second = ai.last_stats
+        assert second.tt_misses == 0
+        assert second.nodes < first.nodes
+
+    def test_alphabeta_visits_fewer_nodes(self):
+        """Test that the statistics reflect alpha-beta pruning."""
+        minimax = AIPlayer("hard", tt_size=0, collect_stats=True)
+        alphabeta = AIPlayer("hard", tt_size=0, search="alphabeta", collect_stats=True)
+        minimax.get_best_move(self._opening())
+        alphabeta.get_best_move(self._opening())
+        assert alphabeta.last_stats.method == "alphabeta"
+        assert alphabeta.last_stats.nodes < minimax.last_stats.nodes
+        assert (
+            alphabeta.last_stats.branching_factor < minimax.last_stats.branching_factor
+        )
+
+    def test_iterative_depth(self):
+        """Test that a depth-limited search reports its horizon."""
+        ai = AIPlayer(
+            "hard", search="iterative", node_limit=50, tt_size=0, collect_stats=True
+        )
+        ai.get_best_move(Board(4, 3))
+        assert 1 <= ai.last_stats.max_depth <= ai.search_depth + 1
+
+    def test_callback(self):
+        """Test that the callback receives the statistics of every move."""
+        seen = []
+        ai = AIPlayer("hard", stats_callback=seen.append)
+        board = self._opening()
+        ai.get_best_move(board)
+        ai.get_best_move(board)
+        assert len(seen) == 2
+        assert seen[-1] is ai.last_stats
+
+    def test_other_methods(self):
+        """Test the method names of non-searching move choices."""
+        board = self._opening()
+        for difficulty, method in (("easy", "random"), ("medium", "medium")):
+            ai = AIPlayer(difficulty, collect_stats=True)
+            ai.get_best_move(board)
+            assert ai.last_stats.method == method
+            assert ai.last_stats.nodes == 0
+
+        ai = AIPlayer("hard", use_solution_table=True, collect_stats=True)
+        ai.set_symbols("X", "O")
+        ai.get_best_move(board)
+        assert ai.last_stats.method == "table"
+        assert ai.last_stats.nodes == 0
+
+    def test_as_dict(self):
+        """Test exporting statistics as a flat dict."""
+        ai = AIPlayer("hard", collect_stats=True)
+        ai.get_best_move(self._opening())
+        data = ai.last_stats.as_dict()
+        assert data["nodes"] == ai.last_stats.nodes
+        assert data["branching_factor"] == ai.last_stats.branching_factor
+        assert set(data) >= {"max_depth", "tt_hits", "tt_misses", "wall_time"}
+
+    def test_callback_with_worker_processes(self):
+        """Test that an unpicklable callback does not break worker pools."""
+        seen = []
+        ai = AIPlayer("hard", stats_callback=lambda stats: seen.append(stats))
+        boards = [self._opening(), Board()]
+        assert ai.get_best_moves(boards, workers=2) == AIPlayer().get_best_moves(boards)
+
+
+class TestAsyncSearch:
+    """Test cases for the cancellable asynchronous search."""
+
+    def test_same_move_as_sync(self):
+        """Test that the async search answers like the blocking one."""
+        board = Board()
+        board.make_move(0, 0)
+        expected = AIPlayer("hard").get_best_move(board)
+        move = asyncio.run(AIPlayer("hard").get_best_move_async(board))
+        assert move == expected
+
+    def test_timeout_stops_search(self):
+        """Test that a timed-out search frees its thread promptly."""
+        # Plain minimax from the empty board takes seconds.
+        ai = AIPlayer("hard", tt_size=0)
+
+        async def scenario():
+            with ThreadPoolExecutor(1) as executor:
+                with pytest.raises(asyncio.TimeoutError):
+                    await ai.get_best_move_async(Board(), 0.05, executor)
+                # The single worker thread must be free again for this.
+                start = time.perf_counter()
+                board = Board()
+                board.make_move(1, 1)
+                board.make_move(0, 0)
+                quick = AIPlayer("hard")
+                await quick.get_best_move_async(board, executor=executor)
+                return time.perf_counter() - start
+
+        assert asyncio.run(scenario()) < 1.0
+
+    def test_task_cancellation(self):
+        """Test that cancelling the awaiting task cancels the search."""
+        ai = AIPlayer("hard", tt_size=0, search="alphabeta")
+        board = Board(4, 3)
+
+        async def scenario():
+            task = asyncio.ensure_future(ai.get_best_move_async(board))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+
+    def test_stopped_search(self):
+        """Test that a search stopped midway leaves its own board unchanged."""
+        for search in ("minimax", "alphabeta"):
+            board = Board(4, 3)
+            stop = threading.Event()
+            depths = []
+            push = board.push
+
+            def push_then_stop(row, col, player):
+                push(row, col, player)
+                depths.append(board.undo_count)
+                if len(depths) == 200:
+                    stop.set()
+
+            board.push = push_then_stop
+            ai = AIPlayer("hard", tt_size=0, search=search)
+            with pytest.raises(SearchCancelled):
+                ai.get_best_move(board, stop=stop)
+            assert max(depths) > 1  # stones were down when the stop came
+            assert board.undo_count == 0
+            assert board.get_empty_positions() == Board(4, 3).get_empty_positions()
+
+        # Iterative deepening keeps the best move found so far.
+        stop = threading.Event()
+        stop.set()
+        board = Board()
+        ai = AIPlayer("hard", tt_size=0, search="iterative")
+        assert (
+            ai.get_best_move(Board(5, 4), stop=stop)
+            in Board(5, 4).get_empty_positions()
+        )
+        assert ai._stop is None
+
+        # The player works normally afterwards.
+        assert ai.get_best_move(board) in board.get_empty_positions()
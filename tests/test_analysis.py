@@ -0,0 +1,115 @@
+"""Unit tests for streaming position analysis."""
+
+import pytest
+
+from src.tictactoe.analysis import (
+    AnalysisResult,
+    analysis_player,
+    analyze_lines,
+    analyze_position,
+)
+
+POSITIONS = [
+    "X.O/.X./...",
+    "",
+    "# comment",
+    ".../.../...",
+    "XXX/OO./...",
+    "XOX/XOO/OXX",
+    "XX./.../...",
+    "..../.X../..O./....:3",
+    "bad",
+]
+
+
+class TestAnalyzePosition:
+    """Test cases for analysing single positions."""
+
+    def test_best_move_score_and_line(self):
+        """Test the fields of a result line."""
+        ai = analysis_player()
+        assert analyze_position(ai, "XX./OO./...").split("\t") == [
+            "XX./OO./...",
+            "c1",
+            "mate 1",
+            "c1",
+        ]
+        position, move, score, line = analyze_position(ai, "X.O/.X./...").split("\t")
+        assert (move, score) == ("c3", "cp 0")
+        assert line.split()[0] == "c3" and len(line.split()) == 6
+
+    def test_side_to_move(self):
+        """Test that O is analysed when X has one more stone."""
+        ai = analysis_player()
+        assert analyze_position(ai, "OO./XX./X..").split("\t")[1:3] == [
+            "c1",
+            "mate 1",
+        ]
+
+    def test_finished_positions(self):
+        """Test the result of won and drawn positions."""
+        ai = analysis_player()
+        assert analyze_position(ai, "XXX/OO./...") == "XXX/OO./...\t-\tresult X\t"
+        assert analyze_position(ai, "xox/xoo/oxx").endswith("\tresult draw\t")
+
+    def test_invalid_positions(self):
+        """Test that malformed and unreachable positions are rejected."""
+        ai = analysis_player()
+        for text in ["bad", "XX./.../...", "O../.../..."]:
+            with pytest.raises(ValueError):
+                analyze_position(ai, text)
+
+
+class TestAnalyzeLines:
+    """Test cases for analysing streams of positions."""
+
+    def test_results_in_input_order(self):
+        """Test that every position line gets one result, in order."""
+        results = list(analyze_lines(iter(POSITIONS), chunk_size=2))
+        assert [result.line_number for result in results] == [1, 4, 5, 6, 7, 8, 9]
+        assert results[0].output.startswith("X.O/.X./...\tc3\t")
+        assert results[2].output.endswith("result X\t")
+        assert results[4] == AnalysisResult(
+            7, None, "Impossible stone counts in position 'XX./.../...'"
+        )
+        assert results[6].error is not None
+
+    def test_mixed_board_variants(self):
+        """Test that one stream may switch win length between positions."""
+        results = list(analyze_lines(["X../.../...:2", "X../.../..."]))
+        assert [result.output.split("\t")[1:3] for result in results] == [
+            ["b2", "mate -2"],
+            ["b2", "cp 0"],
+        ]
+
+    def test_workers_match_serial(self):
+        """Test that a worker pool gives the same scores, in order."""
+
+        def scores(results):
+            return [
+                (result.line_number, result.output and result.output.split("\t")[2])
+                for result in results
+            ]
+
+        lines = POSITIONS * 3
+        serial = scores(analyze_lines(lines))
+        assert scores(analyze_lines(lines, workers=2, chunk_size=4)) == serial
+
+    def test_reads_lazily(self):
+        """Test that input is consumed a chunk at a time."""
+        consumed = []
+
+        def lines():
+            for line in [".../.../..."] * 10:
+                consumed.append(line)
+                yield line
+
+        results = analyze_lines(lines(), chunk_size=3)
+        next(results)
+        assert len(consumed) == 3
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        for options in [{"workers": 0}, {"chunk_size": 0}, {"node_limit": 0}]:
+            with pytest.raises(ValueError):
+                next(analyze_lines([], **options))
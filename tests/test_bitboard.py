@@ -0,0 +1,151 @@
+"""Unit tests for the BitBoard class."""
+
+import random
+
+import pytest
+
+from src.tictactoe.ai import AIPlayer
+from src.tictactoe.bitboard import LINE_MASKS, WINNING_MASKS, BitBoard
+from src.tictactoe.board import Board
+
+
+class TestBitBoard:
+    """Test cases for the BitBoard class."""
+
+    def test_line_masks(self):
+        """Test that all eight winning lines are precomputed."""
+        assert len(LINE_MASKS) == 8
+        assert all(bin(mask).count("1") == 3 for mask in LINE_MASKS)
+        assert all(WINNING_MASKS[mask] for mask in LINE_MASKS)
+        assert WINNING_MASKS[0] is False
+
+    def test_board_initialization(self):
+        """Test that board initializes correctly."""
+        board = BitBoard()
+        assert board.current_player == "X"
+        assert board.grid == [[None, None, None] for _ in range(3)]
+        assert not board.is_full()
+        assert not board.is_game_over()
+
+    def test_make_move(self):
+        """Test valid, invalid and occupied moves."""
+        board = BitBoard()
+
+        assert board.make_move(0, 0) is True
+        assert board.grid[0][0] == "X"
+        assert board.current_player == "O"
+
+        assert board.make_move(0, 0) is False
+        assert board.make_move(3, 0) is False
+        assert board.make_move(0, -1) is False
+
+        assert board.make_move(1, 1, "X") is True
+        assert board.current_player == "O"
+
+    def test_is_position_empty(self):
+        """Test checking if position is empty."""
+        board = BitBoard()
+        board.make_move(2, 1)
+        assert board.is_position_empty(2, 1) is False
+        assert board.is_position_empty(1, 2) is True
+        assert board.is_position_empty(-1, 0) is False
+
+    def test_check_winner(self):
+        """Test winner detection on rows, columns and diagonals."""
+        for cells in [
+            [(1, 0), (1, 1), (1, 2)],
+            [(0, 2), (1, 2), (2, 2)],
+            [(0, 0), (1, 1), (2, 2)],
+            [(0, 2), (1, 1), (2, 0)],
+        ]:
+            board = BitBoard()
+            for row, col in cells:
+                assert board.check_winner() is None
+                board.make_move(row, col, "O")
+            assert board.check_winner() == "O"
+            assert board.is_game_over() is True
+
+    def test_reset_and_copy(self):
+        """Test that copies are independent and reset clears the board."""
+        board = BitBoard()
+        board.make_move(0, 0)
+        board_copy = board.copy()
+
+        board_copy.make_move(2, 2)
+        assert board.is_position_empty(2, 2) is True
+        assert board_copy.current_player == "X"
+
+        assert board_copy.game_id == board.game_id
+        board.reset()
+        assert board.get_empty_positions() == Board().get_empty_positions()
+        assert board.current_player == "X"
+        assert board.game_id != board_copy.game_id
+
+    def test_push_and_pop(self):
+        """Test in-place moves and undo."""
+        board = BitBoard()
+        board.make_move(0, 0)
+
+        board.push(0, 1, "X")
+        board.push(0, 2, "X")
+        assert board.check_winner() == "X"
+        assert board.current_player == "O"
+
+        assert board.pop() == (0, 2)
+        assert board.check_winner() is None
+        assert board.pop() == (0, 1)
+        assert board.get_empty_positions() == Board().get_empty_positions()[1:]
+
+    def test_matches_board_on_random_games(self):
+        """Test that BitBoard agrees with Board over random games."""
+        rng = random.Random(1234)
+        for _ in range(200):
+            board, bitboard = Board(), BitBoard()
+            while not board.is_game_over():
+                row, col = rng.choice(board.get_empty_positions())
+                board.make_move(row, col)
+                bitboard.make_move(row, col)
+                assert bitboard.grid == board.grid
+                assert bitboard.zobrist_hash == board.zobrist_hash
+                for player in ("X", "O"):
+                    assert bitboard.canonical_key(player) == board.canonical_key(player)
+                assert bitboard.check_winner() == board.check_winner()
+                assert bitboard.is_full() == board.is_full()
+                assert bitboard.get_empty_positions() == board.get_empty_positions()
+            assert str(bitboard) == str(board)
+
+    @pytest.mark.parametrize(
+        "search", ["minimax", "alphabeta", "iterative", "parallel"]
+    )
+    def test_hard_ai_plays_same_moves(self, search):
+        """Test that the hard AI picks the same moves on either board."""
+        board, bitboard = Board(), BitBoard()
+        ai = AIPlayer("hard", search=search, search_workers=2)
+        reference = AIPlayer("hard", search=search, search_workers=2)
+        try:
+            for row, col in [(0, 0), (1, 1), (2, 2)]:
+                board.make_move(row, col)
+                bitboard.make_move(row, col)
+                side = board.current_player
+                other = "O" if side == "X" else "X"
+                ai.set_symbols(side, other)
+                reference.set_symbols(side, other)
+                assert ai.get_best_move(bitboard) == reference.get_best_move(board)
+                assert ai.last_score == reference.last_score
+                assert bitboard.grid == board.grid
+        finally:
+            ai.close()
+            reference.close()
+
+    def test_batched_moves(self):
+        """Test that bitboards can be searched in a batch."""
+        bitboard = BitBoard()
+        bitboard.make_move(1, 1)
+        ai = AIPlayer("hard")
+        ai.set_symbols("O", "X")
+        reference = AIPlayer("hard")
+        reference.set_symbols("O", "X")
+        assert (
+            ai.get_best_moves([bitboard, bitboard.copy()])
+            == [reference.get_best_move(bitboard)] * 2
+        )
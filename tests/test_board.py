@@ -1,6 +1,28 @@
 """Unit tests for the Board class."""
 
-from src.tictactoe.board import Board
+import random
+
+import pytest
+
+from src.tictactoe.board import Board, zobrist_keys
+
+
+def _scan_winner(grid, win_length):
+    """Reference winner check that scans every line of the grid."""
+    size = len(grid)
+    for row in range(size):
+        for col in range(size):
+            player = grid[row][col]
+            if player is None:
+                continue
+            for d_row, d_col in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                cells = [(row + i * d_row, col + i * d_col) for i in range(win_length)]
+                if all(
+                    0 <= r < size and 0 <= c < size and grid[r][c] == player
+                    for r, c in cells
+                ):
+                    return player
+    return None
 
 
 class TestBoard:
@@ -288,6 +310,32 @@ class TestBoard:
         board_copy.make_move(2, 2)
         assert board_copy.grid != board.grid
 
+    def test_push_and_pop(self):
+        """Test in-place moves and undo."""
+        board = Board()
+        board.make_move(0, 0)
+
+        board.push(1, 1, "O")
+        board.push(2, 2, "X")
+        assert board.grid[1][1] == "O"
+        assert board.grid[2][2] == "X"
+        assert board.current_player == "O"  # push never switches players
+
+        assert board.pop() == (2, 2)
+        assert board.pop() == (1, 1)
+        assert board.grid == [["X", None, None], [None, None, None], [None] * 3]
+
+    def test_pop_restores_winner_state(self):
+        """Test that undoing a winning move clears the win."""
+        board = Board()
+        board.make_move(0, 0, "X")
+        board.make_move(0, 1, "X")
+
+        board.push(0, 2, "X")
+        assert board.check_winner() == "X"
+        board.pop()
+        assert board.check_winner() is None
+
     def test_integration_full_game(self):
         """Test a complete game scenario."""
         board = Board()
@@ -301,3 +349,216 @@ class TestBoard:
 
         assert board.check_winner() == "X"
         assert board.is_game_over() is True
+
+
+class TestGeneralizedBoard:
+    """Test cases for N x N boards with a K-in-a-row rule."""
+
+    def test_default_is_classic(self):
+        """Test that the default board is 3x3, three in a row."""
+        board = Board()
+        assert board.size == 3
+        assert board.win_length == 3
+
+    def test_custom_dimensions(self):
+        """Test creating larger boards."""
+        board = Board(5, 4)
+        assert board.grid == [[None] * 5 for _ in range(5)]
+        assert len(board.get_empty_positions()) == 25
+        assert board.is_valid_position(4, 4) is True
+        assert board.is_valid_position(5, 0) is False
+        assert board.make_move(4, 4) is True
+
+        assert Board(4).win_length == 4
+
+    def test_invalid_dimensions(self):
+        """Test that impossible dimensions are rejected."""
+        with pytest.raises(ValueError):
+            Board(0)
+        with pytest.raises(ValueError):
+            Board(3, 4)
+        with pytest.raises(ValueError):
+            Board(3, 0)
+
+    def test_string_representation(self):
+        """Test that separators scale with the board."""
+        lines = str(Board(4)).split("\n")
+        assert len(lines) == 7
+        assert lines[1] == "-" * 15
+
+    def test_k_in_a_row_wins(self):
+        """Test wins shorter than the board width in every direction."""
+        for cells in [
+            [(2, 0), (2, 1), (2, 2), (2, 3)],
+            [(1, 4), (2, 4), (3, 4), (4, 4)],
+            [(1, 0), (2, 1), (3, 2), (4, 3)],
+            [(0, 4), (1, 3), (2, 2), (3, 1)],
+        ]:
+            board = Board(5, 4)
+            for row, col in cells[:-1]:
+                board.make_move(row, col, "X")
+                assert board.check_winner() is None
+            board.make_move(cells[-1][0], cells[-1][1], "X")
+            assert board.check_winner() == "X"
+
+    def test_win_completed_in_the_middle(self):
+        """Test a win whose last stone fills a gap inside the line."""
+        board = Board(15, 5)
+        for col in [3, 4, 6, 7]:
+            board.make_move(7, col, "O")
+        assert board.check_winner() is None
+        board.make_move(7, 5, "O")
+        assert board.check_winner() == "O"
+
+    def test_interrupted_line_does_not_win(self):
+        """Test that an opponent stone breaks a line."""
+        board = Board(6, 4)
+        for col, player in [(0, "X"), (1, "X"), (2, "O"), (3, "X"), (4, "X")]:
+            board.make_move(0, col, player)
+        assert board.check_winner() is None
+
+    def test_matches_full_scan_on_random_games(self):
+        """Test incremental detection against a full scan of the grid."""
+        rng = random.Random(42)
+        for size, win_length in [(3, 3), (4, 3), (5, 4), (7, 5)]:
+            for _ in range(50):
+                board = Board(size, win_length)
+                while not board.is_game_over():
+                    board.make_move(*rng.choice(board.get_empty_positions()))
+                    assert board.check_winner() == _scan_winner(board.grid, win_length)
+
+    def test_copy_and_reset_keep_dimensions(self):
+        """Test that copy and reset preserve size and win length."""
+        board = Board(4, 3)
+        board.make_move(0, 0)
+        board_copy = board.copy()
+        assert (board_copy.size, board_copy.win_length) == (4, 3)
+
+        board.reset()
+        assert board.grid == [[None] * 4 for _ in range(4)]
+        assert board.win_length == 3
+
+    def test_game_id(self):
+        """Test that copies share the game serial and reset starts a new one."""
+        board = Board()
+        board.make_move(1, 1)
+        game_id = board.game_id
+        assert board.copy().game_id == game_id
+        assert Board().game_id != game_id
+
+        board.reset()
+        assert board.game_id > game_id
+
+    def test_from_grid(self):
+        """Test that a board built from a grid matches the replayed game."""
+        rng = random.Random(11)
+        for size, win_length in [(3, 3), (4, 3), (5, 4)]:
+            played = Board(size, win_length)
+            while not played.is_game_over():
+                played.make_move(*rng.choice(played.get_empty_positions()))
+                board = Board.from_grid(played.grid, win_length, played.current_player)
+                assert board.grid == played.grid and board.grid is not played.grid
+                assert board.zobrist_hash == played.zobrist_hash
+                assert board.check_winner() == played.check_winner()
+                assert board.is_full() == played.is_full()
+                assert board.current_player == played.current_player
+                assert board.undo_count == 0
+
+        with pytest.raises(ValueError):
+            Board.from_grid([[None, None], [None]])
+
+
+def _scan_hash(board):
+    """Recompute a board's Zobrist hash from scratch."""
+    keys = zobrist_keys(board.size)
+    value = 0
+    for row, cells in enumerate(board.grid):
+        for col, cell in enumerate(cells):
+            if cell is not None:
+                value ^= keys[cell][row * board.size + col]
+    return value
+
+
+class TestZobristHash:
+    """Test cases for the incremental Zobrist hash."""
+
+    def test_empty_board(self):
+        """Test that an empty board hashes to zero."""
+        assert Board().zobrist_hash == 0
+        assert Board(7, 5).zobrist_hash == 0
+
+    def test_matches_full_scan(self):
+        """Test the incremental hash against a full recomputation."""
+        rng = random.Random(7)
+        for size, win_length in [(3, 3), (4, 3), (6, 4)]:
+            board = Board(size, win_length)
+            while not board.is_game_over():
+                board.make_move(*rng.choice(board.get_empty_positions()))
+                assert board.zobrist_hash == _scan_hash(board)
+                row, col = rng.choice(board.get_empty_positions() or [(0, 0)])
+                if board.is_position_empty(row, col):
+                    board.push(row, col, "O")
+                    assert board.zobrist_hash == _scan_hash(board)
+                    board.pop()
+                    assert board.zobrist_hash == _scan_hash(board)
+
+    def test_move_order_independent(self):
+        """Test that transpositions share a hash."""
+        first = Board()
+        first.make_move(0, 0, "X")
+        first.make_move(1, 1, "O")
+        first.make_move(2, 2, "X")
+        second = Board()
+        second.make_move(2, 2, "X")
+        second.make_move(1, 1, "O")
+        second.make_move(0, 0, "X")
+        assert first.zobrist_hash == second.zobrist_hash
+
+        swapped = Board()
+        swapped.make_move(0, 0, "O")
+        assert swapped.zobrist_hash != Board().zobrist_hash
+        assert swapped.zobrist_hash != _scan_hash(first)
+
+    def test_distinct_positions(self):
+        """Test that every reachable 3x3 position has its own hash."""
+        hashes = {}
+        stack = [Board()]
+        seen = set()
+        while stack:
+            current = stack.pop()
+            cells = tuple(cell for row in current.grid for cell in row)
+            if cells in seen:
+                continue
+            seen.add(cells)
+            assert hashes.setdefault(current.zobrist_hash, cells) == cells
+            if not current.is_game_over():
+                for row, col in current.get_empty_positions():
+                    child = current.copy()
+                    child.make_move(row, col)
+                    stack.append(child)
+        assert len(hashes) == 5478
+
+    def test_reset_and_copy(self):
+        """Test that reset clears the hash and copy keeps it."""
+        board = Board(5, 4)
+        board.make_move(2, 2)
+        board_copy = board.copy()
+        assert board_copy.zobrist_hash == board.zobrist_hash != 0
+
+        board.reset()
+        assert board.zobrist_hash == 0
+        assert board_copy.zobrist_hash == _scan_hash(board_copy)
+
+    def test_other_symbols(self):
+        """Test that symbols other than X and O are hashed too."""
+        board = Board()
+        board.make_move(0, 0, "Z")
+        assert board.zobrist_hash not in (0, _scan_hash(Board()))
+        board.push(1, 1, "Z")
+        board.pop()
+        assert board.zobrist_hash == zobrist_keys(3)["Z"][0]
+
+    def test_stable_across_instances(self):
+        """Test that hashes depend only on the position, not the instance."""
+        assert zobrist_keys(4) is zobrist_keys(4)
+        assert zobrist_keys(3)["X"] != zobrist_keys(4)["X"][:9]
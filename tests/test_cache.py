@@ -0,0 +1,163 @@
+"""Unit tests for the persistent position cache."""
+
+import asyncio
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.tictactoe.ai import AIPlayer
+from src.tictactoe.board import Board
+from src.tictactoe.cache import PositionCache, cache_key
+
+
+def _board(*moves):
+    """A 3x3 board after the given moves."""
+    board = Board()
+    for move in moves:
+        board.make_move(*move)
+    return board
+
+
+class TestPositionCache:
+    """Test cases for the PositionCache class."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test storing results and reading them back after reopening."""
+        board = _board((1, 1))
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            assert cache.get(board, "O") is None
+            cache.put(board, "O", (0, 0), 0, 8)
+            cache.put(_board((0, 0)), "O", (1, 1), -0.25, 2)
+            assert cache.get(board, "O") == ((0, 0), 0, 8)
+            assert cache.get(board, "X") is None
+            assert (cache.hits, cache.misses) == (1, 2)
+
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            assert len(cache) == 2
+            assert cache.get(_board((0, 0)), "O") == ((1, 1), -0.25, 2)
+            cache.clear()
+            assert len(cache) == 0
+            assert cache.hits == 0
+
+    def test_deeper_results_win(self, tmp_path):
+        """Test that a shallower result does not replace a deeper one."""
+        board = _board((1, 1))
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            cache.put(board, "O", (0, 0), 0.5, 4)
+            cache.put(board, "O", (0, 1), 0.1, 2)
+            assert cache.get(board, "O").move == (0, 0)
+            cache.put(board, "O", (2, 2), 0, 8)
+            assert cache.get(board, "O") == ((2, 2), 0, 8)
+            assert len(cache) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted first."""
+        boards = [_board((0, col)) for col in range(3)]
+        with PositionCache(tmp_path / "ai.cache", max_entries=2) as cache:
+            cache.put(boards[0], "O", (1, 1), 0, 8)
+            cache.put(boards[1], "O", (1, 1), 0, 8)
+            cache.get(boards[0], "O")
+            cache.put(boards[2], "O", (1, 1), 0, 8)
+
+            assert len(cache) == 2
+            assert cache.get(boards[0], "O") is not None
+            assert cache.get(boards[1], "O") is None
+            assert cache.get(boards[2], "O") is not None
+
+    def test_key(self):
+        """Test that keys hold the dimensions, player and cells."""
+        board = Board(4, 3)
+        board.make_move(0, 1)
+        assert cache_key(board, "O") == "4 3 O .X.............."
+
+    def test_invalid(self, tmp_path):
+        """Test rejecting bad sizes and files that are not caches."""
+        with pytest.raises(ValueError):
+            PositionCache(tmp_path / "ai.cache", max_entries=0)
+        path = tmp_path / "not-a-cache"
+        path.write_bytes(b"not a database" * 100)
+        with pytest.raises(ValueError):
+            PositionCache(path)
+
+
+class TestAIWithCache:
+    """Test cases for the hard AI consulting a position cache."""
+
+    def test_cached_move_skips_search(self, tmp_path):
+        """Test that a restarted player answers from the cache."""
+        board = _board((1, 1))
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            first = AIPlayer("hard", search="alphabeta", cache=cache)
+            move = first.get_best_move(board)
+            assert first.nodes_searched > 0
+            assert len(cache) == 1
+
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            second = AIPlayer(
+                "hard", search="alphabeta", cache=cache, collect_stats=True
+            )
+            assert second.get_best_move(board) == move
+            assert second.nodes_searched == 0
+            assert second.last_score == first.last_score
+            assert second.last_stats.method == "cache"
+
+    def test_shallow_results_only_serve_budgeted_searches(self, tmp_path):
+        """Test that exhaustive searches ignore unsolved cached positions."""
+        board = _board((1, 1))
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            cache.put(board, "O", (0, 1), 0.5, 2)
+            budgeted = AIPlayer("hard", search="iterative", node_limit=10, cache=cache)
+            assert budgeted.get_best_move(board) == (0, 1)
+            assert budgeted.nodes_searched == 0
+
+            exhaustive = AIPlayer("hard", search="alphabeta", cache=cache)
+            assert exhaustive.get_best_move(board) != (0, 1)
+            assert exhaustive.nodes_searched > 0
+            assert cache.get(board, "O").depth == 8
+
+    def test_budgeted_search_stores_reached_depth(self, tmp_path):
+        """Test that an unfinished search is cached at the depth it reached."""
+        board = Board(5, 4)
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            ai = AIPlayer("hard", search="iterative", node_limit=500, cache=cache)
+            ai.get_best_move(board)
+            assert 0 < cache.get(board, "O").depth == ai.search_depth < 25
+
+    def test_search_from_other_threads(self, tmp_path):
+        """Test that a cached player may search outside its creating thread."""
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            ai = AIPlayer("hard", search="alphabeta", cache=cache)
+            move = asyncio.run(ai.get_best_move_async(_board((1, 1))))
+            assert cache.get(_board((1, 1)), "O").move == move
+
+            moves = []
+            thread = threading.Thread(
+                target=lambda: moves.append(ai.get_best_move(_board((0, 0))))
+            )
+            thread.start()
+            thread.join()
+            assert moves == [(1, 1)]
+            assert len(cache) == 2
+
+    def test_concurrent_use(self, tmp_path):
+        """Test that threads sharing one cache do not corrupt it."""
+        boards = [_board((row, col)) for row in range(3) for col in range(3)]
+
+        def store(board):
+            cache.put(board, "O", (0, 0), 0, 8)
+            return cache.get(board, "O")
+
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            with ThreadPoolExecutor(4) as executor:
+                entries = list(executor.map(store, boards * 5))
+            assert all(entry == ((0, 0), 0, 8) for entry in entries)
+            assert len(cache) == 9
+            assert cache.hits == 45
+
+    def test_player_pickles_without_cache(self, tmp_path):
+        """Test that worker copies of a player leave the cache behind."""
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            ai = AIPlayer("hard", cache=cache)
+            assert pickle.loads(pickle.dumps(ai)).cache is None
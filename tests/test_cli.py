@@ -5,7 +5,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.tictactoe.ai import AIPlayer
 from src.tictactoe.board import Board
+from src.tictactoe.cache import PositionCache
 from src.tictactoe.cli import CLI
 
 
@@ -191,6 +193,46 @@ class TestCLI:
         with patch("sys.stdout", new_callable=io.StringIO):
             cli.run()
 
+    @patch("builtins.input", side_effect=["1", "0,0", "0,1", "1,0", "1,1", "2,0", "n"])
+    def test_run_records_games(self, mock_input, tmp_path):
+        """Test that finished games are appended to the record file."""
+        from src.tictactoe.records import RecordReader, RecordWriter
+
+        path = tmp_path / "games.rec"
+        with RecordWriter(path) as recorder:
+            cli = CLI(recorder=recorder)
+            with patch("sys.stdout", new_callable=io.StringIO):
+                cli.run()
+
+        with RecordReader(path) as reader:
+            (game,) = reader
+        assert game.moves == ((0, 0), (0, 1), (1, 0), (1, 1), (2, 0))
+        assert game.winner == "X"
+        assert (game.player_x, game.player_o) == ("human", "human")
+
+    @pytest.mark.parametrize("cached", [False, True])
+    def test_run_human_vs_ai_ponders(self, cached, tmp_path):
+        """Test that AI replies are served from pondering on the human's time."""
+        cache = PositionCache(tmp_path / "ai.cache") if cached else None
+        cli = CLI(ai_player=AIPlayer(cache=cache), ponder=True)
+        answers = iter(["2", "0,0", "0,1", "1,1", "2,2", "n"])
+
+        def think(prompt=""):
+            cli.ponderer.wait()
+            return next(answers)
+
+        with patch("builtins.input", side_effect=think), patch(
+            "sys.stdout", new_callable=io.StringIO
+        ):
+            cli.run()
+
+        # Every AI move came from pondering.
+        assert cli.ponderer.hits == len(cli.moves) // 2 > 0
+        if cache is not None:
+            assert len(cache) > 0
+            cache.close()
+        assert CLI(ai_player=MagicMock(), ponder=True).ponderer is None
+
     @patch("builtins.input", return_value="3")
     def test_run_quit_immediately(self, mock_input):
         """Test quitting immediately from menu."""
@@ -243,6 +285,49 @@ class TestCLI:
             mock_cli_class.assert_called_once()
             mock_cli_instance.run.assert_called_once()
 
+    def test_main_cache(self, tmp_path):
+        """Test that --cache gives the AI a persistent position cache."""
+        from src.tictactoe.cache import PositionCache
+        from src.tictactoe.cli import main
+
+        path = tmp_path / "ai.cache"
+        argv = ["tictactoe", "--cache", str(path)]
+        with patch("src.tictactoe.cli.CLI") as mock_cli_class, patch("sys.argv", argv):
+            main()
+
+        ai_player = mock_cli_class.call_args.kwargs["ai_player"]
+        assert isinstance(ai_player.cache, PositionCache)
+        assert path.exists()
+
+    def test_main_mcts(self):
+        """Test that --ai mcts plays against an MCTS opponent."""
+        from src.tictactoe.cli import main
+        from src.tictactoe.mcts import MCTSPlayer
+
+        argv = ["tictactoe", "--ai", "mcts", "--mcts-iterations", "200"]
+        with patch("src.tictactoe.cli.CLI") as mock_cli_class, patch("sys.argv", argv):
+            main()
+
+        ai_player = mock_cli_class.call_args.kwargs["ai_player"]
+        assert isinstance(ai_player, MCTSPlayer)
+        assert ai_player.iterations == 200
+
+    @pytest.mark.parametrize(
+        "extra",
+        [["--ponder"], ["--cache", "ai.cache"], ["--mcts-iterations", "0"]],
+    )
+    def test_main_mcts_rejects_options(self, extra):
+        """Test that options the MCTS opponent cannot honour are rejected."""
+        from src.tictactoe.cli import main
+
+        argv = ["tictactoe", "--ai", "mcts", *extra]
+        with patch("src.tictactoe.cli.CLI") as mock_cli_class, patch(
+            "sys.argv", argv
+        ), patch("sys.stderr", new_callable=io.StringIO):
+            with pytest.raises(SystemExit):
+                main()
+        mock_cli_class.assert_not_called()
+
     def test_main_function_keyboard_interrupt(self):
         """Test main function with keyboard interrupt."""
         from src.tictactoe.cli import main
@@ -255,6 +340,68 @@ class TestCLI:
             with pytest.raises(SystemExit):
                 main()
 
+    def test_main_serve(self):
+        """Test that the serve subcommand starts the server."""
+        from src.tictactoe.cli import main
+
+        argv = ["tictactoe", "serve", "--port", "9000", "--session-ttl", "60"]
+        argv += ["--shared-tt-size", "5000", "--cache", "ai.cache"]
+        with patch("sys.argv", argv), patch("src.tictactoe.cli.serve") as mock_serve:
+            main()
+
+        mock_serve.assert_called_once_with(
+            "127.0.0.1",
+            9000,
+            workers=None,
+            session_ttl=60.0,
+            ai_time_limit=1.0,
+            shared_tt_size=5000,
+            cache_path="ai.cache",
+        )
+
+    def test_main_engine(self):
+        """Test that the engine subcommand answers protocol commands."""
+        from src.tictactoe.cli import main
+
+        argv = ["tictactoe", "engine"]
+        with patch("sys.argv", argv), patch(
+            "sys.stdin", io.StringIO("isready\nquit\n")
+        ), patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            main()
+
+        assert mock_stdout.getvalue() == "readyok\n"
+
+    def test_main_analyze(self):
+        """Test that the analyze subcommand streams results and errors."""
+        from src.tictactoe.cli import main
+
+        argv = ["tictactoe", "analyze"]
+        with patch("sys.argv", argv), patch(
+            "sys.stdin", io.StringIO("XX./OO./...\nbad\n")
+        ), patch("sys.stdout", new_callable=io.StringIO) as mock_stdout, patch(
+            "sys.stderr", new_callable=io.StringIO
+        ) as mock_stderr:
+            with pytest.raises(SystemExit) as exit_info:
+                main()
+
+        assert exit_info.value.code == 1
+        assert mock_stdout.getvalue() == "XX./OO./...\tc1\tmate 1\tc1\n"
+        assert mock_stderr.getvalue().startswith("line 2: ")
+
+    def test_main_tournament(self):
+        """Test the tournament subcommand."""
+        from src.tictactoe.cli import main
+
+        argv = ["tictactoe", "tournament", "hard", "easy", "--games", "4"]
+        with patch("sys.argv", argv), patch(
+            "sys.stdout", new_callable=io.StringIO
+        ) as mock_stdout:
+            main()
+
+        output = mock_stdout.getvalue()
+        assert "hard vs easy: 4 games" in output
+        assert "hard losses: 0" in output
+
     def test_ai_move_display(self):
         """Test that AI moves are properly displayed."""
         cli = CLI()
@@ -0,0 +1,159 @@
+"""Unit tests for the engine line protocol."""
+
+import io
+import time
+
+from src.tictactoe.board import Board
+from src.tictactoe.engine import Engine, score_text
+
+
+def _run(engine, *lines):
+    """Send command lines, wait for any search, and return new output lines."""
+    start = len(engine.output.getvalue())
+    for line in lines:
+        engine.handle(line)
+    engine.wait()
+    return engine.output.getvalue()[start:].splitlines()
+
+
+class TestEngine:
+    """Test cases for the Engine class."""
+
+    def setup_method(self):
+        """Set up a fresh engine writing to a buffer."""
+        self.engine = Engine(io.StringIO())
+
+    def test_handshake(self):
+        """Test the uci and isready replies."""
+        output = _run(self.engine, "uci", "isready")
+        assert output[0].startswith("id name tictactoe")
+        assert output[-2:] == ["uciok", "readyok"]
+
+    def test_go_reports_best_move(self):
+        """Test that go finds a winning move and reports it as a mate."""
+        output = _run(self.engine, "position board XX./OO./...", "go")
+        assert len(output) == 2 and output[1] == "bestmove c1"
+        assert "score mate 1" in output[0]
+        assert output[0].endswith("pv c1")
+
+    def test_position_moves(self):
+        """Test that moves are applied alternately from the side to move."""
+        _run(self.engine, "position startpos size 4 k 3 moves b2 a1 c3")
+        board = self.engine.board
+        assert (board.size, board.win_length) == (4, 3)
+        assert board.grid[1][1] == "X" and board.grid[0][0] == "O"
+        assert board.grid[2][2] == "X"
+        assert board.current_player == "O"
+
+    def test_principal_variation(self):
+        """Test that a solved search reports a full line and a ponder move."""
+        output = _run(self.engine, "position startpos moves a1", "go")
+        info = output[0].split()
+        pv = info[info.index("pv") + 1 :]
+        assert info[info.index("score") + 1 :][:2] == ["cp", "0"]
+        assert len(pv) == 8
+        assert output[1] == f"bestmove {pv[0]} ponder {pv[1]}"
+
+    def test_invalid_commands(self):
+        """Test that errors are reported without stopping the engine."""
+        output = _run(
+            self.engine,
+            "position startpos moves a1 a1",
+            "position board XXX/OO./...",
+            "go",
+            "frobnicate",
+        )
+        assert output == [
+            "info string error illegal move a1",
+            "info string error game is over",
+            "info string unknown command frobnicate",
+        ]
+        assert self.engine.handle("quit") is False
+
+    def test_infinite_search_waits_for_stop(self):
+        """Test that an infinite search reports only after stop."""
+        engine = self.engine
+        _run(engine, "position startpos size 5 k 4")
+        engine.handle("go infinite")
+        time.sleep(0.1)
+        engine.handle("isready")
+        assert engine.output.getvalue().splitlines() == ["readyok"]
+        output = _run(engine, "stop")
+        assert output[-1].startswith("bestmove ")
+
+    def test_ponderhit(self):
+        """Test that a ponder search reports after ponderhit."""
+        engine = self.engine
+        engine.handle("position startpos moves b2")
+        engine.handle("go ponder")
+        time.sleep(0.1)
+        assert engine.output.getvalue() == ""
+        output = _run(engine, "ponderhit")
+        assert output[-1].startswith("bestmove ")
+
+    def test_node_limit(self):
+        """Test that go nodes bounds the search."""
+        output = _run(self.engine, "position startpos size 5 k 4", "go nodes 2000")
+        info = output[0].split()
+        assert int(info[info.index("nodes") + 1]) <= 2000 + 256
+        assert output[1].startswith("bestmove ")
+
+    def test_reuse_across_games(self):
+        """Test that the table stays warm across games."""
+        engine = self.engine
+        _run(engine, "position startpos", "go")
+        table_size = len(engine.ai.transposition_table)
+        output = _run(engine, "ucinewgame", "position startpos moves b2", "go")
+        assert output[-1].startswith("bestmove ")
+        assert len(engine.ai.transposition_table) >= table_size > 0
+
+    def test_switch_win_length_between_games(self):
+        """Test that the warm table is not reused for another variant."""
+        engine = self.engine
+        _run(engine, "position startpos k 2 moves a1", "go")
+        output = _run(engine, "ucinewgame", "position startpos moves a1", "go")
+        assert "score cp 0" in output[0]
+        assert output[1].startswith("bestmove b2")
+
+    def test_positions_share_game(self):
+        """Test that positions keep the game until ucinewgame."""
+        engine = self.engine
+        _run(engine, "position startpos moves b2")
+        game_id = engine.board.game_id
+        _run(engine, "position startpos moves b2 a1 c3")
+        assert engine.board.game_id == game_id
+        _run(engine, "ucinewgame", "position startpos moves b2")
+        assert engine.board.game_id != game_id
+
+    def test_setoption(self):
+        """Test changing the difficulty and table size."""
+        engine = self.engine
+        _run(engine, "setoption name Difficulty value easy")
+        assert engine.ai.difficulty == "easy"
+        output = _run(engine, "position startpos", "go")
+        assert "score" not in output[0]
+        _run(engine, "setoption name Hash value 10")
+        assert engine.ai.transposition_table.max_size == 10
+        assert _run(engine, "setoption name Colour value red") == [
+            "info string error unknown option colour"
+        ]
+
+    def test_run(self):
+        """Test running the engine over a stream until quit."""
+        engine = self.engine
+        engine.run(io.StringIO("isready\nposition startpos\ngo\nquit\nisready\n"))
+        lines = engine.output.getvalue().splitlines()
+        assert lines[0] == "readyok"
+        assert lines[-1].startswith("bestmove ")
+
+
+class TestScoreText:
+    """Test cases for score formatting."""
+
+    def test_scores(self):
+        """Test mate and centipawn scores."""
+        board = Board()
+        assert score_text(None, board) is None
+        assert score_text(9, board) == "mate 2"
+        assert score_text(-7, board) == "mate -4"
+        assert score_text(0.25, board) == "cp 25"
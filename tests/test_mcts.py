@@ -0,0 +1,106 @@
+"""Unit tests for the Monte Carlo Tree Search player."""
+
+import io
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from src.tictactoe.board import Board
+from src.tictactoe.cli import CLI
+from src.tictactoe.mcts import MCTSPlayer, search
+
+
+class TestMCTSPlayer:
+    """Test cases for the MCTSPlayer class."""
+
+    def test_initialization(self):
+        """Test default configuration and symbols."""
+        player = MCTSPlayer()
+        assert player.iterations == 1000
+        assert player.workers == 1
+        assert player.player_symbol == "O"
+
+        player.set_symbols("X", "O")
+        assert player.player_symbol == "X"
+        assert player.opponent_symbol == "O"
+
+    def test_invalid_configuration(self):
+        """Test that impossible budgets are rejected."""
+        with pytest.raises(ValueError):
+            MCTSPlayer(iterations=None)
+        with pytest.raises(ValueError):
+            MCTSPlayer(iterations=0)
+        with pytest.raises(ValueError):
+            MCTSPlayer(time_limit=0)
+        with pytest.raises(ValueError):
+            MCTSPlayer(workers=0)
+
+    def test_takes_win_and_blocks(self):
+        """Test that enough playouts find the tactical move."""
+        board = Board()
+        board.make_move(0, 0, "O")
+        board.make_move(1, 1, "O")
+        board.make_move(0, 1, "X")
+        assert MCTSPlayer(iterations=2000, seed=1).get_best_move(board) == (2, 2)
+
+        board = Board()
+        board.make_move(0, 0, "X")
+        board.make_move(0, 1, "X")
+        board.make_move(1, 1, "O")
+        assert MCTSPlayer(iterations=2000, seed=1).get_best_move(board) == (0, 2)
+
+    def test_seed_is_reproducible(self):
+        """Test that a seeded player repeats its choices."""
+        board = Board(5, 4)
+        board.make_move(2, 2, "X")
+        first = MCTSPlayer(iterations=300, seed=7).get_best_move(board)
+        assert MCTSPlayer(iterations=300, seed=7).get_best_move(board) == first
+
+    def test_single_move_left(self):
+        """Test that a forced move needs no search."""
+        board = Board()
+        for row, col in [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (1, 2), (2, 1)]:
+            board.make_move(row, col)
+        board.make_move(2, 0)
+        assert MCTSPlayer().get_best_move(board) == (2, 2)
+
+    def test_time_limit_on_large_board(self):
+        """Test a time-bounded search on a gomoku-sized board."""
+        board = Board(15, 5)
+        board.make_move(7, 7, "X")
+        move = MCTSPlayer(iterations=None, time_limit=0.1).get_best_move(board)
+        assert board.is_position_empty(*move)
+        assert board.undo_count == 0
+
+    def test_search_restores_board(self):
+        """Test that searching leaves the board untouched."""
+        board = Board(4, 3)
+        board.make_move(0, 0, "X")
+        stats = search(board, "O", "X", 200, None, 1.4, 0)
+        assert sum(visits for visits, _ in stats.values()) == 200
+        assert board.get_empty_positions() == Board(4, 3).get_empty_positions()[1:]
+
+    def test_parallel_workers(self):
+        """Test that root-parallel search merges worker results."""
+        board = Board()
+        board.make_move(0, 0, "X")
+        board.make_move(0, 1, "X")
+        board.make_move(1, 1, "O")
+
+        with MCTSPlayer(iterations=2000, workers=2, seed=3) as player:
+            assert player.get_best_move(board) == (0, 2)
+            assert player._pool is not None
+            pickle.loads(pickle.dumps(player))  # the pool is not pickled
+        assert player._pool is None
+
+    @patch("builtins.input", side_effect=["1,1", "0,0", "2,2", "0,2", "2,0"])
+    def test_plays_through_cli(self, mock_input):
+        """Test that the CLI accepts an MCTS opponent."""
+        cli = CLI(ai_player=MCTSPlayer(iterations=500, seed=0))
+
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            cli.play_human_vs_ai()
+
+        assert cli.board.is_game_over()
+        assert "AI plays:" in mock_stdout.getvalue()
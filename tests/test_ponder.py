@@ -0,0 +1,98 @@
+"""Unit tests for pondering on the opponent's time."""
+
+import logging
+import time
+from unittest.mock import patch
+
+from src.tictactoe.ai import AIPlayer, position_key
+from src.tictactoe.board import Board
+from src.tictactoe.cache import PositionCache
+from src.tictactoe.ponder import Ponderer
+
+
+class TestPonderer:
+    """Test cases for the Ponderer class."""
+
+    def test_pondered_reply_is_served(self):
+        """Test that a finished reply search is returned without searching."""
+        ai = AIPlayer("hard", search="alphabeta")
+        ponderer = Ponderer(ai)
+        board = Board()
+        ponderer.start(board, expected=(1, 1))
+        assert ponderer.wait(30)
+        assert len(ponderer.results) == 9
+
+        board.make_move(1, 1)
+        move = ponderer.take(board)
+        reference = AIPlayer("hard", search="alphabeta")
+        assert move == reference.get_best_move(board)
+        assert ai.last_score == reference.last_score
+        assert ponderer.hits == 1
+        assert ponderer.take(board) is None
+
+    def test_expected_move_searched_first(self):
+        """Test that the expected reply is pondered before the others."""
+        ai = AIPlayer("hard", search="iterative", node_limit=200)
+        ponderer = Ponderer(ai)
+        board = Board(4, 3)
+        ponderer.start(board, expected=(3, 3))
+        assert ponderer.wait(30)
+
+        board.make_move(3, 3)
+        assert next(iter(ponderer.results)) == position_key(board)
+        assert ponderer.take(board) is not None
+
+    def test_stop_discards_unfinished_search(self):
+        """Test that stopping is prompt and keeps no partial result."""
+        ai = AIPlayer("hard", search="alphabeta")
+        ponderer = Ponderer(ai)
+        board = Board(4, 4)
+        ponderer.start(board)
+        time.sleep(0.05)
+
+        start = time.perf_counter()
+        board.make_move(0, 0)
+        assert ponderer.take(board) is None
+        assert time.perf_counter() - start < 1.0
+        assert ponderer.wait(0)
+        assert len(board.get_empty_positions()) == 15
+
+    def test_cached_player(self, tmp_path):
+        """Test pondering with a player that keeps a position cache."""
+        with PositionCache(tmp_path / "ai.cache") as cache:
+            ai = AIPlayer("hard", search="alphabeta", cache=cache)
+            ponderer = Ponderer(ai)
+            board = Board()
+            ponderer.start(board, expected=(1, 1))
+            assert ponderer.wait(30)
+            assert len(ponderer.results) == 9
+            assert len(cache) == 9
+
+            board.make_move(1, 1)
+            assert ponderer.take(board) in [(0, 0), (0, 2), (2, 0), (2, 2)]
+            assert ponderer.hits == 1
+
+    def test_error_ends_pondering(self, caplog):
+        """Test that a failing search is logged and the reply searched later."""
+        ai = AIPlayer("hard", search="alphabeta")
+        ponderer = Ponderer(ai)
+        board = Board()
+        with patch.object(ai, "get_best_move", side_effect=RuntimeError("boom")):
+            with caplog.at_level(logging.ERROR):
+                ponderer.start(board)
+                assert ponderer.wait(30)
+        assert "Pondering stopped" in caplog.text
+        assert ponderer.results == {}
+
+        board.make_move(1, 1)
+        assert ponderer.take(board) is None
+        assert ai.get_best_move(board) in [(0, 0), (0, 2), (2, 0), (2, 2)]
+
+    def test_only_hard_players_ponder(self):
+        """Test that random players are not pondered."""
+        ponderer = Ponderer(AIPlayer("easy"))
+        board = Board()
+        ponderer.start(board)
+        assert ponderer.wait(0)
+        board.make_move(1, 1)
+        assert ponderer.take(board) is None
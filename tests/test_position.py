@@ -0,0 +1,156 @@
+"""Unit tests for the packed Position type."""
+
+import pickle
+import random
+import sys
+
+import pytest
+
+from src.tictactoe.board import Board
+from src.tictactoe.position import Position, cell_name, parse_cell
+
+
+def _random_board(rng, size, win_length):
+    """Play a random number of random moves."""
+    board = Board(size, win_length)
+    for _ in range(rng.randrange(size * size + 1)):
+        if board.is_game_over():
+            break
+        board.make_move(*rng.choice(board.get_empty_positions()))
+    return board
+
+
+class TestPosition:
+    """Test cases for the Position class."""
+
+    def test_round_trip(self):
+        """Test converting boards to positions and back."""
+        rng = random.Random(3)
+        for size, win_length in [(1, 1), (3, 3), (4, 3), (7, 5), (15, 5)]:
+            for _ in range(30):
+                board = _random_board(rng, size, win_length)
+                restored = Position.from_board(board).to_board()
+                assert restored.grid == board.grid
+                assert (restored.size, restored.win_length) == (size, win_length)
+                assert restored.current_player == board.current_player
+                assert restored.check_winner() == board.check_winner()
+                assert restored.is_full() == board.is_full()
+                assert restored.zobrist_hash == board.zobrist_hash
+                assert Position.from_board(restored) == Position.from_board(board)
+
+    def test_restored_board_is_playable(self):
+        """Test that a restored board supports moves and undo."""
+        board = Board()
+        board.make_move(0, 0)
+        board.make_move(1, 1)
+        restored = Position.from_board(board).to_board()
+        assert restored.make_move(0, 1)
+        assert restored.make_move(2, 2)
+        assert restored.make_move(0, 2)
+        assert restored.check_winner() == "X"
+        assert restored.undo_count == 0
+
+    def test_equality_and_hashing(self):
+        """Test that equal positions are interchangeable as keys."""
+        first, second = Board(), Board()
+        first.make_move(0, 0)
+        first.make_move(2, 2)
+        second.make_move(0, 0)
+        second.make_move(2, 2)
+        assert Position.from_board(first) == Position.from_board(second)
+        assert len({Position.from_board(first), Position.from_board(second)}) == 1
+
+        assert Position.from_board(Board(3)) != Position.from_board(Board(4))
+        assert Position.from_board(Board(4, 3)) != Position.from_board(Board(4))
+        assert Position.from_board(Board()) != Board()
+
+    def test_accessors(self):
+        """Test reading cells and dimensions."""
+        position = Position.from_masks(3, 0b000010001, 0b100000000)
+        assert (position.size, position.win_length) == (3, 3)
+        assert position[0, 0] == "X"
+        assert position[1, 1] == "X"
+        assert position[2, 2] == "O"
+        assert position[0, 1] is None
+        assert position.side_to_move == "O"
+        assert list(position.cells()).count(None) == 6
+        assert repr(position) == "Position.from_notation('X../.X./..O')"
+        with pytest.raises(IndexError):
+            position[3, 0]
+
+    def test_packed_round_trip(self):
+        """Test storing positions as plain integers."""
+        position = Position.from_masks(5, 0b101, 0b10, win_length=4)
+        assert isinstance(position.packed, int)
+        assert Position(position.packed) == position
+        assert pickle.loads(pickle.dumps(position)) == position
+
+    def test_immutable(self):
+        """Test that positions cannot be modified."""
+        position = Position.from_board(Board())
+        with pytest.raises(AttributeError):
+            position._packed = 0
+        with pytest.raises(AttributeError):
+            position.extra = 1
+        with pytest.raises(AttributeError):
+            del position._packed
+
+    def test_compact(self):
+        """Test that a position is far smaller than a board."""
+        position = Position.from_board(Board())
+        assert not hasattr(position, "__dict__")
+        assert sys.getsizeof(position) + sys.getsizeof(position.packed) < 100
+
+    def test_invalid(self):
+        """Test that inconsistent positions are rejected."""
+        with pytest.raises(ValueError):
+            Position.from_masks(3, 0b1, 0b1)
+        with pytest.raises(ValueError):
+            Position.from_masks(3, 1 << 9, 0)
+        with pytest.raises(ValueError):
+            Position.from_masks(3, 0, 0, win_length=4)
+        with pytest.raises(ValueError):
+            Position.from_masks(0, 0, 0)
+        with pytest.raises(ValueError):
+            Position(0)
+        board = Board()
+        board.make_move(0, 0, "Z")
+        with pytest.raises(ValueError):
+            Position.from_board(board)
+
+
+class TestNotation:
+    """Test cases for the position text notation and cell names."""
+
+    def test_round_trip(self):
+        """Test that notation round-trips for random positions."""
+        rng = random.Random(5)
+        for size, win_length in [(3, 3), (4, 3), (7, 5)]:
+            for _ in range(20):
+                position = Position.from_board(_random_board(rng, size, win_length))
+                assert Position.from_notation(position.notation) == position
+
+    def test_format(self):
+        """Test the notation of a known position."""
+        board = Board(4, 3)
+        board.make_move(1, 1)
+        board.make_move(2, 2)
+        position = Position.from_board(board)
+        assert position.notation == "..../.X../..O./....:3"
+        assert Position.from_notation("x.o/.x./...")[0, 2] == "O"
+
+    def test_invalid_notation(self):
+        """Test that malformed notation is rejected."""
+        for text in ["X.O/.X.", "X.O/.Z./...", "X.O/.X./...:x", "X.O/.X./...:4"]:
+            with pytest.raises(ValueError):
+                Position.from_notation(text)
+
+    def test_cell_names(self):
+        """Test naming and parsing cells."""
+        assert cell_name(0, 0) == "a1"
+        assert cell_name(2, 1) == "b3"
+        assert parse_cell("B3", 3) == (2, 1)
+        assert parse_cell("c10", 10) == (9, 2)
+        for name in ["", "b", "3b", "d1", "a4", "a0"]:
+            with pytest.raises(ValueError):
+                parse_cell(name, 3)
@@ -0,0 +1,131 @@
+"""Unit tests for binary game records."""
+
+import random
+
+import pytest
+
+from src.tictactoe.board import Board
+from src.tictactoe.records import (
+    FILE_HEADER,
+    GameRecord,
+    RecordReader,
+    RecordWriter,
+    decode_record,
+    encode_record,
+    move_bits,
+)
+
+
+def _random_game(rng, size=3, win_length=None):
+    """Play random moves to the end of a game."""
+    board = Board(size, win_length)
+    moves = []
+    while not board.is_game_over():
+        move = rng.choice(board.get_empty_positions())
+        board.make_move(*move)
+        moves.append(move)
+    return GameRecord(
+        size, board.win_length, tuple(moves), board.check_winner(), "easy", "hard"
+    )
+
+
+class TestEncoding:
+    """Test cases for packing single records."""
+
+    def test_round_trip(self):
+        """Test that records decode to what was encoded."""
+        rng = random.Random(1)
+        for size, win_length in [(1, 1), (3, 3), (4, 3), (7, 5), (16, 5)]:
+            for _ in range(10):
+                record = _random_game(rng, size, win_length)
+                data = encode_record(record)
+                assert decode_record(data) == (record, len(data))
+                assert record.replay().check_winner() == record.winner
+
+    def test_compact(self):
+        """Test that moves take a few bits each."""
+        sizes = (1, 2, 3, 4, 5, 15, 16)
+        assert [move_bits(size) for size in sizes] == [1, 2, 4, 4, 5, 8, 8]
+        record = GameRecord(3, 3, ((1, 1), (0, 0), (2, 2), (0, 2), (0, 1)))
+        # 9-byte header, two empty names and 5 moves in 3 bytes
+        assert len(encode_record(record)) == 14
+
+    def test_unicode_names_and_empty_game(self):
+        """Test player names and a game without moves."""
+        record = GameRecord(5, 4, (), None, "Zoë", "")
+        assert decode_record(encode_record(record))[0] == record
+
+    def test_invalid(self):
+        """Test that records that cannot be stored are rejected."""
+        for record in [
+            GameRecord(3, 4, ()),
+            GameRecord(256, 5, ()),
+            GameRecord(3, 3, ((3, 0),)),
+            GameRecord(3, 3, (), "Z"),
+            GameRecord(3, 3, (), None, "x" * 256),
+        ]:
+            with pytest.raises(ValueError):
+                encode_record(record)
+        with pytest.raises(ValueError):
+            decode_record(encode_record(GameRecord(3, 3, ((0, 0),)))[:-1])
+        with pytest.raises(ValueError):
+            GameRecord(3, 3, ((0, 0), (0, 0))).replay()
+
+
+class TestFiles:
+    """Test cases for RecordWriter and RecordReader."""
+
+    def test_write_and_read(self, tmp_path):
+        """Test iterating and indexing a file written in several sessions."""
+        path = tmp_path / "games.rec"
+        rng = random.Random(2)
+        games = [_random_game(rng) for _ in range(500)]
+        with RecordWriter(path, buffer_size=100) as writer:
+            for game in games[:300]:
+                writer.write(game)
+        with RecordWriter(path) as writer:
+            for game in games[300:]:
+                writer.write(game)
+
+        with RecordReader(path) as reader:
+            assert list(reader) == games
+            assert len(reader) == 500
+            assert reader[0] == games[0]
+            assert reader[377] == games[377]
+            assert reader[-1] == games[-1]
+            with pytest.raises(IndexError):
+                reader[500]
+
+    def test_buffering(self, tmp_path):
+        """Test that records reach the file on flush."""
+        path = tmp_path / "games.rec"
+        writer = RecordWriter(path)
+        writer.write(GameRecord(3, 3, ((1, 1),)))
+        assert path.stat().st_size == FILE_HEADER.size
+        writer.flush()
+        assert path.stat().st_size > FILE_HEADER.size
+        writer.close()
+        writer.close()
+        with RecordReader(path) as reader:
+            assert len(reader) == 1
+
+    def test_not_a_record_file(self, tmp_path):
+        """Test that other files are rejected."""
+        path = tmp_path / "games.json"
+        path.write_text('{"games": []}')
+        with pytest.raises(ValueError):
+            RecordReader(path)
+        with pytest.raises(ValueError):
+            RecordWriter(path)
+
+    def test_truncated_file(self, tmp_path):
+        """Test that a cut-off record is reported."""
+        path = tmp_path / "games.rec"
+        with RecordWriter(path) as writer:
+            writer.write(GameRecord(3, 3, ((1, 1), (0, 0))))
+        path.write_bytes(path.read_bytes()[:-1])
+        with RecordReader(path) as reader:
+            with pytest.raises(ValueError):
+                len(reader)
+            with pytest.raises(ValueError):
+                list(reader)
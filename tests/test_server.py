@@ -0,0 +1,264 @@
+"""Unit tests for the asyncio game server."""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import pytest
+
+from src.tictactoe.cache import PositionCache
+from src.tictactoe.server import GameServer
+
+
+def _run(coroutine_function):
+    """Run a test coroutine against a server using a thread pool."""
+
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            server = GameServer(executor=executor, ai_time_limit=0.2)
+            try:
+                return await coroutine_function(server)
+            finally:
+                await server.close()
+
+    return asyncio.run(main())
+
+
+async def _request(reader, writer, method, path, body=None):
+    """Send one keep-alive request and read the JSON response."""
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+    payload = json.loads(await reader.readexactly(int(headers["content-length"])))
+    return int(status_line.split()[1]), headers, payload
+
+
+class TestGameServer:
+    """Test cases for the GameServer class."""
+
+    def test_play_against_ai(self):
+        """Test a whole game of human moves and AI replies."""
+
+        async def scenario(server):
+            status, game = await server.handle("POST", "/games", {})
+            assert status == HTTPStatus.CREATED
+            assert game["status"] == "in_progress"
+            path = f"/games/{game['id']}"
+
+            while game["status"] == "in_progress":
+                row, col = next(
+                    (r, c)
+                    for r, cells in enumerate(game["board"])
+                    for c, cell in enumerate(cells)
+                    if cell is None
+                )
+                status, game = await server.handle(
+                    "POST", path + "/moves", {"row": row, "col": col}
+                )
+                assert status == HTTPStatus.OK
+                if game["status"] == "in_progress":
+                    status, game = await server.handle("POST", path + "/ai-move")
+                    assert status == HTTPStatus.OK
+            return game
+
+        game = _run(scenario)
+        # The hard AI never loses.
+        assert game["winner"] in (None, "O")
+        assert len(game["moves"]) == sum(
+            cell is not None for row in game["board"] for cell in row
+        )
+
+    def test_errors(self):
+        """Test error statuses for bad requests."""
+
+        async def scenario(server):
+            _, game = await server.handle("POST", "/games", {"difficulty": "easy"})
+            path = f"/games/{game['id']}"
+            results = [
+                await server.handle("GET", "/nowhere"),
+                await server.handle("GET", "/games/unknown"),
+                await server.handle("PUT", path),
+                await server.handle("POST", "/games", {"difficulty": "expert"}),
+                await server.handle("POST", "/games", {"size": 99}),
+                await server.handle("POST", "/games", {"size": 3, "win_length": 5}),
+                await server.handle("POST", path + "/moves", {"row": "a", "col": 0}),
+                await server.handle("POST", path + "/moves", {"row": 5, "col": 0}),
+            ]
+            await server.handle("POST", path + "/moves", {"row": 0, "col": 0})
+            results.append(
+                await server.handle("POST", path + "/moves", {"row": 0, "col": 0})
+            )
+            return [status for status, _ in results]
+
+        assert _run(scenario) == [
+            HTTPStatus.NOT_FOUND,
+            HTTPStatus.NOT_FOUND,
+            HTTPStatus.METHOD_NOT_ALLOWED,
+            HTTPStatus.BAD_REQUEST,
+            HTTPStatus.BAD_REQUEST,
+            HTTPStatus.BAD_REQUEST,
+            HTTPStatus.BAD_REQUEST,
+            HTTPStatus.BAD_REQUEST,
+            HTTPStatus.BAD_REQUEST,
+        ]
+
+    def test_finished_game(self):
+        """Test that moves on a finished game are rejected."""
+
+        async def scenario(server):
+            _, game = await server.handle("POST", "/games", {"size": 1})
+            path = f"/games/{game['id']}"
+            _, game = await server.handle("POST", path + "/moves", {"row": 0, "col": 0})
+            assert game["status"] == "won"
+            status, _ = await server.handle("POST", path + "/ai-move")
+            return status
+
+        assert _run(scenario) == HTTPStatus.CONFLICT
+
+    def test_delete_and_expire(self):
+        """Test deleting games and expiring idle ones."""
+
+        async def scenario(server):
+            _, first = await server.handle("POST", "/games", {})
+            _, second = await server.handle("POST", "/games", {})
+            status, _ = await server.handle("DELETE", f"/games/{first['id']}")
+            assert status == HTTPStatus.OK
+            assert list(server.sessions) == [second["id"]]
+
+            assert server.expire_sessions() == 0
+            now = time.monotonic() + server.session_ttl + 1
+            assert server.expire_sessions(now) == 1
+            return server.sessions
+
+        assert _run(scenario) == {}
+
+    def test_max_sessions(self):
+        """Test that the number of hosted games is capped."""
+
+        async def scenario(server):
+            server.max_sessions = 2
+            statuses = [(await server.handle("POST", "/games", {}))[0] for _ in "abc"]
+            return statuses
+
+        assert _run(scenario)[-1] == HTTPStatus.SERVICE_UNAVAILABLE
+
+    def test_invalid_settings(self):
+        """Test that bad server settings are rejected."""
+        with pytest.raises(ValueError):
+            GameServer(session_ttl=0)
+        with pytest.raises(ValueError):
+            GameServer(max_sessions=0)
+
+    def test_shared_table(self):
+        """Test that AI moves fill a table shared by the workers."""
+
+        async def main():
+            with ThreadPoolExecutor(2) as executor:
+                server = GameServer(executor=executor, shared_tt_size=10_000)
+                table = server.shared_table
+                _, game = await server.handle("POST", "/games", {})
+                await server.handle("POST", f"/games/{game['id']}/ai-move")
+                filled = len(table)
+                await server.close()
+                return filled, server.shared_table
+
+        filled, table = asyncio.run(main())
+        assert filled > 0
+        assert table is None
+        with pytest.raises(ValueError):
+            GameServer(shared_tt_size=-1)
+
+    def test_cache(self, tmp_path):
+        """Test that AI moves are kept in the persistent cache."""
+        path = tmp_path / "ai.cache"
+
+        async def main():
+            with ThreadPoolExecutor(1) as executor:
+                server = GameServer(executor=executor, cache_path=str(path))
+                _, game = await server.handle("POST", "/games", {})
+                await server.handle("POST", f"/games/{game['id']}/ai-move")
+                await server.close()
+
+        asyncio.run(main())
+        with PositionCache(path) as cache:
+            assert len(cache) == 1
+
+    def test_board_variants_get_own_players(self):
+        """Test that one worker answers correctly across board variants."""
+
+        async def main():
+            with ThreadPoolExecutor(1) as executor:
+                server = GameServer(executor=executor)
+                games = []
+                for win_length in (2, 3):
+                    _, game = await server.handle(
+                        "POST", "/games", {"size": 3, "win_length": win_length}
+                    )
+                    path = f"/games/{game['id']}"
+                    await server.handle("POST", path + "/moves", {"row": 0, "col": 0})
+                    _, game = await server.handle("POST", path + "/ai-move")
+                    games.append(game)
+                await server.close()
+                return games
+
+        _, game = asyncio.run(main())
+        assert game["board"][1][1] == "O"
+
+    def test_http_keep_alive(self):
+        """Test several requests over one HTTP connection."""
+
+        async def scenario(server):
+            listener = await server.start(port=0)
+            host, port = listener.sockets[0].getsockname()[:2]
+            assert host == "127.0.0.1"
+            reader, writer = await asyncio.open_connection(host, port)
+            status, headers, game = await _request(reader, writer, "POST", "/games")
+            assert status == 201
+            assert headers["connection"] == "keep-alive"
+            status, _, game = await _request(
+                reader, writer, "POST", f"/games/{game['id']}/ai-move"
+            )
+            assert status == 200
+            assert game["current_player"] == "O"
+
+            writer.write(b"POST /games HTTP/1.1\r\nContent-Length: 3\r\n\r\n[1]")
+            await writer.drain()
+            status_line = await reader.readline()
+            writer.close()
+            return status_line
+
+        assert b"400" in _run(scenario)
+
+    def test_ai_search_does_not_block(self):
+        """Test that other games are served while the AI is thinking."""
+
+        async def scenario(server):
+            _, big = await server.handle("POST", "/games", {"size": 7, "win_length": 5})
+            _, small = await server.handle("POST", "/games", {})
+            thinking = asyncio.ensure_future(
+                server.handle("POST", f"/games/{big['id']}/ai-move")
+            )
+            await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            status, _ = await server.handle("GET", f"/games/{small['id']}")
+            latency = time.perf_counter() - start
+            await thinking
+            return status, latency, thinking.done()
+
+        status, latency, done = _run(scenario)
+        assert status == HTTPStatus.OK
+        assert latency < 0.1
+        assert done
@@ -0,0 +1,107 @@
+"""Unit tests for the precomputed solution table."""
+
+import pytest
+
+from src.tictactoe import solutions
+from src.tictactoe.ai import AIPlayer
+from src.tictactoe.board import Board
+
+
+def _reachable_positions():
+    """Collect every unfinished position of a legal game, X moving first."""
+    seen = {}
+
+    def visit(board):
+        key = str(board.grid)
+        if key in seen or board.is_game_over():
+            return
+        seen[key] = board.copy()
+        for row, col in board.get_empty_positions():
+            child = board.copy()
+            child.make_move(row, col)
+            visit(child)
+
+    visit(Board())
+    return list(seen.values())
+
+
+class TestSolutionTable:
+    """Test cases for the solution table."""
+
+    def test_packaged_table_is_up_to_date(self):
+        """Test that the shipped file matches a fresh generation."""
+        assert solutions.TABLE_PATH.read_bytes() == solutions.generate_table()
+
+    def test_load_table_is_cached(self):
+        """Test that the table is only loaded once."""
+        assert solutions.load_table() is solutions.load_table()
+
+    def test_rejects_bad_data(self):
+        """Test that corrupt tables are rejected."""
+        data = solutions.generate_table()
+        with pytest.raises(ValueError):
+            solutions.SolutionTable(data[:-1])
+        with pytest.raises(ValueError):
+            solutions.SolutionTable(b"XXXX" + data[4:])
+
+    def test_write_table(self, tmp_path):
+        """Test writing the table to a custom location."""
+        path = tmp_path / "table.bin"
+        assert solutions.write_table(path) == len(_reachable_positions())
+        assert solutions.SolutionTable(path.read_bytes()) is not None
+
+    def test_matches_hard_search_everywhere(self):
+        """Test that every table move equals the hard AI's searched move."""
+        table = solutions.load_table()
+        searcher = AIPlayer("hard")
+
+        for board in _reachable_positions():
+            player = board.current_player
+            other = "O" if player == "X" else "X"
+            searcher.set_symbols(player, other)
+
+            move, score = table.lookup(board, player)
+            assert move == searcher.get_best_move(board)
+            assert -10 <= score <= 10
+
+    def test_lookup_outside_table(self):
+        """Test positions the table cannot answer."""
+        table = solutions.load_table()
+        board = Board()
+        board.make_move(0, 0, "O")
+        board.make_move(0, 1, "O")
+        assert table.lookup(board, "O") is None  # illegal piece counts
+        assert table.lookup(Board(), "O") is None  # not O's turn
+
+        board = Board()
+        for row, col in [(0, 0), (1, 1), (0, 1), (2, 2), (0, 2)]:
+            board.make_move(row, col)
+        assert table.lookup(board, "O") is None  # game already won
+
+    def test_empty_board_is_a_draw(self):
+        """Test the solved value of the opening position."""
+        assert solutions.load_table().lookup(Board(), "X") == ((0, 0), 0)
+
+
+class TestAIWithSolutionTable:
+    """Test cases for hard mode backed by the solution table."""
+
+    def test_uses_table_without_search(self):
+        """Test that table moves need no search."""
+        ai = AIPlayer("hard", use_solution_table=True)
+        board = Board()
+        board.make_move(0, 0)
+
+        assert ai.get_best_move(board) == AIPlayer("hard").get_best_move(board)
+        assert ai.nodes_searched == 0
+
+    def test_falls_back_to_search(self):
+        """Test that positions outside the table are still searched."""
+        ai = AIPlayer("hard", use_solution_table=True)
+        board = Board()
+        board.make_move(0, 0, "O")
+        board.make_move(1, 1, "O")
+        board.make_move(0, 1, "X")
+
+        assert ai.get_best_move(board) == (2, 2)
+        assert ai.nodes_searched > 0
@@ -0,0 +1,115 @@
+"""Unit tests for AI-vs-AI tournaments."""
+
+import pytest
+
+from src.tictactoe.ai import AIPlayer
+from src.tictactoe.mcts import MCTSPlayer
+from src.tictactoe.records import RecordReader
+from src.tictactoe.tournament import (
+    ENGINES,
+    LatencyHistogram,
+    make_player,
+    play_game,
+    run_tournament,
+)
+
+
+class TestTournament:
+    """Test cases for the tournament harness."""
+
+    def test_make_player(self):
+        """Test creating every engine."""
+        for engine in ENGINES:
+            player = make_player(engine, seed=1)
+            assert hasattr(player, "get_best_move")
+        assert isinstance(make_player("mcts"), MCTSPlayer)
+        assert make_player("medium").difficulty == "medium"
+        with pytest.raises(ValueError):
+            make_player("grandmaster")
+
+    def test_play_game(self):
+        """Test a single game between perfect players."""
+        winner, moves, latencies = play_game(AIPlayer(), AIPlayer())
+        assert winner is None
+        assert len(moves) == 9
+        assert len(latencies) == 9
+
+    def test_perfect_play_never_loses(self):
+        """Test that hard mode never loses to easy mode."""
+        result = run_tournament("hard", "easy", games=40, seed=5)
+        assert result.games == 40
+        assert result.losses == 0
+        assert result.wins > 0
+        assert result.games_per_second > 0
+        assert set(result.latency_percentiles) == {50, 90, 99}
+
+    def test_reproducible_across_worker_counts(self):
+        """Test that seeding does not depend on how games are scheduled."""
+        serial = run_tournament("medium", "easy", games=600, seed=11)
+        parallel = run_tournament("medium", "easy", games=600, seed=11, workers=2)
+        other_seed = run_tournament("medium", "easy", games=600, seed=12)
+
+        assert serial[2:5] == parallel[2:5]
+        assert serial[2:5] != other_seed[2:5]
+
+    def test_record(self, tmp_path):
+        """Test recording every game, in game order, with any worker count."""
+        serial_path = tmp_path / "serial.rec"
+        parallel_path = tmp_path / "parallel.rec"
+        result = run_tournament(
+            "medium", "easy", games=600, seed=3, record=str(serial_path)
+        )
+        run_tournament(
+            "medium", "easy", games=600, seed=3, workers=2, record=str(parallel_path)
+        )
+
+        with RecordReader(serial_path) as reader:
+            games = list(reader)
+        with RecordReader(parallel_path) as reader:
+            assert list(reader) == games
+        assert len(games) == 600
+        assert (games[0].player_x, games[0].player_o) == ("medium", "easy")
+        assert (games[1].player_x, games[1].player_o) == ("easy", "medium")
+        assert sum(game.winner is None for game in games) == result.draws
+        for game in games[:50]:
+            assert game.replay().check_winner() == game.winner
+
+    def test_larger_board(self):
+        """Test tournaments on larger boards."""
+        result = run_tournament("medium", "mcts", games=2, size=4, win_length=3)
+        assert result.games == 2
+
+    def test_invalid_arguments(self):
+        """Test that bad arguments are rejected up front."""
+        with pytest.raises(ValueError):
+            run_tournament("hard", "nobody", games=1)
+        with pytest.raises(ValueError):
+            run_tournament("hard", "easy", games=0)
+        with pytest.raises(ValueError):
+            run_tournament("hard", "easy", games=1, workers=0)
+
+    def test_latency_histogram(self):
+        """Test nearest-rank percentiles of merged latency histograms."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for millis in range(1, 101):
+            (first if millis % 2 else second).add(millis / 1000)
+        first.merge(second)
+        assert len(first) == 100
+        for p, seconds in first.percentiles().items():
+            assert p / 1000 <= seconds < p / 1000 * 1.05
+
+        assert LatencyHistogram().percentiles() == {50: 0.0, 90: 0.0, 99: 0.0}
+        single = LatencyHistogram()
+        single.add(3.0)
+        assert single.percentiles(points=(1, 100)) == {1: 3.0, 100: 3.0}
+        single.add(0.0)
+        single.add(1e9)
+        assert single.percentiles(points=(1, 100)) == {1: 1e-6, 100: 1e9}
+
+    def test_format(self):
+        """Test the printed report."""
+        report = run_tournament("hard", "hard", games=2).format()
+        assert "hard vs hard: 2 games" in report
+        assert "draws:   2 (100.0%)" in report
+        assert "games/s" in report
+        assert "p99" in report
@@ -0,0 +1,291 @@
+"""Unit tests for the transposition table."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.tictactoe.ai import AIPlayer
+from src.tictactoe.board import Board
+from src.tictactoe.transposition import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    SharedTranspositionTable,
+    TranspositionTable,
+    canonical_key,
+)
+
+
+@pytest.fixture
+def shared_table():
+    """A small shared table, freed after the test."""
+    table = SharedTranspositionTable(1000)
+    yield table
+    table.close()
+    table.unlink()
+
+
+def _store_in_worker(table, key):
+    """Process-pool helper: store a bound and read back another key."""
+    table.store(key, 0.25, LOWER_BOUND, 4)
+    return table.get(1)
+
+
+def _rotate(grid):
+    """Rotate a grid 90 degrees clockwise."""
+    return [list(row) for row in zip(*grid[::-1])]
+
+
+class TestTranspositionTable:
+    """Test cases for the TranspositionTable class."""
+
+    def test_store_and_get(self):
+        """Test storing exact scores and bounds."""
+        table = TranspositionTable()
+        table.store(1, 5, EXACT, 3)
+        table.store(2, -2, LOWER_BOUND)
+        table.store(3, 7, UPPER_BOUND)
+
+        assert table.get(1) == (5, EXACT, 3)
+        assert table.get(2).flag == LOWER_BOUND
+        assert table.get(3).flag == UPPER_BOUND
+        assert len(table) == 3
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted."""
+        table = TranspositionTable()
+        assert table.get(1) is None
+        table.store(1, 0)
+        assert table.get(1) is not None
+        assert table.hits == 1
+        assert table.misses == 1
+        assert table.hit_rate == 0.5
+
+        table.clear()
+        assert len(table) == 0
+        assert table.hits == table.misses == 0
+        assert table.hit_rate == 0.0
+
+    def test_peek(self):
+        """Test that peek leaves the counters and LRU order alone."""
+        table = TranspositionTable(max_size=2)
+        table.store(1, 5)
+        table.store(2, 6)
+        assert table.peek(1).score == 5
+        assert table.peek(3) is None
+        assert (table.hits, table.misses) == (0, 0)
+        table.store(3, 7)
+        assert 1 not in table and 2 in table
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        table = TranspositionTable(max_size=2)
+        table.store(1, 1)
+        table.store(2, 2)
+        table.get(1)
+        table.store(3, 3)
+
+        assert 1 in table
+        assert 2 not in table
+        assert 3 in table
+        assert table.evictions == 1
+
+    def test_invalid_size(self):
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            TranspositionTable(0)
+
+
+class TestSharedTranspositionTable:
+    """Test cases for the SharedTranspositionTable class."""
+
+    def test_store_and_get(self, shared_table):
+        """Test storing scores and bounds, with huge and float keys."""
+        shared_table.store(1, 5, EXACT, 3)
+        shared_table.store(2, -0.5, LOWER_BOUND)
+        shared_table.store(3 << 70, -7, UPPER_BOUND, 9)
+
+        assert shared_table.get(1) == (5, EXACT, 3)
+        assert isinstance(shared_table.get(1).score, int)
+        assert shared_table.get(2) == (-0.5, LOWER_BOUND, 0)
+        assert shared_table.get(3 << 70) == (-7, UPPER_BOUND, 9)
+        assert shared_table.get(4) is None
+        assert len(shared_table) == 3
+        assert (shared_table.hits, shared_table.misses) == (4, 1)
+        assert 1 in shared_table and 4 not in shared_table
+
+        shared_table.clear()
+        assert len(shared_table) == 0
+        assert shared_table.get(1) is None
+        assert shared_table.hits == 0
+
+    def test_key_zero_is_not_found_in_empty_slot(self, shared_table):
+        """Test that a zeroed slot never reads as an entry."""
+        assert shared_table.peek(0) is None
+        shared_table.store(0, 2)
+        assert shared_table.peek(0).score == 2
+
+    def test_colliding_keys_replace(self):
+        """Test that a newer entry replaces an older one in its slot."""
+        table = SharedTranspositionTable(1)
+        try:
+            table.store(1, 1)
+            table.store(2, 2)
+            assert table.get(1) is None
+            assert table.get(2).score == 2
+            assert table.evictions == 1
+            assert len(table) == 1
+        finally:
+            table.close()
+            table.unlink()
+
+    def test_torn_slot_reads_as_miss(self, shared_table):
+        """Test that a slot mixing two writes fails the check."""
+        shared_table.store(1, 5, EXACT, 3)
+        _, slot = shared_table._slot(1)
+        shared_table._words[slot + 1] ^= 1
+        assert shared_table.get(1) is None
+
+    def test_pickle_attaches_to_same_memory(self, shared_table):
+        """Test that an unpickled table shares entries with the original."""
+        copy = pickle.loads(pickle.dumps(shared_table))
+        try:
+            assert copy.name == shared_table.name
+            copy.store(1, 3)
+            assert shared_table.get(1).score == 3
+        finally:
+            copy.close()
+
+    def test_shared_between_processes(self, shared_table):
+        """Test that worker processes see each other's entries."""
+        shared_table.store(1, 6)
+        with ProcessPoolExecutor(2) as pool:
+            seen = list(pool.map(_store_in_worker, [shared_table] * 2, [10, 11]))
+        assert seen == [(6, EXACT, 0)] * 2
+        assert shared_table.get(10) == (0.25, LOWER_BOUND, 4)
+        assert shared_table.get(11) == (0.25, LOWER_BOUND, 4)
+
+    def test_attach_checks_size(self, shared_table):
+        """Test that attaching with more slots than exist is rejected."""
+        with pytest.raises(ValueError):
+            SharedTranspositionTable(10_000, shared_table.name)
+        with pytest.raises(ValueError):
+            SharedTranspositionTable(0)
+
+    def test_players_share_results(self, shared_table):
+        """Test that a second player is served from the first one's search."""
+        board = Board()
+        board.make_move(1, 1, "X")
+        first = AIPlayer("hard", transposition_table=shared_table)
+        second = AIPlayer("hard", transposition_table=shared_table)
+        alone = AIPlayer("hard")
+
+        move = first.get_best_move(board)
+        assert second.get_best_move(board) == move == alone.get_best_move(board)
+        assert second.nodes_searched < first.nodes_searched
+
+    def test_board_variants_share_table(self, shared_table):
+        """Test that players of different variants can share one table."""
+        for win_length in (2, 3):
+            board = Board(3, win_length)
+            board.make_move(0, 0, "X")
+            ai = AIPlayer("hard", search="alphabeta", transposition_table=shared_table)
+            ai.get_best_move(board)
+        assert ai.get_best_move(board) == (1, 1)
+        assert ai.last_score == 0
+
+        large = AIPlayer("hard", search="iterative", node_limit=100)
+        large.get_best_move(Board(5, 4))
+        keys = {
+            shared_table._slot(large._table_key(Board(5, win_length), True))[0]
+            for win_length in (3, 4, 5)
+        }
+        assert len(keys) == 3
+
+
+class TestCanonicalKey:
+    """Test cases for symmetry canonicalization."""
+
+    def test_symmetric_positions_share_key(self):
+        """Test that all rotations and reflections map to one key."""
+        grid = [["X", "O", None], [None, "O", None], [None, None, "X"]]
+        keys = set()
+        for _ in range(4):
+            keys.add(canonical_key(grid, "O"))
+            keys.add(canonical_key([row[::-1] for row in grid], "O"))
+            grid = _rotate(grid)
+        assert len(keys) == 1
+
+    def test_distinct_positions_differ(self):
+        """Test that different positions and perspectives get different keys."""
+        corner = [["X", None, None], [None, None, None], [None, None, None]]
+        center = [[None, None, None], [None, "X", None], [None, None, None]]
+        assert canonical_key(corner, "O") != canonical_key(center, "O")
+        assert canonical_key(corner, "O") != canonical_key(corner, "X")
+
+    def test_board_variants_differ(self):
+        """Test that equal encodings on different variants get different keys."""
+        small = [[None] * 3 for _ in range(3)]
+        large = [[None] * 4 for _ in range(4)]
+        assert canonical_key(small, "O") != canonical_key(large, "O")
+        assert canonical_key(small, "O") != canonical_key(small, "O", 2)
+        assert canonical_key(small, "O") == canonical_key(small, "O", 3)
+        with pytest.raises(ValueError):
+            canonical_key(small, "O", 4)
+
+
+class TestAIWithTranspositionTable:
+    """Test cases for the hard AI backed by a transposition table."""
+
+    @pytest.mark.parametrize(
+        "moves",
+        [
+            [(0, 0, "X")],
+            [(1, 1, "X")],
+            [(0, 1, "X"), (1, 1, "O"), (2, 2, "X")],
+            [(0, 0, "X"), (0, 1, "X"), (1, 1, "O")],
+        ],
+    )
+    def test_same_moves_as_plain_minimax(self, moves):
+        """Test that caching does not change the chosen move."""
+        board = Board()
+        for row, col, player in moves:
+            board.make_move(row, col, player)
+
+        cached = AIPlayer("hard")
+        uncached = AIPlayer("hard", tt_size=0)
+        assert uncached.transposition_table is None
+        assert cached.get_best_move(board) == uncached.get_best_move(board)
+
+    def test_repeated_search_hits_cache(self):
+        """Test that searching the same position again is served from cache."""
+        ai = AIPlayer("hard")
+        board = Board()
+
+        first = ai.get_best_move(board)
+        misses = ai.transposition_table.misses
+        assert ai.get_best_move(board) == first
+        assert ai.transposition_table.misses == misses
+        assert ai.transposition_table.hits > 0
+
+    def test_small_table_still_correct(self):
+        """Test that heavy eviction does not affect move quality."""
+        board = Board()
+        board.make_move(0, 0, "X")
+        board.make_move(0, 1, "X")
+
+        ai = AIPlayer("hard", tt_size=8)
+        assert ai.get_best_move(board) == (0, 2)
+        assert len(ai.transposition_table) <= 8
+
+    @pytest.mark.parametrize("search", ["alphabeta", "iterative"])
+    def test_table_shared_across_variants(self, search):
+        """Test that positions of another board variant are never reused."""
+        ai = AIPlayer("hard", search=search)
+        for win_length in (2, 3):
+            board = Board(3, win_length)
+            board.make_move(0, 0)
+            ai.get_best_move(board)
+        assert ai.get_best_move(board) == (1, 1)
+        assert ai.last_score == 0
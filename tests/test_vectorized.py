@@ -0,0 +1,87 @@
+"""Unit tests for the NumPy-vectorized board batch."""
+
+import random
+
+import pytest
+
+from src.tictactoe.board import Board
+
+np = pytest.importorskip("numpy")
+
+from src.tictactoe.vectorized import EMPTY, BoardBatch, O, X  # noqa: E402
+
+SYMBOL_CODES = {None: EMPTY, "X": X, "O": O}
+
+
+def _random_boards(count, size=3, win_length=None, seed=0):
+    """Boards from random games stopped after a random number of moves."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = Board(size, win_length)
+        for _ in range(rng.randrange(size * size + 1)):
+            if board.is_game_over():
+                break
+            board.make_move(*rng.choice(board.get_empty_positions()))
+        boards.append(board)
+    return boards
+
+
+class TestBoardBatch:
+    """Test cases for the BoardBatch class."""
+
+    @pytest.mark.parametrize("size, win_length", [(3, 3), (4, 3), (5, 4)])
+    def test_matches_board_checks(self, size, win_length):
+        """Test that batch results equal the per-board methods."""
+        boards = _random_boards(500, size, win_length)
+        batch = BoardBatch.from_boards(boards)
+
+        winners = batch.winners()
+        full = batch.full_mask()
+        draws = batch.draw_mask()
+        over = batch.game_over_mask()
+        counts = batch.empty_counts()
+        for i, board in enumerate(boards):
+            assert winners[i] == SYMBOL_CODES[board.check_winner()]
+            assert full[i] == board.is_full()
+            assert draws[i] == (board.is_full() and board.check_winner() is None)
+            assert over[i] == board.is_game_over()
+            assert counts[i] == len(board.get_empty_positions())
+
+    def test_empty_mask(self):
+        """Test the per-cell empty mask."""
+        board = Board()
+        board.make_move(0, 0)
+        board.make_move(2, 1)
+        mask = BoardBatch.from_boards([board]).empty_mask()[0]
+        assert mask.shape == (3, 3)
+        assert not mask[0, 0] and not mask[2, 1]
+        assert mask.sum() == 7
+
+    def test_round_trip(self):
+        """Test converting boards to a batch and back."""
+        boards = _random_boards(20, 4, 3, seed=3)
+        restored = BoardBatch.from_boards(boards).to_boards()
+        assert [b.grid for b in restored] == [b.grid for b in boards]
+        assert [b.check_winner() for b in restored] == [
+            b.check_winner() for b in boards
+        ]
+
+    def test_raw_array(self):
+        """Test building a batch straight from an array."""
+        cells = np.zeros((2, 3, 3), dtype=np.int8)
+        cells[1, :, 1] = O
+        batch = BoardBatch(cells)
+        assert len(batch) == 2
+        assert batch.winners().tolist() == [EMPTY, O]
+
+    def test_invalid_input(self):
+        """Test that mismatched shapes and boards are rejected."""
+        with pytest.raises(ValueError):
+            BoardBatch(np.zeros((2, 3, 4)))
+        with pytest.raises(ValueError):
+            BoardBatch(np.zeros((2, 3, 3)), win_length=4)
+        with pytest.raises(ValueError):
+            BoardBatch.from_boards([])
+        with pytest.raises(ValueError):
+            BoardBatch.from_boards([Board(3), Board(4)])